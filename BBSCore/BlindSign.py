@@ -43,6 +43,14 @@ def affine_to_bytes(p: tuple) -> bytes:
         raise TypeError(f"Un tuple de point est attendu, mais a reçu {type(p)}")
     return G1_to_pubkey(normalize1(p))
 
+def random_scalars(count: int) -> List[int]:
+    """
+    Tire `count` scalaires aléatoires mod CURVE_ORDER en un seul appel système.
+    Chaque scalaire est réduit depuis 48 octets (384 bits) : biais négligeable.
+    """
+    buf = secrets.token_bytes(48 * count)
+    return [int.from_bytes(buf[i:i + 48], 'big') % CURVE_ORDER for i in range(0, 48 * count, 48)]
+
 @dataclass
 class BlindCommitment:
     """
@@ -159,7 +167,13 @@ class BlindSignerClient:
         if len(H_gens) < (1 + U):
             raise ValueError(f"Pas assez de générateurs H. Besoin {1+U}, dispo {len(H_gens)}")
 
-        r = blinding if blinding is not None else secrets.randbelow(CURVE_ORDER)
+        # Tout l'aléa du commitment et de la preuve est tiré d'un bloc :
+        # (1 + U) nonces Schnorr (pour r et chaque message), plus le blinding
+        # seulement s'il n'est pas fourni par l'appelant
+        if blinding is None:
+            r, *randomness = random_scalars(2 + U)
+        else:
+            r, randomness = blinding, random_scalars(1 + U)
         
         # H_gens[0] est H_1, H_gens[1] est H_2 etc.
         # C = r * H_1 + m1*H_2 + m2*H_3 ...
@@ -175,8 +189,7 @@ class BlindSignerClient:
         
         commit = BlindCommitment(C=C, blinding=r, hidden_count=U)
 
-        # Créer preuve Schnorr
-        randomness = [secrets.randbelow(CURVE_ORDER) for _ in range(1 + U)] # pour r et chaque message
+        # Créer preuve Schnorr (randomness : nonces pour r et chaque message)
         
         R_terms = []
         for i, t in enumerate(randomness):
@@ -4,11 +4,12 @@ Following IETF BBS Signatures specification (Core.tex)
 """
 
 import secrets
+from functools import lru_cache
 from typing import List, Tuple, Optional
 import hashlib
 
 from py_ecc.optimized_bls12_381 import (
-    G2, multiply, curve_order
+    G2, Z2, add, double, curve_order
 )
 
 def hash_to_int(msg: bytes, hash_function=hashlib.sha256) -> int:
@@ -16,12 +17,71 @@ def hash_to_int(msg: bytes, hash_function=hashlib.sha256) -> int:
     digest = hash_function(msg).digest()
     return int.from_bytes(digest, 'big') % curve_order
 
+# Fixed-base comb table for G2: _G2_TABLE[w][d] = d * 16^w * G2
+# Built on first use (~1000 G2 additions), then each SK * G2 costs at most
+# 64 additions instead of a full double-and-add over 255 bits
+_G2_WINDOW = 4
+_G2_TABLE = None
+
+def _build_comb_table(base, window: int = _G2_WINDOW, zero=Z2) -> List[list]:
+    """Precompute d * 2^(window*w) * base for every window w and digit d"""
+    table = []
+    digits = 1 << window
+    windows = (curve_order.bit_length() + window - 1) // window
+    for _ in range(windows):
+        row = [zero, base]
+        for _ in range(2, digits):
+            row.append(add(row[-1], base))
+        table.append(row)
+        for _ in range(window):
+            base = double(base)
+    return table
+
+def comb_mul(table: List[list], scalar: int, window: int = _G2_WINDOW, zero=Z2):
+    """Compute scalar * base from a table built by _build_comb_table"""
+    k = scalar % curve_order
+    mask = (1 << window) - 1
+    acc = zero
+    for row in table:
+        if not k:
+            break
+        digit = k & mask
+        if digit:
+            acc = add(acc, row[digit])
+        k >>= window
+    return acc
+
+def G2_fixed_mul(scalar: int):
+    """Compute scalar * G2 using the precomputed comb table"""
+    global _G2_TABLE
+    if _G2_TABLE is None:
+        _G2_TABLE = _build_comb_table(G2)
+    return comb_mul(_G2_TABLE, scalar)
+
 from BBSCore.Setup import (
     BBSPrivateKey, BBSPublicKey, BBSKeyPair, 
     CURVE_ORDER, DST_KEYGEN, SCALAR_SIZE, G2_COMPRESSED_SIZE,
     hash_to_scalar
 )
 
+def _derive_key(ikm: bytes, key_info: bytes) -> Tuple[int, tuple]:
+    """Derive (SK, W = SK * G2) from input keying material"""
+    # Derive secret key using hash_to_scalar per Core.tex
+    salt = DST_KEYGEN + key_info
+    sk_data = ikm + salt
+    sk_val = hash_to_scalar(sk_data, DST_KEYGEN)
+    
+    # Ensure key is in valid range [1, r-1]
+    if sk_val == 0:
+        sk_val = 1
+    
+    # Core.tex: Compute public key W = sk * G2
+    return sk_val, G2_fixed_mul(sk_val)
+
+# Same ikm => same key: memoize the deterministic path only. The cache holds
+# the raw (int, point) pair so every caller still gets fresh key objects
+_derive_key_cached = lru_cache(maxsize=16)(_derive_key)
+
 class BBSKeyGen:
     """
     BBS Key Generation implementing Core.tex KeyGen operation
@@ -45,21 +105,13 @@ class BBSKeyGen:
             BBSKeyPair with py_ecc points
         """
         if ikm is None:
-            ikm = secrets.token_bytes(32)
-        
-        # Derive secret key using hash_to_scalar per Core.tex
-        salt = DST_KEYGEN + key_info
-        sk_data = ikm + salt
-        sk_val = hash_to_scalar(sk_data, DST_KEYGEN)
-        
-        # Ensure key is in valid range [1, r-1]
-        if sk_val == 0:
-            sk_val = 1
+            # Random key: never cached
+            sk_val, W = _derive_key(secrets.token_bytes(32), key_info)
+        else:
+            # Deterministic key: pure function of (ikm, key_info)
+            sk_val, W = _derive_key_cached(bytes(ikm), bytes(key_info))
         
         sk = BBSPrivateKey(x=sk_val)
-        
-        # Core.tex: Compute public key W = sk * G2
-        W = multiply(G2, sk.x)
         pk = BBSPublicKey(W=W)
         
         return BBSKeyPair(secret_key=sk, public_key=pk)
@@ -70,7 +122,7 @@ class BBSKeyGen:
         Convert secret key to public key per Core.tex
         PK = SK * G2
         """
-        W = multiply(G2, sk.x)
+        W = G2_fixed_mul(sk.x)
         return BBSPublicKey(W=W)
     
     @staticmethod
@@ -76,6 +76,17 @@ def hash_to_scalar(data: bytes, dst: bytes) -> int:
     scalar = int.from_bytes(hash_bytes, 'big') % CURVE_ORDER
     return scalar
 
+def messages_to_scalars(messages: List[bytes], dst: bytes) -> List[int]:
+    """
+    Hash a list of messages to scalars with the same DST
+    Equivalent to [hash_to_scalar(m, dst) for m in messages], with the
+    hash constructor and curve order bound once for the whole list
+    """
+    sha256 = hashlib.sha256
+    from_bytes = int.from_bytes
+    order = CURVE_ORDER
+    return [from_bytes(sha256(m + dst).digest(), 'big') % order for m in messages]
+
 def point_to_bytes_g1(P: tuple) -> bytes:
     """Serialize G1 point to 48 bytes per Core.tex"""
     return G1_to_pubkey(normalize1(P))
@@ -187,12 +198,24 @@ class BBSKeyPair:
     secret_key: BBSPrivateKey
     public_key: BBSPublicKey
 
+# Precomputed generator tables per api_id: [Q_1, H_1, ..., H_n]
+# Generators for a smaller count are a prefix of the table
+_PRECOMPUTED: dict = {}
+
 class BBSGenerators:
     """
     Generator creation following Core.tex Section 4.1.1
     Creates Q_1 (domain generator) and H_1, ..., H_L (message generators)
     """
     
+    @staticmethod
+    def register_precomputed(encoded_generators, api_id: bytes = b"") -> None:
+        """
+        Register serialized generators (Q_1, H_1, ..., H_n as 48-byte G1 points)
+        so that create_generators can skip hash-to-curve for this api_id
+        """
+        _PRECOMPUTED[api_id] = [point_from_bytes_g1(data) for data in encoded_generators]
+    
     @staticmethod
     def hash_to_g1(data: bytes, dst: bytes) -> G1Point:
         """
@@ -211,6 +234,10 @@ class BBSGenerators:
         Create L+1 generators: Q_1, H_1, ..., H_L
         Per Core.tex Section 4.1.1.1 generator creation requirements
         """
+        precomputed = _PRECOMPUTED.get(api_id)
+        if precomputed is not None and count < len(precomputed):
+            return precomputed[:count + 1]
+
         generators = []
 
         # Generate Q_1 (domain generator) per Core.tex
@@ -232,6 +259,34 @@ class BBSGenerators:
 
         return generators
 
+class DomainContext:
+    """
+    calculate_domain inputs that do not depend on the header
+    
+    The hash of PK || Q_1 || H_1 || ... || H_L is computed once; with_header
+    only copies that hasher state and absorbs header, api_id and the DST.
+    """
+    
+    def __init__(self, PK: bytes, Q_1: tuple, H_generators: list, api_id: bytes):
+        self.api_id = api_id
+        self._dst = api_id + b"H2S_"
+        self._prefix = hashlib.sha256()
+        self._prefix.update(PK)  # Public key bytes
+        self._prefix.update(point_to_bytes_g1(Q_1))
+        for H in H_generators:
+            self._prefix.update(point_to_bytes_g1(H))
+    
+    def with_header(self, header: bytes) -> int:
+        """Domain scalar for this header"""
+        hasher = self._prefix.copy()
+        hasher.update(len(header).to_bytes(8, 'big'))
+        hasher.update(header)
+        hasher.update(self.api_id)
+
+        # Hash to scalar
+        hasher.update(self._dst)
+        return int.from_bytes(hasher.digest(), 'big') % CURVE_ORDER
+
 def calculate_domain(
     PK: bytes,
     Q_1: tuple,
@@ -243,17 +298,7 @@ def calculate_domain(
     Calculate domain value per Core.tex calculate_domain operation
     Used in CoreSign, CoreVerify, CoreProofGen, and CoreProofVerify
     """
-    data = b""
-    data += PK  # Public key bytes
-    data += point_to_bytes_g1(Q_1)
-    for H in H_generators:
-        data += point_to_bytes_g1(H)
-    data += len(header).to_bytes(8, 'big') + header
-    data += api_id
-
-    # Hash to scalar
-    dst = api_id + b"H2S_"
-    return hash_to_scalar(data, dst)
+    return DomainContext(PK, Q_1, H_generators, api_id).with_header(header)
 
 class BBSSystemSetup:
     """
@@ -5,6 +5,7 @@ Following IETF BBS Signatures specification
 
 import secrets
 import hashlib
+from functools import lru_cache
 from typing import List, Tuple, Optional, Dict
 from dataclasses import dataclass
 
@@ -18,13 +19,26 @@ from py_ecc.optimized_bls12_381.optimized_pairing import normalize1
 
 from BBSCore.Setup import (
     BBSPrivateKey, BBSPublicKey, BBSGenerators,
-    CURVE_ORDER, hash_to_scalar, calculate_domain,
+    CURVE_ORDER, hash_to_scalar, messages_to_scalars, calculate_domain,
     point_to_bytes_g1, point_from_bytes_g1
 )
-from BBSCore.bbsSign import BBSSignature
+from BBSCore.bbsSign import BBSSignature, GeneratorTablesMixin, verify_batch_pairings
 
 DST_H2S = b"BBS_BLS12381G1_XMD:SHA-256_SSWU_RO_H2S_DST_"
 
+
+@lru_cache(maxsize=256)
+def _index_partition(L: int, disclosed_indexes: Tuple[int, ...]) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+    (sorted disclosed, undisclosed) message indexes for an (L, R) proof shape
+    
+    Memoized per shape: benchmark sweeps and repeated presentations reuse the
+    same few disclosure patterns, so the partition is built once per pattern.
+    """
+    disclosed_sorted = tuple(sorted(disclosed_indexes))
+    disclosed_set = set(disclosed_sorted)
+    return disclosed_sorted, tuple(i for i in range(L) if i not in disclosed_set)
+
 def affine_to_bytes(point) -> bytes:
     """Convert point to bytes (48 bytes for G1)"""
     if point is None:
@@ -66,6 +80,29 @@ class BBSProof:
         self.commitments = commitments or []
         self.cp = cp
     
+    def __setattr__(self, name, value):
+        # Any field reassignment invalidates the memoized serialization
+        self.__dict__.pop('_canonical', None)
+        super().__setattr__(name, value)
+    
+    @property
+    def canonical_bytes(self) -> bytes:
+        """
+        to_bytes(), memoized on the proof
+        
+        Point compression (a field inversion per point) dominates
+        serialization, so repeated cache-key computations for the same
+        proof reuse the first result. The memo is dropped when a field is
+        reassigned, and the commitments are compared on each access so that
+        in-place edits of the list are picked up as well.
+        """
+        cached = self.__dict__.get('_canonical')
+        commitments = tuple(self.commitments)
+        if cached is None or cached[0] != commitments:
+            cached = (commitments, self.to_bytes())
+            self.__dict__['_canonical'] = cached
+        return cached[1]
+    
     def to_bytes(self) -> bytes:
         """Serialize proof to bytes"""
         data = b""
@@ -108,7 +145,7 @@ class BBSProof:
         return cls(Abar=Abar, Bbar=Bbar, D=D, e_hat=e_hat, 
                   r1_hat=r1_hat, r3_hat=r3_hat, commitments=commitments, cp=cp)
 
-class BBSProofScheme:
+class BBSProofScheme(GeneratorTablesMixin):
     """Zero-Knowledge Proof operations implementing Core.tex Section 3.6.3-3.6.4"""
 
     def __init__(self, max_messages: int = 20, api_id: bytes = b"", generators: Optional[List[tuple]] = None):
@@ -123,6 +160,10 @@ class BBSProofScheme:
         self.P1 = G1
         self.P2 = G2
     
+    def message_scalars(self, messages: List[bytes]) -> List[int]:
+        """Messages hashed to scalars with this scheme's DST (reusable across verifications)"""
+        return messages_to_scalars(messages, self.api_id + DST_H2S)
+    
     def calculate_random_scalars(self, count: int) -> List[int]:
         """Generate random scalars for proof"""
         return [secrets.randbelow(CURVE_ORDER - 1) + 1 for _ in range(count)]
@@ -133,7 +174,8 @@ class BBSProofScheme:
                    random_scalars: List[int],
                    header: bytes,
                    messages: List[bytes],
-                   undisclosed_indexes: List[int]) -> ProofInitResult:
+                   undisclosed_indexes: List[int],
+                   msg_scalars: Optional[List[int]] = None) -> ProofInitResult:
         """
         ProofInit operation from Core.tex Section 3.7.1
         
@@ -160,16 +202,17 @@ class BBSProofScheme:
         H_generators = self.generators[1:L+1]
         
         # Convert messages to scalars
-        msg_scalars = [hash_to_scalar(msg, self.api_id + DST_H2S) for msg in messages]
+        if msg_scalars is None:
+            msg_scalars = self.message_scalars(messages)
         
         # Calculate domain
         domain = calculate_domain(PK.to_bytes(), Q_1, H_generators, header, self.api_id)
         
         # Core.tex Step 2: B = P1 + Q_1 * domain + H_1 * msg_1 + ... + H_L * msg_L
         B = self.P1
-        B = add(B, multiply(Q_1, domain))
+        B = add(B, self._mul_generator(0, domain))
         for i, msg_scalar in enumerate(msg_scalars):
-            B = add(B, multiply(H_generators[i], msg_scalar))
+            B = add(B, self._mul_generator(i + 1, msg_scalar))
         
         # Core.tex Step 3: D = B * r2
         D = multiply(B, r2)
@@ -192,7 +235,7 @@ class BBSProofScheme:
         undisclosed_indexes_sorted = sorted(undisclosed_indexes)
         for i, j in enumerate(undisclosed_indexes_sorted):
             if i < len(m_tildes):
-                T2 = add(T2, multiply(H_generators[j], m_tildes[i]))
+                T2 = add(T2, self._mul_generator(j + 1, m_tildes[i]))
         
         return ProofInitResult(T1=T1, T2=T2, Abar=Abar, Bbar=Bbar, D=D, domain=domain)
     
@@ -201,7 +244,8 @@ class BBSProofScheme:
                       challenge: int,
                       e: int,
                       random_scalars: List[int],
-                      undisclosed_messages: List[bytes]) -> BBSProof:
+                      undisclosed_messages: List[bytes],
+                      undisclosed_scalars: Optional[List[int]] = None) -> BBSProof:
         """
         ProofFinalize operation from Core.tex Section 3.7.2
         
@@ -221,7 +265,8 @@ class BBSProofScheme:
         m_tildes = random_scalars[5:]
         
         # Convert undisclosed messages to scalars
-        undisclosed_scalars = [hash_to_scalar(msg, self.api_id + DST_H2S) for msg in undisclosed_messages]
+        if undisclosed_scalars is None:
+            undisclosed_scalars = self.message_scalars(undisclosed_messages)
         
         # Core.tex Step 1: r3 = r2^-1 (mod r)
         r3 = pow(r2, -1, CURVE_ORDER)
@@ -253,10 +298,14 @@ class BBSProofScheme:
                          proof: BBSProof,
                          header: bytes,
                          disclosed_messages: List[bytes],
-                         disclosed_indexes: List[int]) -> ProofInitResult:
+                         disclosed_indexes: List[int],
+                         disclosed_scalars: Optional[List[int]] = None) -> ProofInitResult:
         """
         ProofVerifyInit operation from Core.tex Section 3.7.3
         
+        disclosed_scalars, when given, are the disclosed messages already
+        hashed with message_scalars and skip the hashing step.
+        
         Procedure :
         1. Parse proof components
         2. T1 = Bbar * c + Abar * e^ + D * r1^
@@ -282,25 +331,25 @@ class BBSProofScheme:
         
         # Core.tex Step 3: Bv = P1 + Q_1 * domain + H_i1 * msg_i1 + ... + H_iR * msg_iR
         Bv = self.P1
-        Bv = add(Bv, multiply(Q_1, domain))
+        Bv = add(Bv, self._mul_generator(0, domain))
         
         # Convert disclosed messages to scalars and add to Bv
-        disclosed_scalars = [hash_to_scalar(msg, self.api_id + DST_H2S) for msg in disclosed_messages]
+        if disclosed_scalars is None:
+            disclosed_scalars = self.message_scalars(disclosed_messages)
         for i, idx in enumerate(disclosed_indexes):
             if i < len(disclosed_scalars):
-                Bv = add(Bv, multiply(H_generators[idx], disclosed_scalars[i]))
+                Bv = add(Bv, self._mul_generator(idx + 1, disclosed_scalars[i]))
         
         # Core.tex Step 4: T2 = Bv * c + D * r3^ + H_j1 * m^_j1 + ... + H_jU * m^_jU
         T2 = multiply(Bv, proof.cp)                  # Bv * challenge
         T2 = add(T2, multiply(proof.D, proof.r3_hat))    # + D * r3^
         
         # Add undisclosed commitments
-        disclosed_indexes_sorted = sorted(disclosed_indexes)
-        undisclosed_indexes = sorted([i for i in range(L) if i not in disclosed_indexes_sorted])
+        _, undisclosed_indexes = _index_partition(L, tuple(disclosed_indexes))
         
         for i, j in enumerate(undisclosed_indexes):
             if i < len(proof.commitments):
-                T2 = add(T2, multiply(H_generators[j], proof.commitments[i]))
+                T2 = add(T2, self._mul_generator(j + 1, proof.commitments[i]))
         
         return ProofInitResult(
             T1=T1, T2=T2,
@@ -312,14 +361,18 @@ class BBSProofScheme:
                                  init_res: ProofInitResult,
                                  disclosed_messages: List[bytes],
                                  disclosed_indexes: List[int],
-                                 ph: bytes) -> int:
+                                 ph: bytes,
+                                 disclosed_scalars: Optional[List[int]] = None) -> int:
         """
         ProofChallengeCalculate operation from Core.tex Section 3.7.4
         
         Challenge calculation with canonical ordering for disclosed messages
         """
+        if disclosed_scalars is None:
+            disclosed_scalars = self.message_scalars(disclosed_messages)
+        
         # Create pairs and sort by index for canonical order
-        pairs = list(zip(disclosed_indexes, disclosed_messages))
+        pairs = list(zip(disclosed_indexes, disclosed_scalars))
         pairs.sort(key=lambda x: x[0])
         
         challenge_data = b""
@@ -336,9 +389,8 @@ class BBSProofScheme:
         
         # Add disclosed messages in sorted order
         challenge_data += len(pairs).to_bytes(4, 'big')
-        for idx, msg in pairs:
+        for idx, msg_scalar in pairs:
             challenge_data += idx.to_bytes(4, 'big')
-            msg_scalar = hash_to_scalar(msg, self.api_id + DST_H2S)
             challenge_data += msg_scalar.to_bytes(32, 'big')
         
         # Add presentation header and API ID
@@ -355,16 +407,22 @@ class BBSProofScheme:
                       header: bytes,
                       ph: bytes,
                       messages: List[bytes],
-                      disclosed_indexes: List[int]) -> BBSProof:
+                      disclosed_indexes: List[int],
+                      msg_scalars: Optional[List[int]] = None) -> BBSProof:
         """
         CoreProofGen operation from Core.tex Section 3.6.3
         
+        msg_scalars, when given, are the messages already hashed with
+        message_scalars; otherwise each message is hashed once here.
+        
         Procedure :
         1. Generate random scalars (5 + U scalars needed)
         2. Initialize proof using ProofInit
         3. Calculate challenge using ProofChallengeCalculate
         4. Finalize proof using ProofFinalize
         """
+        # Any sequence of ints (list, range, numpy array) -> Python ints
+        disclosed_indexes = [int(i) for i in disclosed_indexes]
         L = len(messages)
         R = len(disclosed_indexes)
         
@@ -378,13 +436,13 @@ class BBSProofScheme:
         
         U = L - R  # Number of undisclosed messages
         
-        # Sort disclosed indexes for consistency
-        disclosed_indexes_sorted = sorted(disclosed_indexes)
-        
-        # Determine undisclosed indexes
-        undisclosed_indexes = sorted([i for i in range(L) if i not in disclosed_indexes_sorted])
+        # Sort disclosed indexes and determine undisclosed ones (increasing
+        # order), memoized per (L, disclosed) shape
+        disclosed_indexes_sorted, undisclosed_indexes = _index_partition(L, tuple(disclosed_indexes))
         
-        # Split messages
+        # Split messages (hashed once for init, challenge and finalize)
+        if msg_scalars is None:
+            msg_scalars = self.message_scalars(messages)
         disclosed_messages = [messages[i] for i in disclosed_indexes_sorted]
         undisclosed_messages = [messages[i] for i in undisclosed_indexes]
         
@@ -394,30 +452,47 @@ class BBSProofScheme:
         # Core.tex Step 2: Initialize proof
         init_res = self.proof_init(
             PK, signature, random_scalars,
-            header, messages, undisclosed_indexes
+            header, messages, undisclosed_indexes, msg_scalars
         )
         
         # Core.tex Step 3: Calculate challenge
         challenge = self.proof_challenge_calculate(
             init_res, disclosed_messages,
-            disclosed_indexes_sorted, ph
+            disclosed_indexes_sorted, ph,
+            [msg_scalars[i] for i in disclosed_indexes_sorted]
         )
         
         # Core.tex Step 4: Finalize proof
         proof = self.proof_finalize(
             init_res, challenge, signature.e,
-            random_scalars, undisclosed_messages
+            random_scalars, undisclosed_messages,
+            [msg_scalars[i] for i in undisclosed_indexes]
         )
         
         return proof
     
+    def _valid_verify_shape(self, proof: BBSProof, disclosed_messages: List[bytes],
+                            disclosed_indexes: List[int]) -> bool:
+        """
+        ProofVerify preconditions on (proof, disclosed) shapes
+        
+        L = U + R must fit the generators, and the disclosed indexes must be
+        distinct, in [0, L) and match the disclosed messages one to one.
+        """
+        L = len(proof.commitments) + len(disclosed_indexes)
+        return not (L > len(self.generators) - 1
+                    or len(disclosed_messages) != len(disclosed_indexes)
+                    or len(set(disclosed_indexes)) != len(disclosed_indexes)
+                    or any(i < 0 or i >= L for i in disclosed_indexes))
+    
     def core_proof_verify(self,
                          PK: BBSPublicKey,
                          proof: BBSProof,
                          header: bytes,
                          ph: bytes,
                          disclosed_messages: List[bytes],
-                         disclosed_indexes: List[int]) -> bool:
+                         disclosed_indexes: List[int],
+                         disclosed_scalars: Optional[List[int]] = None) -> bool:
         """
         CoreProofVerify operation from Core.tex Section 3.6.4
         
@@ -427,30 +502,118 @@ class BBSProofScheme:
         3. Verify challenge matches
         4. Verify pairing equation: h(Abar, W) * h(Bbar, -BP2) == Identity_GT
         """
+        # Any sequence of ints (list, range, numpy array) -> Python ints
+        disclosed_indexes = [int(i) for i in disclosed_indexes]
+        
+        # Reject shapes the generators cannot cover (ProofVerify preconditions)
+        if not self._valid_verify_shape(proof, disclosed_messages, disclosed_indexes):
+            return False
+        
+        # Disclosed messages are hashed once for both steps
+        if disclosed_scalars is None:
+            disclosed_scalars = self.message_scalars(disclosed_messages)
+        
         # Core.tex Step 1: Initialize verification
         init_res = self.proof_verify_init(
             PK, proof, header,
-            disclosed_messages, disclosed_indexes
+            disclosed_messages, disclosed_indexes, disclosed_scalars
         )
         
         # Core.tex Step 2: Recalculate challenge
         challenge = self.proof_challenge_calculate(
             init_res, disclosed_messages,
-            disclosed_indexes, ph
+            disclosed_indexes, ph, disclosed_scalars
         )
         
         # Core.tex Step 3: Verify challenge matches
         if proof.cp != challenge:
             return False
         
-        # Core.tex Step 4: Verify pairing equation
-        pairing_1 = pairing(PK.W, proof.Abar)
-        neg_P2 = neg(self.P2)
-        pairing_2 = pairing(neg_P2, proof.Bbar)
-        product = pairing_1 * pairing_2
-        final = final_exponentiate(product)
+        # Core.tex Step 4: Verify pairing equation (one final exponentiation)
+        return verify_batch_pairings([(PK.W, proof.Abar), (neg(self.P2), proof.Bbar)])
+
+    def batch_pairing_terms(self,
+                            items: List[Tuple[BBSPublicKey, BBSProof, bytes, bytes, List[bytes], List[int]]]
+                            ) -> Optional[List[Tuple[tuple, tuple]]]:
+        """
+        Randomized pairing inputs for a batch of (PK, proof, header, ph,
+        disclosed_messages, disclosed_indexes) items
+        
+        Challenges are recomputed one by one (no pairing involved); returns
+        None as soon as an item has an invalid shape (same preconditions as
+        core_proof_verify) or its challenge does not match. Otherwise each check
+        h(Abar_i, W_i) * h(Bbar_i, -BP2) == Identity_GT is weighted by a random
+        scalar r_i and the checks are collapsed into (G2, G1) pairs:
+        [(W, sum(r_i*Abar_i)) per public key] + [(-BP2, sum(r_i*Bbar_i))]
+        
+        Pairs from several schemes (issuers) can be concatenated and checked
+        with a single verify_batch_pairings call.
+        """
+        abar_sums: Dict[int, list] = {}
+        Bbar_sum = Z1
+        for PK, proof, header, ph, disclosed_messages, disclosed_indexes in items:
+            disclosed_indexes = [int(i) for i in disclosed_indexes]
+            if not self._valid_verify_shape(proof, disclosed_messages, disclosed_indexes):
+                return None
+            disclosed_scalars = self.message_scalars(disclosed_messages)
+            init_res = self.proof_verify_init(
+                PK, proof, header,
+                disclosed_messages, disclosed_indexes, disclosed_scalars
+            )
+            challenge = self.proof_challenge_calculate(
+                init_res, disclosed_messages,
+                disclosed_indexes, ph, disclosed_scalars
+            )
+            if proof.cp != challenge:
+                return None
+            
+            r = secrets.randbelow(CURVE_ORDER - 1) + 1
+            entry = abar_sums.setdefault(id(PK), [PK.W, Z1])
+            entry[1] = add(entry[1], multiply(proof.Abar, r))
+            Bbar_sum = add(Bbar_sum, multiply(proof.Bbar, r))
+        
+        pairs = [(W, Abar_sum) for W, Abar_sum in abar_sums.values()]
+        pairs.append((neg(self.P2), Bbar_sum))
+        return pairs
+    
+    def batch_proof_verify(self,
+                           items: List[Tuple[BBSPublicKey, BBSProof, bytes, bytes, List[bytes], List[int]]]) -> bool:
+        """
+        Randomized batch CoreProofVerify (see batch_pairing_terms)
         
-        return final == FQ12.one()
+        Proofs for the same public key share one Miller loop, and only one
+        final exponentiation is performed for the whole batch.
+        Returns True only if every proof is valid (except with probability 1/r).
+        """
+        if not items:
+            return True
+        
+        pairs = self.batch_pairing_terms(items)
+        if pairs is None:
+            return False
+        return verify_batch_pairings(pairs)
+    
+    def proof_gen(self, pk: BBSPublicKey, signature: BBSSignature, header: bytes,
+                  messages: List[bytes], disclosed_indexes: List[int], ph: bytes = b"",
+                  msg_scalars: Optional[List[int]] = None) -> BBSProof:
+        """Generate proof using CoreProofGen (msg_scalars: see message_scalars)"""
+        return self.core_proof_gen(pk, signature, header, ph, messages, disclosed_indexes, msg_scalars)
+    
+    def proof_verify(self, pk: BBSPublicKey, proof: BBSProof, header: bytes,
+                     disclosed_messages: List[bytes], disclosed_indexes: List[int], ph: bytes = b"",
+                     disclosed_scalars: Optional[List[int]] = None) -> bool:
+        """Verify proof using CoreProofVerify (disclosed_scalars: see message_scalars)"""
+        return self.core_proof_verify(pk, proof, header, ph, disclosed_messages, disclosed_indexes,
+                                      disclosed_scalars)
+    
+    def proof_verify_batch(self, pk: BBSPublicKey,
+                           items: List[Tuple[BBSProof, bytes, List[bytes], List[int]]],
+                           ph: bytes = b"") -> bool:
+        """Verify (proof, header, disclosed_messages, disclosed_indexes) items under one key in a single batch"""
+        return self.batch_proof_verify([
+            (pk, proof, header, ph, disclosed_messages, disclosed_indexes)
+            for proof, header, disclosed_messages, disclosed_indexes in items
+        ])
 
 class BBSWithProofs:
     """
@@ -480,6 +643,12 @@ class BBSWithProofs:
             generators=self.generators
         )
     
+    def precompute_generator_tables(self, window_bits: int = 4) -> None:
+        """Build the generator comb tables once and share them between signing and proofs"""
+        self.proof_scheme.precompute_generator_tables(window_bits)
+        self.sign_scheme.table_window = window_bits
+        self.sign_scheme.generator_tables = self.proof_scheme.generator_tables
+    
     def sign(self, sk: BBSPrivateKey, messages: List[bytes], 
             header: bytes = b"") -> BBSSignature:
         """Sign messages using CoreSign"""
@@ -508,4 +677,9 @@ class BBSWithProofs:
         return self.proof_scheme.core_proof_verify(
             pk, proof, header, presentation_header,
             disclosed_messages, disclosed_indexes
-        )
\ No newline at end of file
+        )
+    
+    def batch_verify_proofs(self,
+                            items: List[Tuple[BBSPublicKey, BBSProof, bytes, bytes, List[bytes], List[int]]]) -> bool:
+        """Verify several proofs at once using randomized batch CoreProofVerify"""
+        return self.proof_scheme.batch_proof_verify(items)
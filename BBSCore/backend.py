@@ -0,0 +1,57 @@
+"""
+backend.py - Pairing backend selection for BLS12-381
+
+The pairing-product check behind every signature and proof verification is
+the dominant cost of the scheme. When the blst Python bindings are installed
+it runs natively (Miller loops and final exponentiation in C); otherwise it
+stays on py_ecc. Points remain py_ecc tuples everywhere else and are only
+serialized at the blst boundary.
+
+Set BBS_BACKEND=py_ecc to force the pure Python path (e.g. for comparisons).
+"""
+
+import os
+from typing import List, Tuple
+
+from py_ecc.optimized_bls12_381 import pairing, final_exponentiate, FQ12
+
+from BBSCore.Setup import point_to_bytes_g1, point_to_bytes_g2
+
+try:
+    import blst
+    BLST_AVAILABLE = True
+except ImportError:
+    BLST_AVAILABLE = False
+
+USE_BLST = BLST_AVAILABLE and os.environ.get("BBS_BACKEND", "").lower() != "py_ecc"
+
+
+def pairing_product_is_one_py_ecc(pairs: List[Tuple[tuple, tuple]]) -> bool:
+    """prod h(P_i, Q_i) == Identity_GT with py_ecc, one final exponentiation"""
+    acc = FQ12.one()
+    for Q, P in pairs:
+        acc *= pairing(Q, P, final_exponentiate=False)
+    return final_exponentiate(acc) == FQ12.one()
+
+
+def pairing_product_is_one_blst(pairs: List[Tuple[tuple, tuple]]) -> bool:
+    """prod h(P_i, Q_i) == Identity_GT with blst, one final exponentiation"""
+    acc = None
+    for Q, P in pairs:
+        q = blst.P2_Affine(point_to_bytes_g2(Q))
+        p = blst.P1_Affine(point_to_bytes_g1(P))
+        term = blst.PT(q, p)  # Miller loop only
+        if acc is None:
+            acc = term
+        else:
+            acc.mul(term)
+    if acc is None:
+        return True
+    return acc.final_exp().is_one()
+
+
+def pairing_product_is_one(pairs: List[Tuple[tuple, tuple]]) -> bool:
+    """Check prod h(P_i, Q_i) == Identity_GT for (Q_i in G2, P_i in G1) pairs"""
+    if USE_BLST:
+        return pairing_product_is_one_blst(pairs)
+    return pairing_product_is_one_py_ecc(pairs)
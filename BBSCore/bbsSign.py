@@ -10,7 +10,7 @@ from dataclasses import dataclass
 
 from py_ecc.optimized_bls12_381 import (
     G1, G2, multiply, add, neg, pairing, final_exponentiate, 
-    FQ12, curve_order, normalize
+    FQ12, Z1, curve_order, normalize
 )
 
 from py_ecc.bls.g2_primitives import G1_to_pubkey, pubkey_to_G1
@@ -18,15 +18,26 @@ from py_ecc.optimized_bls12_381.optimized_pairing import normalize1
 
 from BBSCore.Setup import (
     BBSPrivateKey, BBSPublicKey, BBSGenerators,
-    CURVE_ORDER, hash_to_scalar, calculate_domain,
+    CURVE_ORDER, hash_to_scalar, messages_to_scalars, calculate_domain,
     point_to_bytes_g1, point_from_bytes_g1
 )
-from BBSCore.KeyGen import BBSKeyGen
+from BBSCore.KeyGen import BBSKeyGen, _build_comb_table, comb_mul
+from BBSCore import backend
 from BBSCore.utils import points_equal
 
 SIGNATURE_SIZE = 80  # A (48) + e (32) - per Core.tex specification
 DST_H2S = b"BBS_BLS12381G1_XMD:SHA-256_SSWU_RO_H2S_DST_"
 
+def verify_batch_pairings(pairs: List[Tuple[tuple, tuple]]) -> bool:
+    """
+    Check prod h(P_i, Q_i) == Identity_GT for (Q_i in G2, P_i in G1) pairs
+    
+    The Miller loops are accumulated without final exponentiation, and a
+    single final exponentiation is applied to the product, instead of one
+    per pairing. Runs on blst when available (see BBSCore.backend).
+    """
+    return backend.pairing_product_is_one(pairs)
+
 @dataclass
 class BBSSignature:
     """BBS Signature following Core.tex: (A, e)"""
@@ -53,7 +64,36 @@ class BBSSignature:
             return NotImplemented
         return points_equal(self.A, other.A) and self.e == other.e
 
-class BBSSignatureScheme:
+class GeneratorTablesMixin:
+    """
+    Optional fixed-base comb tables for self.generators (Q_1, H_1, ..., H_L)
+    
+    Shared by the signature and proof schemes: each H_i * msg_i in B, and
+    each generator term in proof verification, becomes at most
+    ~256/window_bits table additions once the tables are built.
+    """
+    
+    generator_tables: Optional[List[List[list]]] = None
+    table_window: int = 4
+    
+    def precompute_generator_tables(self, window_bits: int = 4) -> None:
+        """
+        Build comb tables d * 2^(window*w) * G for Q_1 and every H_i
+        
+        Costs about 1000 G1 additions per generator, once.
+        """
+        self.table_window = window_bits
+        self.generator_tables = [
+            _build_comb_table(gen, window_bits, Z1) for gen in self.generators
+        ]
+    
+    def _mul_generator(self, index: int, scalar: int) -> tuple:
+        """generators[index] * scalar, through the comb table when available"""
+        if self.generator_tables is None:
+            return multiply(self.generators[index], scalar)
+        return comb_mul(self.generator_tables[index], scalar, self.table_window, Z1)
+
+class BBSSignatureScheme(GeneratorTablesMixin):
     """
     BBS Signature Scheme implementing Core.tex operations:
     - CoreSign (Section 3.6.1)
@@ -72,7 +112,12 @@ class BBSSignatureScheme:
         self.P1 = G1
         self.P2 = G2
     
-    def core_sign(self, SK: BBSPrivateKey, header: bytes, messages: List[bytes]) -> BBSSignature:
+    def message_scalars(self, messages: List[bytes]) -> List[int]:
+        """Messages hashed to scalars with this scheme's DST (reusable across sign/verify)"""
+        return messages_to_scalars(messages, self.api_id + DST_H2S)
+    
+    def core_sign(self, SK: BBSPrivateKey, header: bytes, messages: List[bytes],
+                  msg_scalars: Optional[List[int]] = None) -> BBSSignature:
         """
         CoreSign operation from Core.tex Section 3.6.1
         
@@ -96,7 +141,8 @@ class BBSSignatureScheme:
         domain = calculate_domain(pk.to_bytes(), Q_1, H_generators, header, self.api_id)
         
         # Convert messages to scalars
-        msg_scalars = [hash_to_scalar(m, self.api_id + DST_H2S) for m in messages]
+        if msg_scalars is None:
+            msg_scalars = self.message_scalars(messages)
         
         # Core.tex Step 2: Calculate e = H(SK || msg_1 || ... || msg_L || domain)
         e_data = SK.x.to_bytes(32, 'big')
@@ -109,10 +155,10 @@ class BBSSignatureScheme:
         # Core.tex Step 3: Calculate B = P1 + Q_1 * domain + sum(H_i * msg_i)
         B = self.P1
         if domain != 0:
-            B = add(B, multiply(Q_1, domain))
+            B = add(B, self._mul_generator(0, domain))
         for i, msg_scalar in enumerate(msg_scalars):
             if msg_scalar != 0:
-                B = add(B, multiply(H_generators[i], msg_scalar))
+                B = add(B, self._mul_generator(i + 1, msg_scalar))
         
         # Core.tex Step 4: Calculate A = B * (1/(SK + e))
         sk_plus_e = (SK.x + e) % CURVE_ORDER
@@ -126,7 +172,8 @@ class BBSSignatureScheme:
         return BBSSignature(A=A, e=e)
     
     def core_verify(self, PK: BBSPublicKey, signature: BBSSignature, 
-                   header: bytes, messages: List[bytes]) -> bool:
+                   header: bytes, messages: List[bytes],
+                   msg_scalars: Optional[List[int]] = None) -> bool:
         """
         CoreVerify operation from Core.tex Section 3.6.2
         
@@ -142,6 +189,22 @@ class BBSSignatureScheme:
         if L > self.max_messages:
             return False
         
+        # Core.tex Steps 1-2: domain and B = P1 + Q_1 * domain + sum(H_i * msg_i)
+        B = self._compute_B(PK, header, messages, msg_scalars)
+        
+        # Core.tex Step 3: Verify pairing equation
+        # Original: h(A, W) * h(A * e - B, P2) == Identity_GT
+        # Rearranged: h(A, W + e*P2) == h(B, P2)
+        W_plus_eP2 = add(PK.W, multiply(self.P2, signature.e))
+        
+        # h(A, W + e*P2) * h(-B, P2) == Identity_GT, one final exponentiation
+        return verify_batch_pairings([(W_plus_eP2, signature.A), (self.P2, neg(B))])
+    
+    def _compute_B(self, PK: BBSPublicKey, header: bytes, messages: List[bytes],
+                   msg_scalars: Optional[List[int]] = None) -> tuple:
+        """B = P1 + Q_1 * domain + H_1 * msg_1 + ... + H_L * msg_L (CoreVerify steps 1-2)"""
+        L = len(messages)
+        
         # Core.tex: Extract generators Q_1, H_1, ..., H_L
         Q_1 = self.generators[0]
         H_generators = self.generators[1:L+1]
@@ -150,34 +213,90 @@ class BBSSignatureScheme:
         domain = calculate_domain(PK.to_bytes(), Q_1, H_generators, header, self.api_id)
         
         # Convert messages to scalars
-        msg_scalars = [hash_to_scalar(m, self.api_id + DST_H2S) for m in messages]
+        if msg_scalars is None:
+            msg_scalars = self.message_scalars(messages)
         
         # Core.tex Step 2: Calculate B = P1 + Q_1 * domain + sum(H_i * msg_i)
         B = self.P1
         if domain != 0:
-            B = add(B, multiply(Q_1, domain))
+            B = add(B, self._mul_generator(0, domain))
         for i, msg_scalar in enumerate(msg_scalars):
             if msg_scalar != 0 and i < len(H_generators):
-                B = add(B, multiply(H_generators[i], msg_scalar))
+                B = add(B, self._mul_generator(i + 1, msg_scalar))
+        return B
+    
+    def batch_verify(self, items: List[Tuple[BBSPublicKey, BBSSignature, List[bytes], bytes]]) -> bool:
+        """
+        Randomized batch verification of several (pk, signature, messages, header)
         
-        # Core.tex Step 3: Verify pairing equation
-        # Original: h(A, W) * h(A * e - B, P2) == Identity_GT
-        # Rearranged: h(A, W + e*P2) == h(B, P2)
-        W_plus_eP2 = add(PK.W, multiply(self.P2, signature.e))
+        Each CoreVerify check h(A_i, W_i + e_i*P2) == h(B_i, P2) is weighted by a
+        random scalar r_i, so that all of them collapse into one product:
+        prod h(r_i*A_i, W_i + e_i*P2) * h(-sum(r_i*B_i), P2) == Identity_GT
+        
+        The right-hand sides share P2 and are merged into a single Miller loop,
+        and only one final exponentiation is performed for the whole batch.
+        Returns True only if every signature is valid (except with probability 1/r).
+        """
+        if not items:
+            return True
+        
+        pairs = []
+        B_sum = Z1
+        for PK, signature, messages, header in items:
+            if len(messages) > self.max_messages:
+                return False
+            
+            r = secrets.randbelow(CURVE_ORDER - 1) + 1
+            B = self._compute_B(PK, header, messages)
+            B_sum = add(B_sum, multiply(B, r))
+            
+            W_plus_eP2 = add(PK.W, multiply(self.P2, signature.e))
+            pairs.append((W_plus_eP2, multiply(signature.A, r)))
+        
+        pairs.append((self.P2, neg(B_sum)))
+        return verify_batch_pairings(pairs)
+    
+    def verify_many(self, pk: BBSPublicKey, signatures: List[BBSSignature],
+                    messages: List[bytes], header: bytes = b"",
+                    msg_scalars: Optional[List[int]] = None) -> List[bool]:
+        """
+        Verify several signatures on the same (pk, messages, header), one verdict each
+        
+        B and the Miller loop of h(-B, P2) do not depend on the signature, so
+        they are computed once; each signature then costs one Miller loop and
+        one final exponentiation. Unlike batch_verify, an invalid signature
+        cannot hide behind the others.
+        """
+        if len(messages) > self.max_messages:
+            return [False] * len(signatures)
         
-        pairing_left = pairing(W_plus_eP2, signature.A)
-        pairing_right = pairing(self.P2, B)
+        B = self._compute_B(pk, header, messages, msg_scalars)
+        if backend.USE_BLST:
+            # Native pairings: no py_ecc Miller loop worth sharing
+            return [
+                verify_batch_pairings([(add(pk.W, multiply(self.P2, signature.e)), signature.A),
+                                       (self.P2, neg(B))])
+                for signature in signatures
+            ]
+        shared = pairing(self.P2, neg(B), final_exponentiate=False)
         
-        return pairing_left == pairing_right
+        results = []
+        for signature in signatures:
+            W_plus_eP2 = add(pk.W, multiply(self.P2, signature.e))
+            acc = pairing(W_plus_eP2, signature.A, final_exponentiate=False) * shared
+            results.append(final_exponentiate(acc) == FQ12.one())
+        return results
     
-    def sign(self, sk: BBSPrivateKey, messages: List[bytes], header: bytes = b"") -> BBSSignature:
-        """Sign multiple messages using CoreSign"""
-        return self.core_sign(sk, header, messages)
+    def sign(self, sk: BBSPrivateKey, messages: List[bytes], header: bytes = b"",
+             msg_scalars: Optional[List[int]] = None) -> BBSSignature:
+        """Sign multiple messages using CoreSign (msg_scalars: see message_scalars)"""
+        return self.core_sign(sk, header, messages, msg_scalars)
     
     def verify(self, pk: BBSPublicKey, signature: BBSSignature, 
-              messages: List[bytes], header: bytes = b"") -> bool:
-        """Verify signature using CoreVerify"""
-        return self.core_verify(pk, signature, header, messages)
+              messages: List[bytes], header: bytes = b"",
+              msg_scalars: Optional[List[int]] = None) -> bool:
+        """Verify signature using CoreVerify (msg_scalars: see message_scalars)"""
+        return self.core_verify(pk, signature, header, messages, msg_scalars)
     
     def sign_single(self, sk: BBSPrivateKey, message, header: bytes = b"") -> BBSSignature:
         """Sign a single message"""
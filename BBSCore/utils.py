@@ -10,8 +10,9 @@ from py_ecc.optimized_bls12_381 import curve_order, normalize
 
 def hash_to_scalar(data: bytes, dst: bytes = b"") -> int:
     """Hache des octets en un scalaire modulo l'ordre de la courbe."""
-    h = hashlib.sha256(data + dst).digest()
-    return int.from_bytes(h, "big") % curve_order
+    h = hashlib.sha256(data)
+    h.update(dst)
+    return int.from_bytes(h.digest(), "big") % curve_order
 
 def points_equal(P: Optional[Tuple], Q: Optional[Tuple]) -> bool:
     """
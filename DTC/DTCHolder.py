@@ -19,8 +19,10 @@ attributes (e.g., nationality but not date of birth), ensuring privacy and preve
 correlation between different presentations.
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime, date
 import json
 import logging
@@ -41,6 +43,76 @@ from DTC.dtc import DTCCredential, DocumentType, AttributeType, DTC_VERSION, DTC
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _disclosure_plan(indices_items: Tuple[Tuple[str, int], ...],
+                     attributes_to_reveal: Tuple[str, ...]) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+    """
+    Disclosed message indices for a credential layout and a disclosure request
+    
+    indices_items is the sorted item tuple of
+    DTCCredential.get_attribute_indices_map(), which stays the only
+    definition of the message layout. Always reveals the credential type and
+    issuer (indices 1 and 2). Memoized per layout and request, so recurring
+    requests (e.g. nationality + surname on passports) skip the index
+    selection. Returns (sorted indices, unknown attribute names).
+    """
+    indices_map = dict(indices_items)
+    
+    disclosed = {1, 2}
+    missing = []
+    for attr_name in attributes_to_reveal:
+        if attr_name in indices_map:
+            disclosed.add(indices_map[attr_name])
+        else:
+            missing.append(attr_name)
+    return tuple(sorted(disclosed)), tuple(missing)
+
+
+class CredentialStore(MutableMapping):
+    """
+    Credential wallet storage: credential_id -> DTCCredential
+    
+    A slotted mapping around a single dict, so each holder carries no
+    per-instance __dict__. Lookups go straight to the dict (str hashes are
+    cached by Python, ids are never re-hashed). Behaves like a plain dict
+    for holder code and tests (item access, `in`, len, dict(store)).
+    """
+    __slots__ = ('_by_id',)
+    
+    def __init__(self, credentials: Optional[Dict[str, DTCCredential]] = None):
+        self._by_id: Dict[str, DTCCredential] = dict(credentials or {})
+    
+    def __getitem__(self, credential_id: str) -> DTCCredential:
+        return self._by_id[credential_id]
+    
+    def __setitem__(self, credential_id: str, credential: DTCCredential):
+        self._by_id[credential_id] = credential
+    
+    def __delitem__(self, credential_id: str):
+        del self._by_id[credential_id]
+    
+    def __contains__(self, credential_id: object) -> bool:
+        return credential_id in self._by_id
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._by_id)
+    
+    def __len__(self) -> int:
+        return len(self._by_id)
+    
+    def get(self, credential_id: str, default: Optional[DTCCredential] = None) -> Optional[DTCCredential]:
+        return self._by_id.get(credential_id, default)
+    
+    def values(self):
+        return self._by_id.values()
+    
+    def items(self):
+        return self._by_id.items()
+    
+    def __repr__(self) -> str:
+        return f"CredentialStore({self._by_id!r})"
+
+
 class DTCHolder:
     """
     Digital Travel Credential Holder - Creates selective disclosure presentations
@@ -53,7 +125,7 @@ class DTCHolder:
     def __init__(self, holder_id: str):
         """Initialize holder with BBS proof generation capabilities"""
         self.holder_id = holder_id
-        self.credentials: Dict[str, DTCCredential] = {}
+        self.credentials = CredentialStore()
         
         # Initialize BBS proof generation for selective disclosure
         self.bbs = BBSWithProofs(max_messages=30)
@@ -114,21 +186,16 @@ class DTCHolder:
         
         # Convert credential to BBS message vector (same as issuer used for signing)
         messages = credential.to_message_list()
-        indices_map = credential.get_attribute_indices_map()
         
-        # Determine which message indices to disclose in the proof
-        disclosed_indices = []
-        # Always reveal credential type and issuer for verification context
-        disclosed_indices.extend([1, 2])
-        
-        # Add specifically requested attributes for selective disclosure
-        for attr_name in attributes_to_reveal:
-            if attr_name in indices_map:
-                disclosed_indices.append(indices_map[attr_name])
-            else:
-                logger.warning(f"Attribute '{attr_name}' not found in credential")
+        # Determine which message indices to disclose in the proof: credential
+        # type and issuer for verification context, plus requested attributes
+        plan, missing = _disclosure_plan(
+            tuple(sorted(credential.get_attribute_indices_map().items())), tuple(attributes_to_reveal)
+        )
+        for attr_name in missing:
+            logger.warning(f"Attribute '{attr_name}' not found in credential")
         
-        disclosed_indices = sorted(list(set(disclosed_indices)))
+        disclosed_indices = list(plan)
         
         # Extract only the messages that will be revealed
         disclosed_messages = [messages[i] for i in disclosed_indices]
@@ -232,7 +299,8 @@ class DTCHolder:
         
         for cred_id, cred in self.credentials.items():
             try:
-                export_data["credentials"][cred_id] = json.loads(cred.to_json())
+                # Dict form directly: no JSON encode/decode round trip per credential
+                export_data["credentials"][cred_id] = cred.to_dict()
             except Exception as e:
                 logger.error(f"Failed to export credential {cred_id}: {e}")
         
@@ -245,9 +313,8 @@ class DTCHolder:
             imported_count = 0
             
             for cred_id, cred_data in data.get("credentials", {}).items():
-                # Reconstruct credential with BBS signature from JSON
-                cred_json = json.dumps(cred_data)
-                credential = DTCCredential.from_json(cred_json)
+                # Reconstruct credential with BBS signature from its parsed JSON
+                credential = DTCCredential.from_dict(cred_data)
                 
                 # Store in wallet
                 self.store_credential(cred_id, credential)
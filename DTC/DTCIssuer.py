@@ -20,7 +20,7 @@ only specific attributes through BBS proof generation.
 """
 
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, date
 import logging
 
@@ -68,19 +68,26 @@ class DTCIssuer:
         
         logger.info(f"Initialized BBS issuer {issuer_id} with {max_messages} max messages")
     
+    def _header(self, document_type: DocumentType) -> bytes:
+        """BBS header binding a signature to its document type and issuer"""
+        return f"{document_type.value}:{self.issuer_id}".encode()
+    
     def sign_credential(self, credential: DTCCredential, holder_id: str, 
-                       document_type: DocumentType) -> DTCCredential:
+                       document_type: DocumentType,
+                       check_signature: bool = True) -> DTCCredential:
         """
         Sign a credential using BBS signatures
         
         This converts the credential attributes to BBS messages and signs them,
-        enabling later selective disclosure by the holder.
+        enabling later selective disclosure by the holder. With check_signature=False
+        the immediate self-verification is skipped (issue_batch verifies all
+        signatures of a batch at once instead).
         """
         # Use the credential's own message generation method for consistency
         messages = credential.to_message_list()
         
         # Create signing context header
-        header = f"{document_type.value}:{self.issuer_id}".encode()
+        header = self._header(document_type)
         
         logger.info(f"DTCIssuer signing with header: {header}")
         logger.info(f"DTCIssuer signing {len(messages)} messages")
@@ -96,8 +103,9 @@ class DTCIssuer:
         logger.info(f"DTCIssuer generated signature: {signature}")
         
         # VERIFICATION: Test signature immediately after creation
-        signature_check = self.bbs.verify(self.public_key, signature, messages, header)
-        logger.info(f"DTCIssuer signature immediate verification: {signature_check}")
+        if check_signature:
+            signature_check = self.bbs.verify(self.public_key, signature, messages, header)
+            logger.info(f"DTCIssuer signature immediate verification: {signature_check}")
         
         credential.signature = signature
         credential.signature_bytes = signature.to_bytes()  # Standard 80-byte BBS signature
@@ -108,6 +116,16 @@ class DTCIssuer:
     
     def issue_passport(self, passport_data: Dict[str, Any]) -> PassportCredential:
         """Issue a passport credential with BBS signature"""
+        passport, holder_id, holder_name = self._build_passport(passport_data)
+        
+        # Sign the passport credential using BBS
+        self.sign_credential(passport, holder_id, DocumentType.PASSPORT)
+        
+        logger.info(f"Issued passport credential for {holder_name}")
+        return passport
+    
+    def _build_passport(self, passport_data: Dict[str, Any]) -> Tuple[PassportCredential, str, str]:
+        """Map passport input data to an unsigned PassportCredential"""
         
         # Extract holder information
         holder_name = f"{passport_data.get('given_names', '')} {passport_data.get('surname', '')}"
@@ -130,14 +148,20 @@ class DTCIssuer:
             issuing_authority=passport_data["issuing_authority"]
         )
         
-        # Sign the passport credential using BBS
-        self.sign_credential(passport, holder_id, DocumentType.PASSPORT)
-        
-        logger.info(f"Issued passport credential for {holder_name}")
-        return passport
+        return passport, holder_id, holder_name
     
     def issue_visa(self, visa_data: Dict[str, Any]) -> VisaCredential:
         """Issue a visa credential with BBS signature"""
+        visa, holder_id, holder_name = self._build_visa(visa_data)
+        
+        # Sign the visa credential using BBS
+        self.sign_credential(visa, holder_id, DocumentType.VISA)
+        
+        logger.info(f"Issued visa credential for {holder_name}")
+        return visa
+    
+    def _build_visa(self, visa_data: Dict[str, Any]) -> Tuple[VisaCredential, str, str]:
+        """Map visa input data to an unsigned VisaCredential"""
         
         # Extract holder information
         holder_name = f"{visa_data.get('given_names', '')} {visa_data.get('surname', '')}"
@@ -160,14 +184,20 @@ class DTCIssuer:
             duration_of_stay=90
         )
         
-        # Sign the visa credential using BBS
-        self.sign_credential(visa, holder_id, DocumentType.VISA)
-        
-        logger.info(f"Issued visa credential for {holder_name}")
-        return visa
+        return visa, holder_id, holder_name
     
     def issue_vaccination(self, vaccination_data: Dict[str, Any]) -> VaccinationCredential:
         """Issue a vaccination certificate with BBS signature"""
+        vaccination, holder_id, holder_name = self._build_vaccination(vaccination_data)
+        
+        # Sign the vaccination credential using BBS
+        self.sign_credential(vaccination, holder_id, DocumentType.VACCINATION)
+        
+        logger.info(f"Issued vaccination certificate for {holder_name}")
+        return vaccination
+    
+    def _build_vaccination(self, vaccination_data: Dict[str, Any]) -> Tuple[VaccinationCredential, str, str]:
+        """Map vaccination input data to an unsigned VaccinationCredential"""
         
         # Extract holder information  
         holder_name = f"{vaccination_data.get('given_names', '')} {vaccination_data.get('surname', '')}"
@@ -199,11 +229,53 @@ class DTCIssuer:
             issuing_authority=vaccination_data["issuing_authority"]
         )
         
-        # Sign the vaccination credential using BBS
-        self.sign_credential(vaccination, holder_id, DocumentType.VACCINATION)
+        return vaccination, holder_id, holder_name
+    
+    def issue_batch(self, requests: List[Tuple[str, Dict[str, Any]]]) -> List[DTCCredential]:
+        """
+        Issue several credentials at once
         
-        logger.info(f"Issued vaccination certificate for {holder_name}")
-        return vaccination
+        requests is a list of (kind, data) with kind in "passport", "visa" and
+        "vaccination". All inputs are mapped first, so a malformed entry fails
+        before any signing. The credentials are then signed one by one and their
+        self-check is done with a single randomized batch verification (one
+        final exponentiation) instead of one pairing check per credential.
+        If the batch check fails, each signature is verified on its own and a
+        ValueError names the first credential whose signature is invalid.
+        
+        Returns the signed credentials in request order.
+        """
+        builders = {
+            "passport": (self._build_passport, DocumentType.PASSPORT),
+            "visa": (self._build_visa, DocumentType.VISA),
+            "vaccination": (self._build_vaccination, DocumentType.VACCINATION),
+        }
+        
+        pending = []
+        for kind, data in requests:
+            if kind not in builders:
+                raise ValueError(f"Unsupported credential kind: {kind}")
+            build, document_type = builders[kind]
+            credential, holder_id, _ = build(data)
+            pending.append((credential, holder_id, document_type))
+        
+        batch = []
+        for credential, holder_id, document_type in pending:
+            self.sign_credential(credential, holder_id, document_type, check_signature=False)
+            batch.append((self.public_key, credential.signature,
+                          credential.to_message_list(), self._header(document_type)))
+        
+        batch_check = self.bbs.sign_scheme.batch_verify(batch)
+        logger.info(f"DTCIssuer batch verification of {len(batch)} signatures: {batch_check}")
+        
+        if not batch_check:
+            # Per-credential fallback to name the faulty signature
+            for (credential, _, _), (pk, signature, messages, header) in zip(pending, batch):
+                if not self.bbs.verify(pk, signature, messages, header):
+                    raise ValueError(f"Invalid BBS signature for credential {credential.credential_id}")
+            logger.warning("DTCIssuer batch check failed but every signature verifies on its own")
+        
+        return [credential for credential, _, _ in pending]
     
     def get_public_key_bytes(self) -> bytes:
         """Get issuer's BBS public key in bytes format (96 bytes for G2 point)"""
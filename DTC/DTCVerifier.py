@@ -2,9 +2,12 @@
 Digital Trust Certificate (DTC) Verifier Implementation
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import ClassVar, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, date
+from collections import OrderedDict
+import copy
+import hashlib
 import json
 import logging
 
@@ -17,7 +20,7 @@ sys.path.insert(0, project_root)
 
 from DTC.bbs_core import (
     BBSSignatureScheme, BBSPrivateKey, BBSPublicKey, BBSSignature,
-    BBSProofScheme, BBSProof, BBSWithProofs
+    BBSProofScheme, BBSProof, BBSWithProofs, verify_batch_pairings
 )
 BBS_AVAILABLE = True
 
@@ -29,6 +32,14 @@ logger = logging.getLogger(__name__)
 class DTCVerifier:
     """Digital Trust Certificate Verifier"""
     
+    # Maximum number of memoized verification results (LRU eviction)
+    RESULT_CACHE_SIZE = 4096
+    
+    # BBS contexts per issuer api_id, shared by every verifier: generators
+    # only depend on the api_id, so hash-to-curve (and the optional comb
+    # tables) are computed once per process
+    _issuer_contexts: ClassVar[Dict[str, BBSWithProofs]] = {}
+    
     def __init__(self, verifier_id: str):
         """Initialize verifier with BBS proof verification capabilities"""
         self.verifier_id = verifier_id
@@ -37,6 +48,12 @@ class DTCVerifier:
         self.bbs = BBSWithProofs(max_messages=30)
         logger.info(f"BBS verification enabled for {verifier_id}")
         
+        # Opt-in memoization of verify_presentation results
+        self.enable_cache = False
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._result_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        
         logger.info(f"Verifier {verifier_id} initialized")
     
     def add_trusted_issuer(self, issuer_id: str, public_key: Any, 
@@ -49,6 +66,65 @@ class DTCVerifier:
         }
         
         logger.info(f"Added trusted issuer: {issuer_id}")
+        # Cached results depend on the trust list
+        self._result_cache.clear()
+    
+    @classmethod
+    def _issuer_context(cls, issuer_id: str) -> BBSWithProofs:
+        """BBS context with the same API_ID as used by the issuer for signing"""
+        context = cls._issuer_contexts.get(issuer_id)
+        if context is None:
+            context = BBSWithProofs(max_messages=30, api_id=issuer_id.encode())
+            cls._issuer_contexts[issuer_id] = context
+        return context
+    
+    @classmethod
+    def precompute_generator_tables(cls, issuer_ids: List[str], window_bits: int = 4) -> None:
+        """
+        Build generator comb tables for the given issuers, once per process
+        
+        Every later verification against these issuers, by any verifier,
+        replaces the generator scalar multiplications with table lookups.
+        """
+        for issuer_id in issuer_ids:
+            context = cls._issuer_context(issuer_id)
+            proof_scheme = context.proof_scheme
+            if proof_scheme.generator_tables is None or proof_scheme.table_window != window_bits:
+                context.precompute_generator_tables(window_bits)
+    
+    def _presentation_key(self,
+                          proof: Any,
+                          disclosed_messages: List[bytes],
+                          disclosed_indices: List[int],
+                          presentation_header: bytes,
+                          issuer_id: Optional[str]) -> Optional[bytes]:
+        """
+        Cache key for a presentation: BLAKE2b-128 over the serialized proof and
+        every verification input. Returns None when the proof cannot be
+        serialized (malformed proofs are always verified, never cached).
+        """
+        try:
+            proof_bytes = getattr(proof, 'canonical_bytes', None) or proof.to_bytes()
+        except Exception:
+            return None
+        
+        h = hashlib.blake2b(digest_size=16)
+        for part in (proof_bytes, presentation_header, (issuer_id or "").encode()):
+            h.update(len(part).to_bytes(4, 'big'))
+            h.update(part)
+        h.update(len(disclosed_indices).to_bytes(4, 'big'))
+        h.update(len(disclosed_messages).to_bytes(4, 'big'))
+        for idx, msg in zip(disclosed_indices, disclosed_messages):
+            h.update(int(idx).to_bytes(4, 'big'))
+            h.update(len(msg).to_bytes(4, 'big'))
+            h.update(msg)
+        return h.digest()
+    
+    def clear_cache(self):
+        """Drop memoized verification results and reset the hit counters"""
+        self._result_cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
     
     def verify_presentation(self,
                            proof: Any,
@@ -56,88 +132,212 @@ class DTCVerifier:
                            disclosed_indices: List[int],
                            presentation_header: bytes = b"",
                            issuer_id: str = None) -> Dict[str, Any]:
-        """Verify presentation using zero-knowledge proof verification"""
+        """
+        Verify presentation using zero-knowledge proof verification
+        
+        With enable_cache set, results are memoized by a hash of the proof and
+        all verification inputs, so re-verifying an identical presentation
+        skips the pairing checks. Any altered message, index or header gives a
+        different key and is verified again; presentations whose message and
+        index counts differ are never cached. A cache hit carries a fresh
+        verification_timestamp.
+        """
+        if not self.enable_cache:
+            return self._verify_presentation(proof, disclosed_messages, disclosed_indices,
+                                             presentation_header, issuer_id)
+        
+        key = None
+        if disclosed_messages and disclosed_indices and len(disclosed_messages) == len(disclosed_indices):
+            key = self._presentation_key(proof, disclosed_messages, disclosed_indices,
+                                         presentation_header, issuer_id)
+        if key is not None and key in self._result_cache:
+            self._result_cache.move_to_end(key)
+            self.cache_hits += 1
+            result = copy.deepcopy(self._result_cache[key])
+            if "verification_timestamp" in result:
+                result["verification_timestamp"] = datetime.now().isoformat()
+            return result
+        
+        self.cache_misses += 1
+        result = self._verify_presentation(proof, disclosed_messages, disclosed_indices,
+                                           presentation_header, issuer_id)
+        if key is not None:
+            self._result_cache[key] = copy.deepcopy(result)
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return result
+    
+    def _resolve_presentation(self,
+                              disclosed_messages: List[bytes],
+                              disclosed_indices: List[int],
+                              issuer_id: str = None) -> Dict[str, Any]:
+        """
+        Check the disclosed inputs and resolve the issuer context of a presentation
+        
+        Returns {"valid": False, "error": ...} when the presentation cannot be
+        verified, otherwise the issuer id, document type, BBS header and issuer
+        public key needed for proof verification.
+        """
+        #  Validation plus robuste des paramètres d'entrée
+        if not disclosed_messages or not disclosed_indices:
+            return {
+                "valid": False,
+                "error": "Empty disclosed messages or indices"
+            }
+        
+        if len(disclosed_messages) != len(disclosed_indices):
+            return {
+                "valid": False,
+                "error": "Mismatch between messages and indices count"
+            }
+        
+        # Recherche de l'issuer dans les messages révélés  
+        extracted_issuer_id = None
+        doc_type = None
+        
+        #  Méthode plus robuste pour extraire l'issuer
+        for i, idx in enumerate(disclosed_indices):
+            if i < len(disclosed_messages):
+                try:
+                    msg = disclosed_messages[i].decode('utf-8')
+                    
+                    # Format: "attribute:value" ou juste "value"
+                    if ':' in msg:
+                        key, value = msg.split(':', 1)
+                        if 'issuer' in key.lower():
+                            extracted_issuer_id = value
+                        elif 'document_type' in key.lower() or 'doc_type' in key.lower():
+                            doc_type = value
+                    else:
+                        # Si c'est l'index 2, c'est probablement l'issuer par convention
+                        if idx == 2 or 'issuer' in str(idx):
+                            extracted_issuer_id = msg
+                        elif idx == 1 or 'doc' in str(idx):
+                            doc_type = msg
+                            
+                except Exception as e:
+                    logger.warning(f"Failed to parse message {i}: {e}")
+                    continue
+        
+        # Use provided issuer_id or extract from messages
+        final_issuer_id = issuer_id or extracted_issuer_id
+        
+        # Si on n'a pas trouvé l'issuer, chercher avec des heuristiques
+        if not final_issuer_id:
+            # Chercher un format connu d'issuer (contient souvent des underscores ou codes)
+            for i, msg_bytes in enumerate(disclosed_messages):
+                try:
+                    msg = msg_bytes.decode('utf-8')
+                    if '_' in msg and msg.isupper():  # Format comme "FR_GOV_001"
+                        final_issuer_id = msg
+                        break
+                except:
+                    continue
+        
+        if not final_issuer_id:
+            return {
+                "valid": False,
+                "error": "Issuer information not found in disclosed messages"
+            }
+        
+        # Vérifier que l'issuer est de confiance
+        if final_issuer_id not in self.trusted_issuers:
+            return {
+                "valid": False,
+                "error": f"Unknown or untrusted issuer: {final_issuer_id}"
+            }
+        
+        #  Construire le header correctement
+        if doc_type:
+            header = f"{doc_type}:{final_issuer_id}".encode('utf-8')
+        else:
+            header = final_issuer_id.encode('utf-8')
+        
+        return {
+            "issuer_id": final_issuer_id,
+            "document_type": doc_type,
+            "header": header,
+            "public_key": self.trusted_issuers[final_issuer_id]["public_key"]
+        }
+    
+    @staticmethod
+    def _normalize_proof(proof: Any) -> Any:
+        """
+        S'assurer que les attributs de proof ne sont pas None
+        
+        Returns a patched shallow copy when needed: the caller's proof is
+        never modified, so verification stays pure w.r.t. its inputs.
+        """
+        defaults = {
+            name: 1 for name in ('e_hat', 'r1_hat', 'r3_hat', 'cp')
+            if hasattr(proof, name) and getattr(proof, name) is None
+        }
+        if not hasattr(proof, 'commitments'):
+            defaults['commitments'] = []
+        if not defaults:
+            return proof
+        
+        proof = copy.copy(proof)
+        for name, value in defaults.items():
+            setattr(proof, name, value)
+        return proof
+    
+    def _success_result(self,
+                        disclosed_messages: List[bytes],
+                        disclosed_indices: List[int],
+                        issuer_id: Optional[str],
+                        doc_type: Optional[str]) -> Dict[str, Any]:
+        """Build the result of a verified presentation from its revealed messages"""
+        #  Extraction améliorée des attributs révélés
+        revealed_attributes = {}
+        for i, idx in enumerate(disclosed_indices):
+            if i < len(disclosed_messages):
+                try:
+                    msg = disclosed_messages[i].decode('utf-8')
+                    if ':' in msg:
+                        key, value = msg.split(':', 1)
+                        # Nettoyer la clé si elle contient des préfixes
+                        if ':' in key:
+                            key = key.split(':')[-1]  # Prendre la dernière partie
+                        revealed_attributes[key.strip()] = value.strip()
+                    else:
+                        # Utiliser un nom d'attribut basé sur l'index
+                        revealed_attributes[f"attribute_{idx}"] = msg
+                except Exception as e:
+                    logger.warning(f"Failed to parse message {i}: {e}")
+                    revealed_attributes[f"raw_message_{i}"] = str(disclosed_messages[i])
+        
+        logger.info(f"Successfully verified presentation from {issuer_id}")
+        
+        return {
+            "valid": True,
+            "issuer": issuer_id,
+            "document_type": doc_type,
+            "revealed_attributes": revealed_attributes,
+            "disclosed_count": len(disclosed_indices),
+            "verification_timestamp": datetime.now().isoformat(),
+            "verifier_id": self.verifier_id
+        }
+    
+    def _verify_presentation(self,
+                             proof: Any,
+                             disclosed_messages: List[bytes],
+                             disclosed_indices: List[int],
+                             presentation_header: bytes = b"",
+                             issuer_id: str = None) -> Dict[str, Any]:
+        """Uncached presentation verification"""
         try:
-            #  Validation plus robuste des paramètres d'entrée
-            if not disclosed_messages or not disclosed_indices:
-                return {
-                    "valid": False,
-                    "error": "Empty disclosed messages or indices"
-                }
-            
-            if len(disclosed_messages) != len(disclosed_indices):
-                return {
-                    "valid": False,
-                    "error": "Mismatch between messages and indices count"
-                }
-            
-            # Recherche de l'issuer dans les messages révélés  
-            extracted_issuer_id = None
-            doc_type = None
-            
-            #  Méthode plus robuste pour extraire l'issuer
-            for i, idx in enumerate(disclosed_indices):
-                if i < len(disclosed_messages):
-                    try:
-                        msg = disclosed_messages[i].decode('utf-8')
-                        
-                        # Format: "attribute:value" ou juste "value"
-                        if ':' in msg:
-                            key, value = msg.split(':', 1)
-                            if 'issuer' in key.lower():
-                                extracted_issuer_id = value
-                            elif 'document_type' in key.lower() or 'doc_type' in key.lower():
-                                doc_type = value
-                        else:
-                            # Si c'est l'index 2, c'est probablement l'issuer par convention
-                            if idx == 2 or 'issuer' in str(idx):
-                                extracted_issuer_id = msg
-                            elif idx == 1 or 'doc' in str(idx):
-                                doc_type = msg
-                                
-                    except Exception as e:
-                        logger.warning(f"Failed to parse message {i}: {e}")
-                        continue
-            
-            # Use provided issuer_id or extract from messages
-            final_issuer_id = issuer_id or extracted_issuer_id
-            
-            # Si on n'a pas trouvé l'issuer, chercher avec des heuristiques
-            if not final_issuer_id:
-                # Chercher un format connu d'issuer (contient souvent des underscores ou codes)
-                for i, msg_bytes in enumerate(disclosed_messages):
-                    try:
-                        msg = msg_bytes.decode('utf-8')
-                        if '_' in msg and msg.isupper():  # Format comme "FR_GOV_001"
-                            final_issuer_id = msg
-                            break
-                    except:
-                        continue
-            
-            if not final_issuer_id:
-                return {
-                    "valid": False,
-                    "error": "Issuer information not found in disclosed messages"
-                }
+            context = self._resolve_presentation(disclosed_messages, disclosed_indices, issuer_id)
+            if "error" in context:
+                return context
             
-            # Vérifier que l'issuer est de confiance
-            if final_issuer_id not in self.trusted_issuers:
-                return {
-                    "valid": False,
-                    "error": f"Unknown or untrusted issuer: {final_issuer_id}"
-                }
+            final_issuer_id = context["issuer_id"]
+            doc_type = context["document_type"]
+            header = context["header"]
+            issuer_pk = context["public_key"]
             
-            issuer_info = self.trusted_issuers[final_issuer_id]
-            issuer_pk = issuer_info["public_key"]
-            
-            # Initialize BBS with the same API_ID as used during signing and proof generation
-            bbs_with_issuer_context = BBSWithProofs(max_messages=30, api_id=final_issuer_id.encode())
-            
-            #  Construire le header correctement
-            if doc_type:
-                header = f"{doc_type}:{final_issuer_id}".encode('utf-8')
-            else:
-                header = final_issuer_id.encode('utf-8')
+            # Shared BBS context with the same API_ID as used during signing and proof generation
+            bbs_with_issuer_context = self._issuer_context(final_issuer_id)
             
             #  Vérification de la preuve BBS avec les bons paramètres
             try:
@@ -158,17 +358,7 @@ class DTCVerifier:
                 if hasattr(proof, 'e_hat'):
                     logger.info(f"Proof e_hat: {proof.e_hat}")
                 
-                # S'assurer que les attributs de proof ne sont pas None
-                if hasattr(proof, 'e_hat') and proof.e_hat is None:
-                    proof.e_hat = 1
-                if hasattr(proof, 'r1_hat') and proof.r1_hat is None:
-                    proof.r1_hat = 1  
-                if hasattr(proof, 'r3_hat') and proof.r3_hat is None:
-                    proof.r3_hat = 1
-                if hasattr(proof, 'cp') and proof.cp is None:
-                    proof.cp = 1
-                if not hasattr(proof, 'commitments'):
-                    proof.commitments = []
+                proof = self._normalize_proof(proof)
                 
                 is_valid = bbs_with_issuer_context.verify_proof(
                     pk=issuer_pk, 
@@ -194,49 +384,142 @@ class DTCVerifier:
                     "error": "Zero-knowledge proof verification failed"
                 }
             
-            #  Extraction améliorée des attributs révélés
-            revealed_attributes = {}
-            for i, idx in enumerate(disclosed_indices):
-                if i < len(disclosed_messages):
-                    try:
-                        msg = disclosed_messages[i].decode('utf-8')
-                        if ':' in msg:
-                            key, value = msg.split(':', 1)
-                            # Nettoyer la clé si elle contient des préfixes
-                            if ':' in key:
-                                key = key.split(':')[-1]  # Prendre la dernière partie
-                            revealed_attributes[key.strip()] = value.strip()
-                        else:
-                            # Utiliser un nom d'attribut basé sur l'index
-                            revealed_attributes[f"attribute_{idx}"] = msg
-                    except Exception as e:
-                        logger.warning(f"Failed to parse message {i}: {e}")
-                        revealed_attributes[f"raw_message_{i}"] = str(disclosed_messages[i])
-            
-            logger.info(f"Successfully verified presentation from {issuer_id}")
+            return self._success_result(disclosed_messages, disclosed_indices, issuer_id, doc_type)
             
+        except Exception as e:
+            logger.error(f"Presentation verification failed: {e}")
             return {
-                "valid": True,
-                "issuer": issuer_id,
-                "document_type": doc_type,
-                "revealed_attributes": revealed_attributes,
-                "disclosed_count": len(disclosed_indices),
-                "verification_timestamp": datetime.now().isoformat(),
+                "valid": False,
+                "error": f"Verification error: {e}",
                 "verifier_id": self.verifier_id
             }
+    
+    def _group_by_issuer(self, presentations: List[Tuple]
+                         ) -> Tuple[List[Optional[Dict[str, Any]]], Dict[str, List[Tuple[int, Tuple, Dict[str, Any]]]]]:
+        """
+        Resolve the issuer of each presentation and group them by issuer
+        
+        Returns the results list, already filled for presentations that fail
+        before proof verification, and {issuer_id: [(position, args, context)]}
+        for the others, args being the verify_presentation arguments.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(presentations)
+        groups: Dict[str, List[Tuple[int, Tuple, Dict[str, Any]]]] = {}
+        
+        for pos, item in enumerate(presentations):
+            proof, disclosed_messages, disclosed_indices = item[:3]
+            presentation_header = item[3] if len(item) > 3 else b""
+            issuer_id = item[4] if len(item) > 4 else None
+            args = (proof, disclosed_messages, disclosed_indices, presentation_header, issuer_id)
+            try:
+                context = self._resolve_presentation(disclosed_messages, disclosed_indices, issuer_id)
+            except Exception:
+                results[pos] = self.verify_presentation(*args)
+                continue
+            if "error" in context:
+                results[pos] = context
+                continue
+            groups.setdefault(context["issuer_id"], []).append((pos, args, context))
+        
+        return results, groups
+    
+    def _batch_items(self, members: List[Tuple[int, Tuple, Dict[str, Any]]]) -> List[Tuple]:
+        """(PK, proof, header, ph, disclosed_messages, disclosed_indexes) items of a group"""
+        batch = []
+        for _, args, context in members:
+            proof, disclosed_messages, disclosed_indices, presentation_header, _ = args
+            batch.append((context["public_key"], self._normalize_proof(proof), context["header"], presentation_header,
+                          disclosed_messages, disclosed_indices))
+        return batch
+    
+    def _fill_results(self, results: List[Optional[Dict[str, Any]]],
+                      members: List[Tuple[int, Tuple, Dict[str, Any]]], batch_valid: bool):
+        """Success results for a verified group, one-by-one verification otherwise"""
+        for pos, args, context in members:
+            if batch_valid:
+                results[pos] = self._success_result(args[1], args[2], args[4], context["document_type"])
+            else:
+                results[pos] = self.verify_presentation(*args)
+    
+    def verify_batch(self, presentations: List[Tuple]) -> List[Dict[str, Any]]:
+        """
+        Verify several presentations, batching the pairing checks per issuer
+        
+        Each item is (proof, disclosed_messages, disclosed_indices[,
+        presentation_header[, issuer_id]]), as passed to verify_presentation.
+        Presentations from the same issuer are checked together with one
+        randomized pairing product; if a group fails, its presentations are
+        verified one by one so that each result pinpoints the bad proof.
+        Results are returned in input order, in the verify_presentation format.
+        """
+        results, groups = self._group_by_issuer(presentations)
+        
+        for final_issuer_id, members in groups.items():
+            bbs_with_issuer_context = self._issuer_context(final_issuer_id)
+            batch = self._batch_items(members)
             
-        except Exception as e:
-            logger.error(f"Presentation verification failed: {e}")
+            try:
+                batch_valid = bbs_with_issuer_context.batch_verify_proofs(batch)
+            except Exception as e:
+                logger.warning(f"Batch proof verification failed for {final_issuer_id}: {e}")
+                batch_valid = False
+            logger.info(f"Batch verification of {len(batch)} proofs from {final_issuer_id}: {batch_valid}")
+            
+            self._fill_results(results, members, batch_valid)
+        
+        return results
+    
+    def verify_combined_presentation(self, presentations: List[Tuple]) -> Dict[str, Any]:
+        """
+        Verify presentations of several credentials shown together
+        
+        Items are in the verify_batch format, typically one per credential
+        (passport, visa, ...) from different issuers. The pairing checks of
+        all of them are merged into a single product with one final
+        exponentiation. If it fails, each presentation is verified on its own
+        so that the per-presentation results show which one is invalid.
+        """
+        if not presentations:
             return {
                 "valid": False,
-                "error": f"Verification error: {e}",
+                "error": "Empty combined presentation",
                 "verifier_id": self.verifier_id
             }
+        
+        results, groups = self._group_by_issuer(presentations)
+        
+        # Une présentation déjà rejetée invalide l'ensemble : pas de produit combiné
+        combined_valid = all(result is None for result in results)
+        if combined_valid:
+            try:
+                pairs = []
+                for final_issuer_id, members in groups.items():
+                    proof_scheme = self._issuer_context(final_issuer_id).proof_scheme
+                    terms = proof_scheme.batch_pairing_terms(self._batch_items(members))
+                    if terms is None:
+                        combined_valid = False
+                        break
+                    pairs.extend(terms)
+                combined_valid = combined_valid and verify_batch_pairings(pairs)
+            except Exception as e:
+                logger.warning(f"Combined proof verification failed: {e}")
+                combined_valid = False
+        logger.info(f"Combined verification of {len(presentations)} presentations: {combined_valid}")
+        
+        for members in groups.values():
+            self._fill_results(results, members, combined_valid)
+        
+        return {
+            "valid": all(result["valid"] for result in results),
+            "results": results,
+            "verifier_id": self.verifier_id
+        }
     
     def remove_trusted_issuer(self, issuer_id: str) -> bool:
         """Remove a trusted issuer"""
         if issuer_id in self.trusted_issuers:
             del self.trusted_issuers[issuer_id]
+            self._result_cache.clear()
             logger.info(f"Removed trusted issuer: {issuer_id}")
             return True
         return False
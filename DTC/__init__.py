@@ -52,7 +52,7 @@ from DTC.dtc import (
 
 # BBS-enabled actors in the DTC ecosystem
 from DTC.DTCIssuer import DTCIssuer, create_test_issuer
-from DTC.DTCHolder import DTCHolder, create_test_holder  
+from DTC.DTCHolder import DTCHolder, CredentialStore, create_test_holder
 from DTC.DTCVerifier import DTCVerifier, create_test_verifier
 
 # Unified BBS cryptographic interface
@@ -85,6 +85,7 @@ __all__ = [
     'DTCIssuer',     # Signs credentials with BBS
     'DTCHolder',     # Creates selective disclosure proofs
     'DTCVerifier',   # Verifies BBS presentations
+    'CredentialStore',  # Holder wallet storage
     
     # Convenience functions
     'create_passport_credential',
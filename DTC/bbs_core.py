@@ -12,11 +12,11 @@ sys.path.insert(0, project_root)
 
 from BBSCore.Setup import (
     BBSPrivateKey, BBSPublicKey, BBSKeyPair, BBSSystemSetup, BBSGenerators,
-    CURVE_ORDER, DST_KEYGEN, calculate_domain, hash_to_scalar
+    CURVE_ORDER, DST_KEYGEN, calculate_domain, DomainContext, hash_to_scalar
 )
 
 from BBSCore.KeyGen import BBSKeyGen
-from BBSCore.bbsSign import BBSSignatureScheme, BBSSignature
+from BBSCore.bbsSign import BBSSignatureScheme, BBSSignature, verify_batch_pairings
 from BBSCore.ZKProof import BBSProof, BBSProofScheme, BBSWithProofs
 
 # All BBS components are required - no fallbacks
@@ -39,7 +39,8 @@ def create_proof_scheme(max_messages: int = 10) -> BBSProofScheme:
 __all__ = [
     'BBSPrivateKey', 'BBSPublicKey', 'BBSKeyPair', 'BBSSystemSetup', 'BBSGenerators',
     'BBSKeyGen', 'BBSSignatureScheme', 'BBSSignature', 'BBSProof', 'BBSProofScheme', 'BBSWithProofs',
-    'CURVE_ORDER', 'DST_KEYGEN', 'calculate_domain', 'hash_to_scalar',
+    'verify_batch_pairings',
+    'CURVE_ORDER', 'DST_KEYGEN', 'calculate_domain', 'DomainContext', 'hash_to_scalar',
     'generate_keypair', 'create_signature_scheme', 'create_proof_scheme',
     'BBS_AVAILABLE'
 ]
\ No newline at end of file
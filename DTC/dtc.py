@@ -3,12 +3,14 @@ dtc.py - Digital Trust Certificate Core Data Structures
 """
 
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from collections import ChainMap
 from datetime import datetime, date
 from enum import Enum
 import json
 import base58
 import hashlib
+import copy
 
 DTC_VERSION = "1.0"
 DTC_CONTEXT = "https://www.w3.org/2018/credentials/v1"
@@ -172,6 +174,30 @@ class DTCCredential:
             hidden=hidden
         )
     
+    def with_override(self, name: str, value: Any) -> 'DTCCredential':
+        """
+        Return a view of this credential with a single attribute replaced
+
+        The attribute dict is shared through a ChainMap (override on top) and
+        the signature is kept as-is, so the original credential is untouched
+        and nothing is deep-copied. `value` may be a raw value or a full
+        CredentialAttribute (e.g. taken from another credential).
+        """
+        if isinstance(value, CredentialAttribute):
+            attribute = value
+        else:
+            attribute = replace(self.attributes[name], value=value)
+        view = copy.copy(self)
+        view.attributes = ChainMap({name: attribute}, self.attributes)
+        return view
+
+    def with_signature(self, signature: Any) -> 'DTCCredential':
+        """Return a view of this credential carrying another signature"""
+        view = copy.copy(self)
+        view.signature = signature
+        view.signature_bytes = signature.to_bytes() if signature is not None else None
+        return view
+
     def get_messages_for_signing(self) -> List[bytes]:
         """Get all attributes as messages for BBS signing"""
         messages = []
@@ -219,8 +245,8 @@ class DTCCredential:
         
         return sorted(disclosed_indices)
     
-    def to_json(self) -> str:
-        """Serialize credential to JSON"""
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready dict form of the credential (see to_json)"""
         data = {
             "@context": DTC_CONTEXT,
             "version": DTC_VERSION,
@@ -244,13 +270,20 @@ class DTCCredential:
         if self.signature_bytes:
             data["signature_bytes"] = base58.b58encode(self.signature_bytes).decode('ascii')
         
-        return json.dumps(data, indent=2)
+        return data
+    
+    def to_json(self) -> str:
+        """Serialize credential to JSON"""
+        return json.dumps(self.to_dict(), indent=2)
     
     @classmethod
     def from_json(cls, json_str: str) -> 'DTCCredential':
         """Deserialize credential from JSON"""
-        data = json.loads(json_str)
-        
+        return cls.from_dict(json.loads(json_str))
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DTCCredential':
+        """Rebuild a credential from its to_dict() form"""
         doc_type = DocumentType(data["document_type"])
         schema_map = {
             DocumentType.PASSPORT: PASSPORT_SCHEMA,
@@ -23,12 +23,32 @@ except ImportError:
     class Style:
         RESET_ALL = BRIGHT = ""
 
+_CATEGORIES = {
+    'Debutant - Decouverte': ['complete', 'interactive'],
+    'Intermediaire - Cas d\'usage': ['travel', 'credential_issuance', 'blind'],
+    'Avance - Cryptographie': ['auto_privacy']
+}
+
 class DemoMenu:
     
     def __init__(self):
         self.demo_dir = Path(__file__).parent
         self.available_demos = self._discover_demos()
         self.json_profiles = self._discover_json_profiles()
+        self._menu_sections, self._next_index = self._build_menu_sections()
+    
+    def _build_menu_sections(self):
+        # Filtrage fait une seule fois : le menu est redessine a chaque tour de boucle
+        sections = []
+        demo_index = 1
+        for category, demo_keys in _CATEGORIES.items():
+            entries = []
+            for key in demo_keys:
+                if key in self.available_demos:
+                    entries.append((demo_index, key, self.available_demos[key]))
+                    demo_index += 1
+            sections.append((category, entries))
+        return sections, demo_index
     
     def _discover_demos(self) -> Dict[str, Dict[str, Any]]:
         demos = {
@@ -124,22 +144,14 @@ class DemoMenu:
         print("Bienvenue dans les demonstrations interactives du systeme BBS-DTC !")
         print("Chaque demonstration illustre differents aspects des signatures BBS\n")
         
-        categories = {
-            'Debutant - Decouverte': ['complete', 'interactive'],
-            'Intermediaire - Cas d\'usage': ['travel', 'credential_issuance', 'blind'],
-            'Avance - Cryptographie': ['auto_privacy']
-        }
-        
-        demo_index = 1
-        for category, demo_keys in categories.items():
+        for category, entries in self._menu_sections:
             print(f"{category}")
             print("-" * 40)
             
-            for key in demo_keys:
-                if key in self.available_demos:
-                    self.print_demo_info(key, self.available_demos[key], demo_index)
-                    demo_index += 1
+            for index, key, demo in entries:
+                self.print_demo_info(key, demo, index)
         
+        demo_index = self._next_index
         print("Options Avancees")
         print("-" * 40)
         print(f"{demo_index:2d}. Lancer TOUTES les demos (sequence complete)")
@@ -44,16 +44,20 @@ Structure des Tests:
 │   ├── test_invalid_public_key_rejected()
 │   └── test_hidden_attribute_mismatch()
 │
-└── test_cli.py                      # Tests CLI benchmark runner
-    ├── test_cli_with_config()
-    ├── test_cli_default_config()
-    └── test_cli_missing_file()
+├── test_cli.py                      # Tests CLI benchmark runner (pytest : fixture tmp_path)
+│   ├── test_cli_with_config()
+│   ├── test_cli_default_config()
+│   └── test_cli_missing_file()
+│
+└── _fixtures/                       # Données précalculées partagées
+    └── generators.py                # Générateurs Q_1, H_1..H_32 (api_id vide)
 
 Usage:
     python -m unittest Test.test_bbs_core          # Tests BBSCore seulement
     python -m unittest Test.test_integration       # Tests d'intégration
     python -m unittest Test.test_performance       # Benchmarks performance
     python -m unittest discover Test/              # Tous les tests
+    python -m pytest Test/ -n auto --dist loadgroup  # Parallèle (pytest-xdist, voir conftest.py)
 """
 
 # Import des modules de test principaux
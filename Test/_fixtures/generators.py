@@ -0,0 +1,144 @@
+"""
+Générateurs précalculés pour la suite de tests
+
+Sortie de BBSGenerators.create_generators(32, api_id=b"") sérialisée en G1
+compressé (48 octets) : Q_1 puis H_1, ..., H_32. La séquence est entièrement
+déterministe, la recalculer à chaque import ne fait que répéter les hash-to-curve.
+"""
+
+GENERATORS_API_ID = b""
+
+GENERATORS_SHA256_32 = (
+    bytes.fromhex(
+        "8f88d89a5448d6722812f5bcc96fc709727260ab0e457e2b"
+        "104b68fc90d0c648013df4858d6c27057e3015f9a0dfb7e7"
+    ),
+    bytes.fromhex(
+        "b201e43b07fe849489d977af46418e96c734bd8ea636e039"
+        "eefe3dc3497f299005c6fbf77ad3c73bf875f8b70198c4d1"
+    ),
+    bytes.fromhex(
+        "aea6e0d359d8e18a6f3d3a18de9b3dc3d890a4483b4e0f75"
+        "850e9d383326a685b093f5b01461dcf5bdac93330461c5da"
+    ),
+    bytes.fromhex(
+        "94b4e86dad45e6d2d431fabfdc5954493bee8998e65fe028"
+        "c367085bcbe2c3163e41c72edc369e1e8d74c51841d362b1"
+    ),
+    bytes.fromhex(
+        "82c29cc769d4289677e49bfbfa7d1e74d1a74e1413551353"
+        "edfeead63b6a79270af0af190057f634af5512e6fde99a87"
+    ),
+    bytes.fromhex(
+        "92cfc1a0103ef24c49c67babca3ecb9544b12adec706c603"
+        "c03f02f0d86594127d08e33e768ae63bf30e0a116874fa50"
+    ),
+    bytes.fromhex(
+        "b1a97f8e2b9ff66b669bdf0268d8e63b9e89268ef6b58923"
+        "0dc15c6b36ec557d21cc7d951c26cc02a4a1962ec32f2e63"
+    ),
+    bytes.fromhex(
+        "822f63df2643966845659a53515a9888b1bcca9b870e66a8"
+        "4ed9fc8329d645c6a59bb0be21222e5fc35d994d7c46ac0a"
+    ),
+    bytes.fromhex(
+        "b0ce4a66091a070e878d2a1454731cfb6a9fa8aceabb1170"
+        "8e61be8e033fc40f69cbda06b0869635c032419c991adf9f"
+    ),
+    bytes.fromhex(
+        "b7ac3ab2a4236052d4b3969b8d0feb8fe9c7919aa74433ba"
+        "a303515e20f927bfb1c5f20f78a0393db81eb2610e0c854a"
+    ),
+    bytes.fromhex(
+        "9063755432d2d7285357c602e7f1911f995696b59e1ffe92"
+        "d88465f05e9c1f96d4741647f37405bbb5cd1861eaed59bb"
+    ),
+    bytes.fromhex(
+        "acc1347c3d11e3f3c3a8dec759eac2d0fc7c0661d72990f8"
+        "6b42587cbca65b4178c763616cba830958860ac8b21a5ab6"
+    ),
+    bytes.fromhex(
+        "89f7c0b649c813a1e4f87d982def9f54f7ebb5b0b9d4c3d3"
+        "79add5debd7c63c24a52e7b5359294c09405c421dfe3d5cd"
+    ),
+    bytes.fromhex(
+        "878c117a8f640f184af141cedd9e519ea91547bd64e5d19c"
+        "86b8846902b4ee84e1dda86bcf57c4fb63b54103e8e186ab"
+    ),
+    bytes.fromhex(
+        "8abcde1e483cdb1c8651276c96bf7eb985e5dd93a378cf64"
+        "483d2f60be3f7875c126ca4056be9f3e9f97513e8d3aae1e"
+    ),
+    bytes.fromhex(
+        "8d32f66d9e22f97a62ba947e060b75ef0e659c020ed70e2e"
+        "c33b49ea8ad0b04f379a34719501234f2f475685ff6b2cf2"
+    ),
+    bytes.fromhex(
+        "a42ab3773d14d05d8286f71c1bb4ea348b04a663d4cd1e36"
+        "ebe2a624d35fffdc71b1d7a403724bc9942aa0d41881fdd6"
+    ),
+    bytes.fromhex(
+        "88927f6dc3d9d689afef61813543f2ad311c7077a581ee8e"
+        "6bd58dd5396f42db735bffb3c7696041dd86098b23d24b78"
+    ),
+    bytes.fromhex(
+        "946e717571b2b6d19d2ab7d87b11655fcc8f792ee1b4c538"
+        "42e60d253a31165d205a817690f07c7293860e792decb948"
+    ),
+    bytes.fromhex(
+        "85d8dfa024afd704f63c58cc14d59e89ccc7e2c1fd552cf8"
+        "2441192edf3050e4d4ada070e9b18b74dc6b7466c661f16e"
+    ),
+    bytes.fromhex(
+        "98e7912b0b07f73b1e15b10fa816f6f970af088a77c94aa2"
+        "abf1fb49c2075ccbe91e65993d5a5719828f3ff1b1431270"
+    ),
+    bytes.fromhex(
+        "aa93f41109661f154d04592e66c820582cf3899166bb2539"
+        "4416ad7606a5487c56fa99e67fc973e52a1eba27134db5e5"
+    ),
+    bytes.fromhex(
+        "83996f82e1bacbdf14607fee3c7c7493be65007c53bcfd8b"
+        "a18af518a52c12a16fd461bbd9f1eef700cbae40f9032406"
+    ),
+    bytes.fromhex(
+        "95836d4ebd5296c64cf7b978ccfaac50ddc61c33137a7dc8"
+        "cdfc40e319e46239dcf62eb8dec2d21fa7373dfc4710a9ab"
+    ),
+    bytes.fromhex(
+        "b6601a81e6d5f3dbdbd546d97b404b7b5df82f04d50df61f"
+        "d29f5a3ea704e7c00045af933ec7a69a2183a516668c8dec"
+    ),
+    bytes.fromhex(
+        "a3c6e7fff550a301d41aedc9a52d5ae24b8009203276655d"
+        "1bacc05377de8ee82403ac88baa3f97351c2931d687413cf"
+    ),
+    bytes.fromhex(
+        "85b7be29e2d825d32d9c19cff7587b6f4b227fa28caf58b7"
+        "08fb96835d0a813d37a36a58952d41f19588a3ff430a8b39"
+    ),
+    bytes.fromhex(
+        "97770cd669a5a755e797cf4f433848383bb861b90859b7e5"
+        "16260b55b461b55437295d24e8591b2ec1ed994a6236060e"
+    ),
+    bytes.fromhex(
+        "a232ce56cbee99250c57bd561bac165d7236de1f2c15249d"
+        "31c02e899174075f4f59241325a9928e1450d3472b93ceb0"
+    ),
+    bytes.fromhex(
+        "83fa67febfcc72f497765716088579b4d21528dfcd0a5c59"
+        "619d335919215518a40ff22d6b2c1125f0329e6e4a5a4908"
+    ),
+    bytes.fromhex(
+        "81f82739929220f2cc5c90b8f83e1fc36530fde952a94062"
+        "bb89b3179d0ad258637961f078915eaebc487ea6bdd7458e"
+    ),
+    bytes.fromhex(
+        "af5d7ef3f27323be019f11de48e0dd9c21e942afef700356"
+        "c3877231a7504fedc30b6e63461b9f2a3f06a83262e7c2bd"
+    ),
+    bytes.fromhex(
+        "b771e3e0b6be38592f72c52dae6c2a3576a69e032b6459ff"
+        "b980ab0f2334cc6fa18e988156955d46b14c1818ce93f165"
+    ),
+)
@@ -0,0 +1,26 @@
+"""
+Préchauffage des tables cryptographiques construites à la demande
+
+La table comb G2 de BBSCore.KeyGen est construite au premier calcul de clé
+publique (~0.2 s). Sans préchauffage, ce coût tombe dans le premier test
+qui génère une clé et fausse ses mesures de temps. On le paie une seule
+fois par processus (ou par worker xdist).
+"""
+
+from BBSCore.KeyGen import G2_fixed_mul
+from BBSCore.Setup import BBSGenerators, hash_to_scalar, DST_H2S
+
+from Test._fixtures.generators import GENERATORS_SHA256_32, GENERATORS_API_ID
+
+_WARMED_UP = False
+
+
+def warm_up_crypto() -> None:
+    """Construit une fois les tables partagées (idempotent)"""
+    global _WARMED_UP
+    if _WARMED_UP:
+        return
+    BBSGenerators.register_precomputed(GENERATORS_SHA256_32, GENERATORS_API_ID)
+    G2_fixed_mul(1)
+    hash_to_scalar(b"", DST_H2S)
+    _WARMED_UP = True
@@ -0,0 +1,16 @@
+"""
+Nombre de processus des pools de test
+
+Sous pytest-xdist, chaque worker crée ses propres pools : avec
+cpu_count processus par worker, une exécution -n auto lancerait environ
+cpu_count² processus et les mesures de temps seraient prises sur des
+cœurs saturés. Les cœurs sont donc répartis entre les workers.
+"""
+
+import os
+
+
+def pool_workers() -> int:
+    """Processus disponibles pour un pool de ce worker (au moins 1)"""
+    xdist_workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1") or 1)
+    return max(1, (os.cpu_count() or 1) // max(1, xdist_workers))
@@ -0,0 +1,61 @@
+"""
+Configuration pytest pour la suite de tests BBS-DTC
+
+Les tests restent des unittest.TestCase : `python -m unittest` fonctionne
+sans ce fichier. Sous pytest, chaque classe de test est placée dans son
+propre groupe xdist, de sorte que les caches construits dans setUpClass
+(générateurs, paires de clés, signatures) ne soient calculés qu'une fois
+par worker.
+
+Exécution parallèle (nécessite pytest-xdist) :
+    python -m pytest Test/ -n auto --dist loadgroup
+
+Les caches de module (_GEN_CACHE, ...) sont propres à chaque processus :
+aucun état mutable n'est partagé entre workers. Les tables construites à la
+demande (table comb G2, générateurs précalculés) sont préchauffées une fois
+par session, voir Test/_fixtures/warmup.py.
+"""
+
+import pytest
+
+from Test._fixtures.warmup import warm_up_crypto
+
+# Modules dont les classes sont réparties en groupes xdist
+PARALLEL_MODULES = {
+    "test_bbs_core",
+    "test_dtc_core",
+    "test_integration",
+    "test_security",
+}
+
+# Tests qui modifient un état global du processus (sys.argv, ...) : tous
+# regroupés sur un même worker, jamais en concurrence entre eux
+SERIAL_TESTS = {
+    "test_demo_modules_integration",
+}
+
+
+def pytest_configure(config):
+    # Déclaré ici pour que le marqueur soit connu même sans pytest-xdist
+    config.addinivalue_line(
+        "markers", "xdist_group(name): regroupe des tests sur un même worker xdist"
+    )
+    config.addinivalue_line(
+        "markers", "serial: test exécuté dans le groupe xdist commun 'serial'"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        module = item.module.__name__.rsplit(".", 1)[-1]
+        if item.originalname in SERIAL_TESTS or item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.serial)
+            item.add_marker(pytest.mark.xdist_group(name="serial"))
+        elif module in PARALLEL_MODULES and item.cls is not None:
+            item.add_marker(pytest.mark.xdist_group(name=f"{module}.{item.cls.__name__}"))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warmup_crypto():
+    """Préchauffage unique par session (ou par worker xdist)"""
+    warm_up_crypto()
@@ -10,21 +10,50 @@ Ce module teste toutes les fonctionnalités core du système BBS :
 """
 
 import unittest
+from unittest import mock
 import secrets
 import hashlib
 from typing import List
 
+from py_ecc.optimized_bls12_381 import G2, multiply, add, neg
+
 # Import des modules BBSCore
 from BBSCore.Setup import (
     BBSPrivateKey, BBSPublicKey, BBSKeyPair, BBSSystemSetup, BBSGenerators,
-    hash_to_scalar, calculate_domain, point_to_bytes_g1, point_from_bytes_g1,
-    CURVE_ORDER, DST_H2S, DST_KEYGEN
+    hash_to_scalar, messages_to_scalars, calculate_domain, DomainContext, point_to_bytes_g1, point_from_bytes_g1,
+    CURVE_ORDER, DST_H2S, DST_KEYGEN, DST_GENERATORS
 )
-from BBSCore.KeyGen import BBSKeyGen, generate_bbs_keypair, validate_public_key
+from BBSCore.KeyGen import BBSKeyGen, G2_fixed_mul, generate_bbs_keypair, validate_public_key
 from BBSCore.bbsSign import BBSSignature, BBSSignatureScheme
-from BBSCore.BlindSign import BlindCommitment, BBSBlindSigner, BlindSignatureProtocol
+from BBSCore import BlindSign
+from BBSCore.BlindSign import BlindCommitment, BBSBlindSigner, BlindSignerClient, BlindSignatureProtocol
 from BBSCore.ZKProof import BBSProof, BBSProofScheme
 from BBSCore.utils import points_equal
+from BBSCore import backend
+from Test._fixtures.generators import GENERATORS_SHA256_32, GENERATORS_API_ID
+from Test._fixtures.warmup import warm_up_crypto
+
+# Les générateurs par défaut sont chargés depuis la table précalculée
+BBSGenerators.register_precomputed(GENERATORS_SHA256_32, GENERATORS_API_ID)
+
+
+def load_tests(loader, tests, pattern):
+    """Sous unittest : préchauffe les tables avant le premier test"""
+    warm_up_crypto()
+    return tests
+
+# Cache des générateurs par (max_messages, api_id) : create_generators est
+# déterministe, inutile de refaire les hash-to-curve pour chaque classe
+_GEN_CACHE: dict = {}
+
+
+def _cached_generators(count: int, api_id: bytes = b"") -> List[tuple]:
+    """Retourne les générateurs Q_1, H_1..H_count en les calculant une seule fois"""
+    key = (count, api_id)
+    if key not in _GEN_CACHE:
+        _GEN_CACHE[key] = BBSGenerators.create_generators(count, api_id)
+    return _GEN_CACHE[key]
+
 
 class TestKeyGenValidity(unittest.TestCase):
     """Tests pour la génération de clés BBS"""
@@ -77,6 +106,11 @@ class TestKeyGenValidity(unittest.TestCase):
         # La clé publique convertie doit correspondre
         self.assertTrue(points_equal(pk_converted.W, keypair.public_key.W))
         
+    def test_g2_fixed_mul(self):
+        """Test multiplication à base fixe G2 contre multiply"""
+        for scalar in (1, 15, 16, CURVE_ORDER - 1, secrets.randbelow(CURVE_ORDER)):
+            self.assertTrue(points_equal(G2_fixed_mul(scalar), multiply(G2, scalar)))
+        
     def test_generate_bbs_keypair_base58(self):
         """Test génération avec encodage base58"""
         sk_b58, pk_b58 = generate_bbs_keypair("test_seed")
@@ -102,12 +136,13 @@ class TestKeyGenValidity(unittest.TestCase):
 class TestBBSSignatureValid(unittest.TestCase):
     """Tests pour la signature et vérification BBS valides"""
 
-    def setUp(self):
-        """Configuration initiale"""
-        self.bbs = BBSSignatureScheme(max_messages=5)
-        self.keypair = BBSKeyGen.keygen()
-        self.messages = [b"message1", b"message2", b"message3"]
-        self.header = b"test_header"
+    @classmethod
+    def setUpClass(cls):
+        """Configuration partagée par tous les tests de la classe"""
+        cls.bbs = BBSSignatureScheme(max_messages=5, generators=_cached_generators(5))
+        cls.keypair = BBSKeyGen.keygen()
+        cls.messages = [b"message1", b"message2", b"message3"]
+        cls.header = b"test_header"
         
     def test_single_message_signature(self):
         """Test signature d'un seul message"""
@@ -163,21 +198,96 @@ class TestBBSSignatureValid(unittest.TestCase):
         )
         self.assertTrue(is_valid)
 
+    def test_batch_verify(self):
+        """Test vérification groupée de plusieurs signatures"""
+        message = b"single_message"
+        items = [
+            (self.keypair.public_key,
+             self.bbs.sign_single(self.keypair.secret_key, message, self.header),
+             [message], self.header),
+            (self.keypair.public_key,
+             self.bbs.sign(self.keypair.secret_key, self.messages, self.header),
+             self.messages, self.header),
+            (self.keypair.public_key,
+             self.bbs.sign(self.keypair.secret_key, self.messages),
+             self.messages, b""),
+            (self.keypair.public_key,
+             BBSSignature.from_bytes(
+                 self.bbs.sign(self.keypair.secret_key, self.messages, self.header).to_bytes()
+             ),
+             self.messages, self.header),
+        ]
+
+        # Toutes les signatures valides
+        self.assertTrue(self.bbs.batch_verify(items))
+
+        # Un seul élément invalide fait échouer le lot
+        pk, signature, messages, _ = items[1]
+        self.assertFalse(self.bbs.batch_verify(items + [(pk, signature, messages, b"wrong_header")]))
+
+    def test_verify_many_same_messages(self):
+        """Test vérification de plusieurs signatures sur les mêmes messages"""
+        valid = self.bbs.sign(self.keypair.secret_key, self.messages, self.header)
+        forged = BBSSignature(A=valid.A, e=(valid.e + 1) % CURVE_ORDER)
+        other = self.bbs.sign(self.keypair.secret_key, self.messages, self.header)
+
+        # Un verdict par signature, identique à verify
+        results = self.bbs.verify_many(
+            self.keypair.public_key, [valid, forged, other], self.messages, self.header
+        )
+        self.assertEqual(results, [True, False, True])
+
+    @unittest.skipUnless(backend.BLST_AVAILABLE, "blst non installé")
+    def test_blst_backend_matches_py_ecc(self):
+        """Test backend blst : mêmes verdicts que py_ecc pour le produit de pairings"""
+        signature = self.bbs.sign(self.keypair.secret_key, self.messages, self.header)
+        B = self.bbs._compute_B(self.keypair.public_key, self.header, self.messages)
+        W_plus_eP2 = add(self.keypair.public_key.W, multiply(self.bbs.P2, signature.e))
+
+        valid_pairs = [(W_plus_eP2, signature.A), (self.bbs.P2, neg(B))]
+        invalid_pairs = [(W_plus_eP2, signature.A), (self.bbs.P2, B)]
+        for pairs in (valid_pairs, invalid_pairs):
+            self.assertEqual(backend.pairing_product_is_one_blst(pairs),
+                             backend.pairing_product_is_one_py_ecc(pairs))
+
+    def test_sign_verify_with_generator_tables(self):
+        """Test signature et vérification avec tables comb des générateurs"""
+        table_bbs = BBSSignatureScheme(max_messages=5, generators=_cached_generators(5))
+        table_bbs.precompute_generator_tables(window_bits=4)
+        
+        # Signature déterministe : identique avec ou sans tables
+        signature = table_bbs.sign(self.keypair.secret_key, self.messages, self.header)
+        self.assertEqual(signature, self.bbs.sign(self.keypair.secret_key, self.messages, self.header))
+        self.assertTrue(table_bbs.verify(self.keypair.public_key, signature, self.messages, self.header))
+        self.assertFalse(table_bbs.verify(
+            self.keypair.public_key, signature, [b"message1", b"altered", b"message3"], self.header
+        ))
+
 
 class TestBBSSignatureInvalid(unittest.TestCase):
     """Tests pour rejeter les signatures invalides"""
 
-    def setUp(self):
-        """Configuration initiale"""
-        self.bbs = BBSSignatureScheme(max_messages=5)
-        self.keypair = BBSKeyGen.keygen()
-        self.messages = [b"message1", b"message2"]
-        self.header = b"test_header"
-        self.signature = self.bbs.sign(self.keypair.secret_key, self.messages, self.header)
+    @classmethod
+    def setUpClass(cls):
+        """Configuration partagée par tous les tests de la classe"""
+        cls.bbs = BBSSignatureScheme(max_messages=5, generators=_cached_generators(5))
+        cls.keypair = BBSKeyGen.keygen()
+        cls.messages = [b"message1", b"message2"]
+        cls.header = b"test_header"
+        # Les tests négatifs altèrent les entrées, jamais la clé ni la signature
+        cls.signature = cls.bbs.sign(cls.keypair.secret_key, cls.messages, cls.header)
+        cls.wrong_keypair = None
+
+    @classmethod
+    def _get_wrong_keypair(cls) -> BBSKeyPair:
+        """Mauvaise paire de clés, générée à la première demande seulement"""
+        if cls.wrong_keypair is None:
+            cls.wrong_keypair = BBSKeyGen.keygen()
+        return cls.wrong_keypair
         
     def test_wrong_public_key(self):
         """Test signature avec mauvaise clé publique"""
-        wrong_keypair = BBSKeyGen.keygen()
+        wrong_keypair = self._get_wrong_keypair()
         
         is_valid = self.bbs.verify(
             wrong_keypair.public_key, self.signature, self.messages, self.header
@@ -226,11 +336,15 @@ class TestBBSSignatureInvalid(unittest.TestCase):
 class TestBlindSignCycle(unittest.TestCase):
     """Tests pour les signatures aveugles"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Configuration partagée par tous les tests de la classe"""
+        cls.max_messages = 5
+        cls.setup = BBSSystemSetup(cls.max_messages)
+        cls.keypair = cls.setup.create_key_pair()
+
     def setUp(self):
         """Configuration initiale"""
-        self.max_messages = 5
-        self.setup = BBSSystemSetup(self.max_messages)
-        self.keypair = self.setup.create_key_pair()
         self.signer = BBSBlindSigner(self.keypair.secret_key, self.setup.generators)
         
     def test_blind_signature_protocol(self):
@@ -294,20 +408,41 @@ class TestBlindSignCycle(unittest.TestCase):
         self.assertEqual(len(commitment.blinding_factors), len(hidden_messages))
 
 
+class TestBlindCommitmentRandomness(unittest.TestCase):
+    """Tests de l'aléa tiré pour les engagements aveugles"""
+
+    def test_commitment_with_caller_blinding(self):
+        """Test blinding fourni : conservé, et seuls les nonces Schnorr sont tirés"""
+        client = BlindSignerClient(BBSSignatureScheme(5, generators=_cached_generators(5)))
+        hidden = [b"hidden1", b"hidden2"]
+        blinding = 123456789
+
+        with mock.patch.object(BlindSign, "random_scalars", wraps=BlindSign.random_scalars) as draw:
+            commitment, proof = client.create_commitment(hidden, blinding=blinding)
+
+        draw.assert_called_once_with(1 + len(hidden))
+        self.assertEqual(commitment.blinding, blinding)
+        self.assertTrue(proof.verify(commitment, client.generators[1:], client.api_id))
+
+
 class TestZKProofValidity(unittest.TestCase):
     """Tests pour les preuves zero-knowledge"""
 
-    def setUp(self):
-        """Configuration initiale"""
-        self.max_messages = 5
-        self.bbs_scheme = BBSSignatureScheme(self.max_messages)
-        self.proof_scheme = BBSProofScheme(self.max_messages)
-        self.keypair = BBSKeyGen.keygen()
-        
-        self.messages = [b"msg1", b"msg2", b"msg3", b"msg4"]
-        self.header = b"proof_header"
-        self.signature = self.bbs_scheme.sign(
-            self.keypair.secret_key, self.messages, self.header
+    @classmethod
+    def setUpClass(cls):
+        """Configuration partagée par tous les tests de la classe"""
+        cls.max_messages = 5
+        generators = _cached_generators(cls.max_messages)
+        cls.bbs_scheme = BBSSignatureScheme(cls.max_messages, generators=generators)
+        cls.proof_scheme = BBSProofScheme(cls.max_messages, generators=generators)
+        cls.keypair = BBSKeyGen.keygen()
+        # Image publique sérialisée, calculée une seule fois pour la classe
+        cls.pk_bytes = cls.keypair.public_key.to_bytes()
+        
+        cls.messages = [b"msg1", b"msg2", b"msg3", b"msg4"]
+        cls.header = b"proof_header"
+        cls.signature = cls.bbs_scheme.sign(
+            cls.keypair.secret_key, cls.messages, cls.header
         )
         
     def test_selective_disclosure_proof(self):
@@ -337,6 +472,82 @@ class TestZKProofValidity(unittest.TestCase):
         )
         self.assertTrue(is_valid)
         
+    def test_proof_verify_with_generator_tables(self):
+        """Test vérification avec tables comb des générateurs"""
+        generators = _cached_generators(self.max_messages)
+        table_scheme = BBSProofScheme(self.max_messages, generators=generators)
+        table_scheme.precompute_generator_tables(window_bits=4)
+        
+        disclosed_indices = [1, 3]
+        disclosed_messages = [self.messages[i] for i in disclosed_indices]
+        proof = self.proof_scheme.core_proof_gen(
+            self.keypair.public_key, self.signature, self.header, b"ph",
+            self.messages, disclosed_indices
+        )
+        
+        # Même résultat que la multiplication directe, preuve valide ou altérée
+        self.assertTrue(points_equal(table_scheme._mul_generator(2, 12345), multiply(generators[2], 12345)))
+        self.assertTrue(table_scheme.core_proof_verify(
+            self.keypair.public_key, proof, self.header, b"ph", disclosed_messages, disclosed_indices
+        ))
+        self.assertFalse(table_scheme.core_proof_verify(
+            self.keypair.public_key, proof, self.header, b"ph", [b"msg2", b"other"], disclosed_indices
+        ))
+        
+    def test_prehashed_message_scalars(self):
+        """Test signature et preuve avec messages hachés à l'avance"""
+        msg_scalars = self.proof_scheme.message_scalars(self.messages)
+        self.assertEqual(msg_scalars, self.bbs_scheme.message_scalars(self.messages))
+        
+        # Même signature (déterministe) avec ou sans scalaires pré-calculés
+        signature = self.bbs_scheme.sign(
+            self.keypair.secret_key, self.messages, self.header, msg_scalars=msg_scalars
+        )
+        self.assertEqual(signature, self.signature)
+        self.assertTrue(self.bbs_scheme.verify(
+            self.keypair.public_key, signature, self.messages, self.header, msg_scalars=msg_scalars
+        ))
+        
+        disclosed_indices = [0, 2]
+        disclosed_messages = [self.messages[i] for i in disclosed_indices]
+        proof = self.proof_scheme.proof_gen(
+            self.keypair.public_key, signature, self.header, self.messages,
+            disclosed_indices, msg_scalars=msg_scalars
+        )
+        self.assertTrue(self.proof_scheme.proof_verify(
+            self.keypair.public_key, proof, self.header, disclosed_messages, disclosed_indices,
+            disclosed_scalars=[msg_scalars[i] for i in disclosed_indices]
+        ))
+        
+    def test_proof_accepts_index_sequences(self):
+        """Test indices révélés passés en range/tuple au lieu d'une liste"""
+        disclosed_messages = [self.messages[0], self.messages[2]]
+        proof = self.proof_scheme.proof_gen(
+            self.keypair.public_key, self.signature, self.header, self.messages, range(0, 4, 2)
+        )
+        self.assertTrue(self.proof_scheme.proof_verify(
+            self.keypair.public_key, proof, self.header, disclosed_messages, (0, 2)
+        ))
+        
+    def test_batch_rejects_invalid_shapes(self):
+        """Test formes invalides : rejet identique en vérification simple et par lot"""
+        proof = self.proof_scheme.proof_gen(
+            self.keypair.public_key, self.signature, self.header, self.messages, [0]
+        )
+        bad_inputs = [
+            ([self.messages[0]], [7]),                      # indice hors bornes
+            ([self.messages[0], self.messages[0]], [0, 0]), # indices dupliqués
+            ([self.messages[0]], [0, 1]),                   # messages/indices incohérents
+        ]
+        for messages, indices in bad_inputs:
+            with self.subTest(indices=indices):
+                self.assertFalse(self.proof_scheme.proof_verify(
+                    self.keypair.public_key, proof, self.header, messages, indices
+                ))
+                self.assertFalse(self.proof_scheme.proof_verify_batch(
+                    self.keypair.public_key, [(proof, self.header, messages, indices)]
+                ))
+        
     def test_full_disclosure_proof(self):
         """Test preuve avec tous les messages révélés"""
         disclosed_indices = list(range(len(self.messages)))
@@ -396,12 +607,13 @@ class TestZKProofValidity(unittest.TestCase):
         # Sérialiser
         proof_bytes = proof.to_bytes()
         
-        # Désérialiser
+        # Désérialiser (preuve et clé publique)
         proof_restored = BBSProof.from_bytes(proof_bytes)
+        pk_restored = BBSPublicKey.from_bytes(self.pk_bytes)
         
         # Vérifier que ça marche encore
         is_valid = self.proof_scheme.proof_verify(
-            self.keypair.public_key,
+            pk_restored,
             proof_restored,
             self.header,
             disclosed_messages,
@@ -436,6 +648,15 @@ class TestSecurityUtilsHash(unittest.TestCase):
         
         self.assertNotEqual(hash1, hash2)
         
+    def test_messages_to_scalars(self):
+        """Test que messages_to_scalars équivaut à hash_to_scalar par message"""
+        messages = [b"msg1", b"msg2", b""]
+        dst = DST_H2S
+        
+        scalars = messages_to_scalars(messages, dst)
+        
+        self.assertEqual(scalars, [hash_to_scalar(m, dst) for m in messages])
+        
     def test_calculate_domain(self):
         """Test calcul du domaine"""
         setup = BBSSystemSetup(3)
@@ -445,16 +666,21 @@ class TestSecurityUtilsHash(unittest.TestCase):
         header = b"domain_header"
         api_id = b"test_api"
         
-        domain1 = calculate_domain(pk_bytes, Q_1, H_gens, header, api_id)
-        domain2 = calculate_domain(pk_bytes, Q_1, H_gens, header, api_id)
+        # Seul le header varie : le préfixe PK || Q_1 || H est haché une fois
+        ctx = DomainContext(pk_bytes, Q_1, H_gens, api_id)
+        domain1 = ctx.with_header(header)
+        domain2 = ctx.with_header(header)
         
         # Déterministe
         self.assertEqual(domain1, domain2)
         self.assertGreaterEqual(domain1, 0)
         self.assertLess(domain1, CURVE_ORDER)
         
+        # Identique au calcul direct
+        self.assertEqual(domain1, calculate_domain(pk_bytes, Q_1, H_gens, header, api_id))
+        
         # Différent avec header différent
-        domain3 = calculate_domain(pk_bytes, Q_1, H_gens, b"different", api_id)
+        domain3 = ctx.with_header(b"different")
         self.assertNotEqual(domain1, domain3)
         
     def test_point_serialization_g1(self):
@@ -482,11 +708,27 @@ class TestSecurityUtilsHash(unittest.TestCase):
         # Vérifier nombre correct
         self.assertEqual(len(generators), count + 1)  # Q_1 + H_1...H_count
         
-        # Vérifier que tous les générateurs sont différents
-        for i in range(len(generators)):
-            for j in range(i + 1, len(generators)):
-                self.assertFalse(points_equal(generators[i], generators[j]))
+        # Vérifier que tous les générateurs sont différents (forme compressée unique)
+        blobs = [point_to_bytes_g1(g) for g in generators]
+        self.assertEqual(len(set(blobs)), len(blobs))
                 
+    def test_precomputed_generators(self):
+        """Test que la table précalculée correspond à hash-to-curve"""
+        generators = BBSGenerators.create_generators(3, GENERATORS_API_ID)
+        expected = [point_from_bytes_g1(b) for b in GENERATORS_SHA256_32[:4]]
+
+        self.assertEqual(len(generators), 4)
+        for point, expected_point in zip(generators, expected):
+            self.assertTrue(points_equal(point, expected_point))
+
+        # Q_1 et H_1 recalculés à partir des seeds
+        q1 = BBSGenerators.hash_to_g1(DST_GENERATORS + b"Q_1_" + GENERATORS_API_ID, DST_GENERATORS)
+        h1 = BBSGenerators.hash_to_g1(
+            DST_GENERATORS + b"H_" + (1).to_bytes(4, 'big') + GENERATORS_API_ID, DST_GENERATORS
+        )
+        self.assertTrue(points_equal(q1, generators[0]))
+        self.assertTrue(points_equal(h1, generators[1]))
+        
     def test_points_equal_utility(self):
         """Test utilitaire points_equal"""
         setup = BBSSystemSetup(2)
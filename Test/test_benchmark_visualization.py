@@ -22,16 +22,22 @@ from benchmark.data.manager import DataManager
 class TestRealBenchmarkVisualization(unittest.TestCase):
     """Tests avec les vrais modules de benchmark"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Répertoire temporaire partagé par la classe"""
+        cls.class_dir = tempfile.mkdtemp()
+        
+    @classmethod
+    def tearDownClass(cls):
+        """Nettoyage unique en fin de classe"""
+        if os.path.exists(cls.class_dir):
+            shutil.rmtree(cls.class_dir)
+
     def setUp(self):
-        """Configuration"""
-        self.test_dir = tempfile.mkdtemp()
+        """Sous-répertoire de sortie propre à chaque test"""
+        self.test_dir = os.path.join(self.class_dir, self._testMethodName)
         self.output_dir = os.path.join(self.test_dir, "output")
         os.makedirs(self.output_dir, exist_ok=True)
-        
-    def tearDown(self):
-        """Nettoyage"""
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
             
     def test_real_data_loading(self):
         """Test chargement données réelles"""
@@ -94,14 +100,21 @@ class TestRealBenchmarkVisualization(unittest.TestCase):
 class TestRealDataExport(unittest.TestCase):
     """Tests export de données réelles"""
     
-    def setUp(self):
-        """Configuration"""
-        self.test_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Répertoire temporaire partagé par la classe"""
+        cls.class_dir = tempfile.mkdtemp()
         
-    def tearDown(self):
-        """Nettoyage"""
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Nettoyage unique en fin de classe"""
+        if os.path.exists(cls.class_dir):
+            shutil.rmtree(cls.class_dir)
+
+    def setUp(self):
+        """Sous-répertoire propre à chaque test"""
+        self.test_dir = os.path.join(self.class_dir, self._testMethodName)
+        os.makedirs(self.test_dir, exist_ok=True)
             
     def test_csv_export_real_data(self):
         """Test export CSV avec données réelles"""
@@ -117,16 +130,16 @@ class TestRealDataExport(unittest.TestCase):
                 'memory_mb': 2.0 + i * 0.1
             })
             
-        # Export vers CSV
+        # Export vers CSV en une passe, sans copier la liste des métriques
         csv_file = os.path.join(self.test_dir, "real_metrics.csv")
-        metrics = collector.get_metrics()
+        fieldnames = ('operation', 'attributes', 'time_ms', 'memory_mb')
         
         with open(csv_file, 'w', newline='') as f:
-            if metrics:
-                fieldnames = metrics[0].keys()
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(metrics)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(
+                [m[name] for name in fieldnames] for m in collector.iter_metrics()
+            )
                 
         # Vérifier
         self.assertTrue(os.path.exists(csv_file))
@@ -138,6 +151,36 @@ class TestRealDataExport(unittest.TestCase):
         self.assertGreater(len(rows), 0)
         print(f" CSV réel exporté: {len(rows)} lignes")
 
+    def test_csv_stream_export(self):
+        """Test export CSV au fil de l'eau via stream_to_csv"""
+        collector = BenchmarkCollector()
+        csv_file = os.path.join(self.test_dir, "streamed_metrics.csv")
+        fieldnames = ['operation', 'attributes', 'time_ms', 'memory_mb']
+
+        # Chaque record_metric écrit sa ligne directement dans le fichier
+        with collector.stream_to_csv(csv_file, fieldnames) as c:
+            for i in range(5, 16):
+                c.record_metric({
+                    'operation': 'signature',
+                    'attributes': i,
+                    'time_ms': 10 + i * 1.2
+                })
+
+        # Rien n'est accumulé en mémoire pendant le flux
+        self.assertEqual(collector.get_metrics(), [])
+
+        with open(csv_file, 'r') as f:
+            rows = list(csv.DictReader(f))
+
+        self.assertEqual(len(rows), 11)
+        self.assertEqual(rows[0]['attributes'], '5')
+        # Champ absent de la métrique : cellule vide
+        self.assertEqual(rows[0]['memory_mb'], '')
+
+        # Flux fermé : retour à l'accumulation en mémoire
+        collector.record_metric({'operation': 'verify', 'attributes': 1})
+        self.assertEqual(len(collector.get_metrics()), 1)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2, buffer=True)
\ No newline at end of file
@@ -11,128 +11,169 @@ import unittest
 import subprocess
 import sys
 import os
+import io
 import json
-import tempfile
+import contextlib
 import shutil
+import tempfile
+from functools import lru_cache
 from pathlib import Path
+from unittest import mock
 
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
 
-class TestRealCliUsage(unittest.TestCase):
-    """Tests CLI avec les vrais composants"""
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyfakefs  # noqa: F401  (fournit le fixture pytest `fs`)
+    PYFAKEFS_AVAILABLE = True
+except ImportError:
+    PYFAKEFS_AVAILABLE = False
+
+from main import build_parser, main as cli_main
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Pilote exécuté via `python -c` dans un sous-processus unique par _run_cli_batch :
+# un seul démarrage d'interpréteur pour tous les argv du lot
+_CLI_BATCH_DRIVER = """
+import contextlib, io, json, os, sys
+sys.path.insert(0, os.getcwd())
+from main import main
+
+results = []
+with open(os.devnull, "w") as devnull:
+    for argv in json.loads(sys.argv[1]):
+        # stdout de la CLI jeté, seul stderr est inspecté
+        err = io.StringIO()
+        with contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(err):
+            try:
+                rc = main(argv)
+            except SystemExit as e:
+                rc = e.code
+        results.append({"rc": rc, "traceback": "Traceback" in err.getvalue()})
+print(json.dumps(results))
+"""
+
+
+def _dump_json_bytes(obj) -> bytes:
+    """Sérialise en JSON indenté (orjson si disponible, sinon json)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _load_json_bytes(data: bytes):
+    """Décode du JSON (orjson si disponible, sinon json)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=8)
+def _cached_profile(name: str):
+    """Profil chargé une seule fois par processus via DataManager"""
+    from benchmark.data.manager import DataManager
+    return DataManager().load_person_data(name)
+
+
+class _TmpDirMixin:
+    """
+    Répertoire de travail par test
+    
+    Sous pytest, les tests listés dans FAKE_FS_TESTS travaillent sur le
+    système de fichiers en mémoire de pyfakefs s'il est installé, les autres
+    utilisent le fixture tmp_path. Hors pytest (python -m unittest), setUp
+    crée un répertoire temporaire supprimé en fin de test.
+    """
+
+    FAKE_FS_TESTS = frozenset()
+    test_dir = None
+
+    if PYTEST_AVAILABLE:
+        @pytest.fixture(autouse=True)
+        def _tmp_dir(self, request):
+            if PYFAKEFS_AVAILABLE and self._testMethodName in self.FAKE_FS_TESTS:
+                fs = request.getfixturevalue("fs")
+                self.test_dir = "/tmp/test"
+                fs.create_dir(self.test_dir)
+            else:
+                # Nettoyage pris en charge par pytest, en une passe en fin de session
+                self.test_dir = str(request.getfixturevalue("tmp_path"))
 
     def setUp(self):
-        """Configuration"""
-        self.test_dir = tempfile.mkdtemp()
-        self.project_root = os.path.dirname(os.path.dirname(__file__))
-        
-    def tearDown(self):
-        """Nettoyage"""
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+        super().setUp()
+        # Le fixture pytest a déjà fourni test_dir : rien à faire
+        if self.test_dir is None:
+            self.test_dir = tempfile.mkdtemp(prefix="bbs_cli_test_")
+            self.addCleanup(shutil.rmtree, self.test_dir, ignore_errors=True)
+
+
+class TestRealCliUsage(unittest.TestCase):
+    """Tests CLI avec les vrais composants, appelés dans le processus courant"""
+
+    def _run_cli(self, argv):
+        """Appelle main.main(argv) et retourne (code, stderr) ; stdout est jeté"""
+        stderr = io.StringIO()
+        # run_demo réécrit sys.argv : on protège celui du runner de tests
+        with open(os.devnull, "w") as devnull, \
+             mock.patch("sys.argv", ["main.py"] + list(argv)), \
+             contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(stderr):
+            try:
+                rc = cli_main(argv)
+            except SystemExit as e:
+                rc = e.code
+        return rc, stderr.getvalue()
             
     def test_main_help_command(self):
         """Test affichage aide main.py"""
-        cmd = [
-            sys.executable,
-            os.path.join(self.project_root, "main.py"), 
-            "--help"
-        ]
+        # L'aide argparse est déterminée par le parseur : rendu direct
+        out = build_parser().format_help()
         
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=10,
-                cwd=self.project_root
-            )
-            
-            # Vérifier que aide s'affiche
-            self.assertEqual(result.returncode, 0)
-            self.assertIn("usage:", result.stdout.lower())
-            
-            # Vérifier présence des commandes principales
-            expected_commands = ["demo", "benchmark", "travel"]
-            for cmd_name in expected_commands:
-                self.assertIn(cmd_name, result.stdout)
-                
-            print(" Main.py help command successful")
-            
-        except FileNotFoundError:
-            self.skipTest("main.py not found")
-        except Exception as e:
-            self.fail(f"Help command failed: {e}")
+        # Vérifier que aide s'affiche
+        self.assertIn("usage:", out.lower())
+        
+        # Vérifier présence des commandes principales
+        expected_commands = ["demo", "benchmark", "travel"]
+        for cmd_name in expected_commands:
+            self.assertIn(cmd_name, out)
             
     def test_demo_command_execution(self):
         """Test exécution commande demo"""
-        cmd = [
-            sys.executable,
-            os.path.join(self.project_root, "main.py"),
-            "demo",
-            "--no-optimization",
-            "--verbose"
-        ]
+        rc, err = self._run_cli(["demo", "--no-optimization", "--verbose"])
         
-        try:
-            # Exécuter avec timeout court
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                cwd=self.project_root
-            )
-            
-            # Vérifier que ça démarre sans crash Python
-            self.assertNotIn("Traceback", result.stderr)
-            
-            print(" Demo command executed without crash")
-            
-        except subprocess.TimeoutExpired:
-            print(" Demo command started (timed out as expected)")
-        except FileNotFoundError:
-            self.skipTest("main.py not found")
+        # Vérifier que ça tourne sans crash Python
+        self.assertEqual(rc, 0)
+        self.assertNotIn("Traceback", err)
             
     def test_benchmark_command_basic(self):
         """Test commande benchmark de base"""
-        cmd = [
-            sys.executable, 
-            os.path.join(self.project_root, "main.py"),
-            "benchmark",
-            "--no-optimization"
-        ]
+        # Le repli `python -m benchmark.runner` lance la campagne complète :
+        # on intercepte le sous-processus, seul le chemin CLI est testé ici
+        completed = subprocess.CompletedProcess(args=[], returncode=0)
+        with mock.patch("subprocess.run", return_value=completed):
+            rc, err = self._run_cli(["benchmark", "--no-optimization"])
         
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=20,
-                cwd=self.project_root
-            )
-            
-            # Pas de crash Python
-            self.assertNotIn("Traceback", result.stderr)
-            
-            print(" Benchmark command executed")
-            
-        except subprocess.TimeoutExpired:
-            print(" Benchmark command started")  
-        except FileNotFoundError:
-            self.skipTest("main.py not found")
+        # Pas de crash Python
+        self.assertEqual(rc, 0)
+        self.assertNotIn("Traceback", err)
 
 
-class TestRealConfigHandling(unittest.TestCase):
+class TestRealConfigHandling(_TmpDirMixin, unittest.TestCase):
     """Tests avec vrais fichiers de configuration"""
     
-    def setUp(self):
-        """Configuration"""
-        self.test_dir = tempfile.mkdtemp()
-        
-    def tearDown(self):
-        """Nettoyage"""
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+    # Écriture/lecture de config seule : aucun accès au disque nécessaire.
+    # Le profil réel est lu depuis benchmark/data et reste sur le vrai disque
+    FAKE_FS_TESTS = frozenset({"test_create_real_config"})
             
     def test_create_real_config(self):
         """Test création configuration réelle"""
@@ -150,44 +191,24 @@ class TestRealConfigHandling(unittest.TestCase):
             }
         }
         
-        config_file = os.path.join(self.test_dir, "real_benchmark_config.json")
-        
-        with open(config_file, 'w') as f:
-            json.dump(config_data, f, indent=2)
+        config_file = Path(self.test_dir) / "real_benchmark_config.json"
+        config_file.write_bytes(_dump_json_bytes(config_data))
             
         # Vérifier fichier créé et valide
-        self.assertTrue(os.path.exists(config_file))
+        self.assertTrue(config_file.exists())
         
-        with open(config_file, 'r') as f:
-            loaded_config = json.load(f)
+        loaded_config = _load_json_bytes(config_file.read_bytes())
             
         self.assertEqual(loaded_config["benchmark_settings"]["max_attributes"], 20)
-        print(" Configuration réelle créée")
         
     def test_real_data_profile_creation(self):
         """Test création profil avec vraies données"""
-        from benchmark.data.manager import DataManager
-        
         try:
-            data_manager = DataManager()
-            
             # Essayer de charger profil existant
-            profile_data = data_manager.load_person_data("ellen_kampire_dtc")
-            
-            # Sauvegarder une copie pour test
-            test_profile_file = os.path.join(self.test_dir, "test_profile.json")
-            
-            with open(test_profile_file, 'w') as f:
-                json.dump(profile_data, f, indent=2)
-                
-            # Vérifier
-            self.assertTrue(os.path.exists(test_profile_file))
+            profile_data = _cached_profile("ellen_kampire_dtc")
             
-            with open(test_profile_file, 'r') as f:
-                loaded_profile = json.load(f)
-                
-            self.assertIn("given_names", loaded_profile)
-            print(" Profil réel créé")
+            # Vérifier directement le profil chargé (pas d'aller-retour disque)
+            self.assertIn("given_names", profile_data)
             
         except Exception as e:
             self.skipTest(f"DataManager non disponible: {e}")
@@ -195,61 +216,51 @@ class TestRealConfigHandling(unittest.TestCase):
 
 class TestErrorHandling(unittest.TestCase):
     """Tests gestion d'erreurs réelles"""
-    
-    def setUp(self):
-        """Configuration"""
-        self.test_dir = tempfile.mkdtemp()
-        self.project_root = os.path.dirname(os.path.dirname(__file__))
+            
+    def _run_cli_batch(self, argv_list):
+        """
+        Exécute plusieurs appels CLI dans un seul interpréteur isolé
         
-    def tearDown(self):
-        """Nettoyage"""
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+        Retourne une entrée {"rc", "traceback"} par argv, dans l'ordre.
+        """
+        result = subprocess.run(
+            [sys.executable, "-c", _CLI_BATCH_DRIVER, json.dumps(argv_list)],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            cwd=PROJECT_ROOT
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return json.loads(result.stdout)
             
     def test_invalid_command_handling(self):
         """Test gestion commande invalide"""
-        cmd = [
-            sys.executable,
-            os.path.join(self.project_root, "main.py"),
-            "invalid_command"
+        invalid_argvs = [
+            ["invalid_command"],
+            [],  # commande manquante
         ]
         
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=5,
-                cwd=self.project_root
-            )
-            
-            # Doit échouer proprement
-            self.assertNotEqual(result.returncode, 0)
-            self.assertNotIn("Traceback", result.stderr)
-            
-            print(" Commande invalide gérée correctement")
-            
-        except FileNotFoundError:
-            self.skipTest("main.py not found")
+        results = self._run_cli_batch(invalid_argvs)
+        self.assertEqual(len(results), len(invalid_argvs))
+        
+        for argv, res in zip(invalid_argvs, results):
+            with self.subTest(argv=argv):
+                # Doit échouer proprement
+                self.assertNotEqual(res["rc"], 0)
+                self.assertFalse(res["traceback"])
             
     def test_missing_file_error(self):
         """Test erreur fichier manquant"""
-        # Créer fichier de config corrompu
-        corrupted_file = os.path.join(self.test_dir, "corrupted.json")
-        
-        with open(corrupted_file, 'w') as f:
-            f.write('{"invalid": "json", missing bracket')
-            
-        # Tenter de charger
+        # Contenu de config corrompu : le décodage seul est testé, en mémoire
         with self.assertRaises(json.JSONDecodeError):
-            with open(corrupted_file, 'r') as f:
-                json.load(f)
-                
-        print(" Détection fichier corrompu fonctionnelle")
+            json.loads('{"invalid": "json", missing bracket')
 
 
 if __name__ == '__main__':
-    print("🖥️  TESTING REAL BBS-DTC CLI FUNCTIONALITY")
-    print("=" * 60)
-    
-    unittest.main(verbosity=2, buffer=True)
\ No newline at end of file
+    # Sous pytest (tmp_path, pyfakefs) si disponible : --ff lance d'abord les
+    # échecs précédents, mais exécute toujours tous les tests. Sinon unittest
+    # classique (répertoires temporaires créés par _TmpDirMixin.setUp)
+    if PYTEST_AVAILABLE:
+        sys.exit(pytest.main([__file__, "-q", "--ff"]))
+    else:
+        unittest.main(verbosity=2)
\ No newline at end of file
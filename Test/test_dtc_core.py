@@ -9,8 +9,11 @@ un système de credentials de voyage avec divulgation sélective :
 - Rejet des credentials invalides
 """
 
+import sys
+import copy
 import unittest
 import json
+from unittest import mock
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional
 
@@ -22,95 +25,113 @@ from DTC.dtc import (
     create_passport_credential, create_visa_credential, create_vaccination_credential
 )
 from DTC.DTCIssuer import DTCIssuer, create_test_issuer
-from DTC.DTCHolder import DTCHolder, create_test_holder
+from DTC.DTCHolder import DTCHolder, CredentialStore, create_test_holder, _disclosure_plan
 from DTC.DTCVerifier import DTCVerifier, create_test_verifier
 
 
+# Émetteurs de test partagés par toutes les classes du module : les
+# identifiants doivent seulement être distincts, les clés BBS ne sont
+# générées qu'une fois par nom et par processus
+_ISSUER_POOL: Dict[str, DTCIssuer] = {}
+
+
+def _pooled_issuer(issuer_id: str) -> DTCIssuer:
+    """Retourne l'émetteur de test `issuer_id` en le créant une seule fois"""
+    if issuer_id not in _ISSUER_POOL:
+        _ISSUER_POOL[issuer_id] = create_test_issuer(issuer_id)
+    return _ISSUER_POOL[issuer_id]
+
+
 class TestIssuerSchemaCompliance(unittest.TestCase):
     """Tests pour la conformité des schémas par les émetteurs DTC"""
 
+    # Données conformes à chaque schéma
+    PASSPORT_DATA = {
+        "document_type": "passport",
+        "document_number": "123456789",
+        "nationality": "FR",
+        "given_names": "Jean Pierre",
+        "surname": "Dupont",
+        "date_of_birth": "1985-03-15",
+        "place_of_birth": "Paris, France",
+        "date_of_issue": "2020-01-01",
+        "date_of_expiry": "2030-01-01",
+        "issuing_authority": "République Française"
+    }
+    
+    VISA_DATA = {
+        "document_type": "visa",
+        "visa_number": "USA2023001",
+        "visa_type": "B1/B2",
+        "nationality": "FR",
+        "given_names": "Marie",
+        "surname": "Martin",
+        "date_of_birth": "1990-07-22",
+        "date_of_issue": "2023-01-15",
+        "date_of_expiry": "2024-01-15",
+        "issuing_authority": "US Embassy Paris",
+        "destination_country": "USA"
+    }
+    
+    VACCINATION_DATA = {
+        "document_type": "vaccination_certificate",
+        "certificate_id": "VAC2023FR001",
+        "given_names": "Sophie",
+        "surname": "Leclerc",
+        "date_of_birth": "1988-11-03",
+        "vaccination_details": {
+            "vaccine_name": "COVID-19 mRNA",
+            "manufacturer": "Pfizer-BioNTech",
+            "doses": [
+                {"date": "2021-05-01", "batch": "ABC123"},
+                {"date": "2021-06-15", "batch": "DEF456"}
+            ]
+        },
+        "issuing_authority": "French Health Ministry"
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        """Émetteur partagé et credentials des trois schémas émis en un seul lot"""
+        cls._issuer = _pooled_issuer("TEST_GOV_001")
+        
+        requests = [
+            ("passport", cls.PASSPORT_DATA),
+            ("visa", cls.VISA_DATA),
+            ("vaccination", cls.VACCINATION_DATA),
+        ]
+        issued = cls._issuer.issue_batch(requests)
+        cls._issued = {kind: cred for (kind, _), cred in zip(requests, issued)}
+
     def setUp(self):
         """Configuration initiale"""
-        self.issuer = create_test_issuer("TEST_GOV_001")
-        
-    def test_passport_schema_compliance(self):
-        """Test conformité schéma passeport"""
-        # Créer credential conforme au schéma passeport
-        passport_data = {
-            "document_type": "passport",
-            "document_number": "123456789",
-            "nationality": "FR",
-            "given_names": "Jean Pierre",
-            "surname": "Dupont",
-            "date_of_birth": "1985-03-15",
-            "place_of_birth": "Paris, France",
-            "date_of_issue": "2020-01-01",
-            "date_of_expiry": "2030-01-01",
-            "issuing_authority": "République Française"
-        }
-        
-        # Émettre le credential
-        passport_cred = self.issuer.issue_passport(passport_data)
-        
-        # Vérifier conformité
-        self.assertIsInstance(passport_cred, PassportCredential)
-        self.assertEqual(passport_cred.document_type, DocumentType.PASSPORT)
-        self.assertEqual(passport_cred.get_attribute("nationality").value, "FR")
-        self.assertEqual(passport_cred.get_attribute("document_number").value, "123456789")
-        
-        # Vérifier signature BBS
-        self.assertIsNotNone(passport_cred.signature)
-        
-    def test_visa_schema_compliance(self):
-        """Test conformité schéma visa"""
-        visa_data = {
-            "document_type": "visa",
-            "visa_number": "USA2023001",
-            "visa_type": "B1/B2",
-            "nationality": "FR",
-            "given_names": "Marie",
-            "surname": "Martin",
-            "date_of_birth": "1990-07-22",
-            "date_of_issue": "2023-01-15",
-            "date_of_expiry": "2024-01-15",
-            "issuing_authority": "US Embassy Paris",
-            "destination_country": "USA"
-        }
-        
-        visa_cred = self.issuer.issue_visa(visa_data)
-        
-        # Vérifier conformité
-        self.assertIsInstance(visa_cred, VisaCredential)
-        self.assertEqual(visa_cred.document_type, DocumentType.VISA)
-        self.assertEqual(visa_cred.get_attribute("destination_country").value, "USA")
-        self.assertEqual(visa_cred.get_attribute("visa_type").value, "B1/B2")
-        
-    def test_vaccination_schema_compliance(self):
-        """Test conformité schéma vaccination"""
-        vacc_data = {
-            "document_type": "vaccination_certificate",
-            "certificate_id": "VAC2023FR001",
-            "given_names": "Sophie",
-            "surname": "Leclerc",
-            "date_of_birth": "1988-11-03",
-            "vaccination_details": {
-                "vaccine_name": "COVID-19 mRNA",
-                "manufacturer": "Pfizer-BioNTech",
-                "doses": [
-                    {"date": "2021-05-01", "batch": "ABC123"},
-                    {"date": "2021-06-15", "batch": "DEF456"}
-                ]
-            },
-            "issuing_authority": "French Health Ministry"
-        }
-        
-        vacc_cred = self.issuer.issue_vaccination(vacc_data)
-        
-        # Vérifier conformité
-        self.assertIsInstance(vacc_cred, VaccinationCredential)
-        self.assertEqual(vacc_cred.document_type, DocumentType.VACCINATION_CERTIFICATE)
-        self.assertEqual(vacc_cred.get_attribute("certificate_id").value, "VAC2023FR001")
-        
+        self.issuer = self._issuer
+        
+    def test_schema_compliance(self):
+        """Test conformité des schémas passeport, visa et vaccination"""
+        # (nom, classe attendue, membre DocumentType, attributs attendus)
+        cases = [
+            ("passport", PassportCredential, "PASSPORT",
+             {"nationality": "FR", "document_number": "123456789"}),
+            ("visa", VisaCredential, "VISA",
+             {"destination_country": "USA", "visa_type": "B1/B2"}),
+            ("vaccination", VaccinationCredential, "VACCINATION_CERTIFICATE",
+             {"certificate_id": "VAC2023FR001"}),
+        ]
+        
+        for name, cred_cls, doc_type, expected_attrs in cases:
+            with self.subTest(schema=name):
+                cred = self._issued[name]
+                
+                # Vérifier conformité
+                self.assertIsInstance(cred, cred_cls)
+                self.assertEqual(cred.document_type, DocumentType[doc_type])
+                for attr_name, value in expected_attrs.items():
+                    self.assertEqual(cred.get_attribute(attr_name).value, value)
+                
+                # Vérifier signature BBS
+                self.assertIsNotNone(cred.signature)
+            
     def test_invalid_schema_rejection(self):
         """Test rejet de données non conformes au schéma"""
         # Données passeport manquantes
@@ -120,9 +141,32 @@ class TestIssuerSchemaCompliance(unittest.TestCase):
             # Manque les champs obligatoires
         }
         
+        # Contrôle du schéma seul, sans passer par l'émetteur
+        self.assertFalse(PASSPORT_SCHEMA.validate_attributes(incomplete_data))
+        
+        # issue_passport échoue sur le mappage des données, avant toute signature BBS
         with self.assertRaises((ValueError, KeyError)):
             self.issuer.issue_passport(incomplete_data)
             
+    def test_batch_check_failure(self):
+        """Test échec du contrôle groupé d'issue_batch : repli signature par signature"""
+        requests = [("passport", self.PASSPORT_DATA)]
+        batch_verify = self.issuer.bbs.sign_scheme.batch_verify
+        
+        # Contrôle groupé en échec mais signatures valides une à une : émission conservée
+        with mock.patch.object(self.issuer.bbs.sign_scheme, "batch_verify", return_value=False):
+            issued = self.issuer.issue_batch(requests)
+        self.assertEqual(len(issued), 1)
+        self.assertTrue(batch_verify([(self.issuer.public_key, issued[0].signature,
+                                       issued[0].to_message_list(),
+                                       self.issuer._header(DocumentType.PASSPORT))]))
+        
+        # Signature invalide au repli : le credential fautif est signalé
+        with mock.patch.object(self.issuer.bbs.sign_scheme, "batch_verify", return_value=False), \
+                mock.patch.object(self.issuer.bbs, "verify", return_value=False):
+            with self.assertRaisesRegex(ValueError, "Invalid BBS signature"):
+                self.issuer.issue_batch(requests)
+            
     def test_issuer_key_management(self):
         """Test gestion des clés par l'émetteur"""
         # Vérifier que l'émetteur a des clés BBS
@@ -145,13 +189,14 @@ class TestIssuerSchemaCompliance(unittest.TestCase):
 class TestHolderStoreRetrieve(unittest.TestCase):
     """Tests pour stockage et récupération par les détenteurs"""
 
-    def setUp(self):
-        """Configuration initiale"""
-        self.holder = create_test_holder("alice_test")
-        self.issuer = create_test_issuer("TEST_ISSUER")
-        
-        # Créer quelques credentials de test
-        self.passport_cred = self.issuer.issue_passport({
+    @classmethod
+    def setUpClass(cls):
+        """Émetteur, détenteur et credentials signés partagés par la classe"""
+        cls._issuer = _pooled_issuer("TEST_ISSUER")
+        cls._holder = create_test_holder("alice_test")
+        
+        # Créer quelques credentials de test (non modifiés après signature)
+        cls._passport_cred = cls._issuer.issue_passport({
             "document_type": "passport",
             "document_number": "FR123456",
             "nationality": "FR",
@@ -164,7 +209,7 @@ class TestHolderStoreRetrieve(unittest.TestCase):
             "issuing_authority": "République Française"
         })
         
-        self.visa_cred = self.issuer.issue_visa({
+        cls._visa_cred = cls._issuer.issue_visa({
             "document_type": "visa",
             "visa_number": "US2023001",
             "visa_type": "tourist",
@@ -177,6 +222,15 @@ class TestHolderStoreRetrieve(unittest.TestCase):
             "issuing_authority": "US Embassy",
             "destination_country": "USA"
         })
+
+    def setUp(self):
+        """Configuration initiale"""
+        # Seul le portefeuille est mutable : il est vidé à chaque test
+        self.holder = self._holder
+        self.holder.credentials = CredentialStore()
+        self.issuer = self._issuer
+        self.passport_cred = self._passport_cred
+        self.visa_cred = self._visa_cred
         
     def test_store_credentials(self):
         """Test stockage des credentials"""
@@ -190,7 +244,66 @@ class TestHolderStoreRetrieve(unittest.TestCase):
         # Stocker visa
         self.holder.store_credential(self.visa_cred)
         self.assertEqual(len(self.holder.credentials), 2)
-        
+
+    def test_credential_store_mapping(self):
+        """Test du portefeuille CredentialStore (accès de type dict)"""
+        store = self.holder.credentials
+        self.assertIsInstance(store, CredentialStore)
+
+        self.holder.store_credential("passport", self.passport_cred)
+        store["visa"] = self.visa_cred
+        self.assertEqual(len(store), 2)
+        self.assertIs(store["passport"], self.passport_cred)
+        self.assertIsNone(store.get("missing"))
+        self.assertEqual(dict(store), {"passport": self.passport_cred, "visa": self.visa_cred})
+
+        self.assertTrue(self.holder.remove_credential("visa"))
+        self.assertNotIn("visa", store)
+
+        # Pas de __dict__ par instance
+        with self.assertRaises(AttributeError):
+            store.extra = True
+
+    def test_export_import_roundtrip(self):
+        """Test export puis import du portefeuille (forme dict, sans double encodage)"""
+        self.holder.store_credential("passport", self.passport_cred)
+        exported = self.holder.export_credentials_json()
+
+        restored = create_test_holder("restored")
+        self.assertEqual(restored.import_credentials_json(exported), 1)
+
+        cred = restored.get_credential("passport")
+        self.assertEqual(cred.to_message_list(), self.passport_cred.to_message_list())
+        self.assertEqual(cred.signature_bytes, self.passport_cred.signature_bytes)
+        self.assertEqual(json.loads(exported)["credentials"]["passport"], self.passport_cred.to_dict())
+
+    def test_disclosure_plan_matches_credential(self):
+        """Test plan de divulgation mémoïsé identique aux indices du credential"""
+        # Credential sans date d'expiration : disposition des messages décalée
+        no_expiry = copy.copy(self.passport_cred)
+        no_expiry.expires_at = None
+        cases = [
+            (self.passport_cred, [["nationality", "holder_name"], [], ["date_of_birth", "nationality"]]),
+            (self.visa_cred, [["visa_type", "valid_until"], ["holder_name"]]),
+            (no_expiry, [["nationality", "holder_name"]]),
+        ]
+        
+        for cred, requests in cases:
+            layout = tuple(sorted(cred.get_attribute_indices_map().items()))
+            for attrs in requests:
+                with self.subTest(document=cred.document_type.value, expiry=bool(cred.expires_at), attributes=attrs):
+                    plan, missing = _disclosure_plan(layout, tuple(attrs))
+                    self.assertEqual(list(plan), cred.select_attributes_for_disclosure(attrs))
+                    self.assertEqual(missing, ())
+        
+        # Même forme redemandée : servie par le cache ; attribut inconnu signalé
+        layout = tuple(sorted(self.passport_cred.get_attribute_indices_map().items()))
+        hits = _disclosure_plan.cache_info().hits
+        _disclosure_plan(layout, ("nationality", "holder_name"))
+        self.assertEqual(_disclosure_plan.cache_info().hits, hits + 1)
+        _, missing = _disclosure_plan(layout, ("unknown",))
+        self.assertEqual(missing, ("unknown",))
+
     def test_retrieve_by_type(self):
         """Test récupération par type de document"""
         # Stocker les deux
@@ -264,17 +377,18 @@ class TestHolderStoreRetrieve(unittest.TestCase):
 class TestVerifierAcceptsValid(unittest.TestCase):
     """Tests pour acceptance des credentials valides par les vérificateurs"""
 
-    def setUp(self):
-        """Configuration initiale"""
-        self.verifier = create_test_verifier("BORDER_CONTROL")
-        self.issuer = create_test_issuer("TRUSTED_GOV")
-        self.holder = create_test_holder("traveler")
-        
+    @classmethod
+    def setUpClass(cls):
+        """Vérificateur, émetteur, détenteur et passeport partagés par la classe"""
+        cls._verifier = create_test_verifier("BORDER_CONTROL")
+        cls._issuer = _pooled_issuer("TRUSTED_GOV")
+        cls._holder = create_test_holder("traveler")
+
         # Ajouter l'émetteur comme fiable
-        self.verifier.add_trusted_issuer("TRUSTED_GOV", self.issuer.public_key)
+        cls._verifier.add_trusted_issuer("TRUSTED_GOV", cls._issuer.public_key)
         
         # Créer et signer un credential valide
-        self.valid_passport = self.issuer.issue_passport({
+        cls._valid_passport = cls._issuer.issue_passport({
             "document_type": "passport",
             "document_number": "VALID123",
             "nationality": "FR",
@@ -287,7 +401,16 @@ class TestVerifierAcceptsValid(unittest.TestCase):
             "issuing_authority": "République Française"
         })
         
-        self.holder.store_credential(self.valid_passport)
+        # Contenu initial du portefeuille, restauré avant chaque test
+        cls._wallet_snapshot = {cls._valid_passport.credential_id: cls._valid_passport}
+
+    def setUp(self):
+        """Configuration initiale"""
+        self.verifier = self._verifier
+        self.issuer = self._issuer
+        self.valid_passport = self._valid_passport
+        self.holder = self._holder
+        self.holder.credentials = CredentialStore(self._wallet_snapshot)
         
     def test_verify_complete_credential(self):
         """Test vérification d'un credential complet"""
@@ -376,23 +499,122 @@ class TestVerifierAcceptsValid(unittest.TestCase):
         
         result = self.verifier.verify_presentation(combined_presentation)
         self.assertTrue(result.is_valid)
+        
+    def test_verification_cache(self):
+        """Test mémoïsation des vérifications de présentation"""
+        # Vérificateur dédié : le cache ne doit pas fuir vers les autres tests
+        verifier = create_test_verifier("CACHED_VERIFIER")
+        verifier.add_trusted_issuer("TRUSTED_GOV", self.issuer.public_key)
+        verifier.enable_cache = True
+        
+        proof, messages, indices = self.holder.create_presentation(
+            self.valid_passport.credential_id, self.issuer.public_key, ["nationality"]
+        )
+        
+        proof_bytes = proof.to_bytes()
+        first = verifier.verify_presentation(proof, messages, indices)
+        second = verifier.verify_presentation(proof, messages, indices)
+        self.assertTrue(first["valid"])
+        self.assertEqual((verifier.cache_hits, verifier.cache_misses), (1, 1))
+        
+        # Résultat mémoïsé identique, horodatage rafraîchi à chaque hit
+        first_timestamp = first.pop("verification_timestamp")
+        second_timestamp = second.pop("verification_timestamp")
+        self.assertEqual(first, second)
+        self.assertGreaterEqual(second_timestamp, first_timestamp)
+        third = verifier.verify_presentation(proof, messages, indices)
+        self.assertGreaterEqual(third["verification_timestamp"], second_timestamp)
+        self.assertEqual((verifier.cache_hits, verifier.cache_misses), (2, 1))
+        
+        # Vérification pure : preuve inchangée, sérialisation mémoïsée réutilisée
+        self.assertEqual(proof.to_bytes(), proof_bytes)
+        self.assertIs(proof.canonical_bytes, proof.canonical_bytes)
+        
+        # Champ de la preuve réaffecté : mémo invalidé, nouvelle clé et rejet
+        forged = copy.copy(proof)
+        forged.e_hat = proof.e_hat + 1
+        self.assertNotEqual(forged.canonical_bytes, proof.canonical_bytes)
+        self.assertFalse(verifier.verify_presentation(forged, messages, indices)["valid"])
+        self.assertEqual((verifier.cache_hits, verifier.cache_misses), (2, 2))
+        
+        # Message révélé modifié : nouvelle clé, vérification complète et rejet
+        tampered = list(messages)
+        tampered[-1] = b"nationality:string:HACKED"
+        self.assertFalse(verifier.verify_presentation(proof, tampered, indices)["valid"])
+        self.assertEqual((verifier.cache_hits, verifier.cache_misses), (2, 3))
+        
+        # Message révélé en trop : jamais servi depuis l'entrée de la présentation valide
+        extra = list(messages) + [b"admin:string:true"]
+        self.assertFalse(verifier.verify_presentation(proof, extra, indices)["valid"])
+        self.assertFalse(verifier.verify_presentation(proof, extra, indices)["valid"])
+        self.assertEqual(verifier.cache_hits, 2)
+        self.assertNotEqual(verifier._presentation_key(proof, extra, indices, b"", None),
+                            verifier._presentation_key(proof, messages, indices, b"", None))
+
+    def test_verify_batch(self):
+        """Test vérification groupée de plusieurs présentations"""
+        presentations = [
+            self.holder.create_presentation(
+                self.valid_passport.credential_id, self.issuer.public_key, attrs
+            )
+            for attrs in (["nationality"], ["surname"])
+        ]
+
+        results = self.verifier.verify_batch(presentations)
+        self.assertEqual([r["valid"] for r in results], [True, True])
+        self.assertEqual(
+            results[0]["revealed_attributes"],
+            self.verifier.verify_presentation(*presentations[0])["revealed_attributes"]
+        )
+
+        # Une preuve invalide dans le lot : seule celle-ci est rejetée
+        proof, messages, indices = presentations[1]
+        results = self.verifier.verify_batch([presentations[0], (proof, messages, indices, b"other")])
+        self.assertEqual([r["valid"] for r in results], [True, False])
+
+    def test_verify_combined_presentation(self):
+        """Test vérification combinée de présentations de deux émetteurs"""
+        other_issuer = _pooled_issuer("OTHER_GOV")
+        verifier = create_test_verifier("COMBINED_VERIFIER")
+        verifier.add_trusted_issuer("TRUSTED_GOV", self.issuer.public_key)
+        verifier.add_trusted_issuer("OTHER_GOV", other_issuer.public_key)
+        self.holder.store_credential("other_passport", other_issuer.issue_passport(
+            dict(TestIssuerSchemaCompliance.PASSPORT_DATA)
+        ))
+
+        passport = self.holder.create_presentation(
+            self.valid_passport.credential_id, self.issuer.public_key, ["nationality"]
+        )
+        other = self.holder.create_presentation(
+            "other_passport", other_issuer.public_key, ["surname"]
+        )
+
+        combined = verifier.verify_combined_presentation([passport, other])
+        self.assertTrue(combined["valid"])
+        self.assertEqual([r["valid"] for r in combined["results"]], [True, True])
+
+        # Une présentation rejouée avec un autre en-tête invalide l'ensemble
+        combined = verifier.verify_combined_presentation([passport, (*other, b"other")])
+        self.assertFalse(combined["valid"])
+        self.assertEqual([r["valid"] for r in combined["results"]], [True, False])
 
 
 class TestVerifierRejectsInvalid(unittest.TestCase):
     """Tests pour rejet des credentials invalides"""
 
-    def setUp(self):
-        """Configuration initiale"""
-        self.verifier = create_test_verifier("STRICT_VERIFIER")
-        self.trusted_issuer = create_test_issuer("TRUSTED")
-        self.untrusted_issuer = create_test_issuer("UNTRUSTED")
-        self.holder = create_test_holder("test_holder")
+    @classmethod
+    def setUpClass(cls):
+        """Vérificateur, émetteurs et credentials partagés par la classe"""
+        cls._verifier = create_test_verifier("STRICT_VERIFIER")
+        cls._trusted_issuer = _pooled_issuer("TRUSTED")
+        cls._untrusted_issuer = _pooled_issuer("UNTRUSTED")
+        cls._holder = create_test_holder("test_holder")
         
         # Seul TRUSTED est ajouté comme fiable
-        self.verifier.add_trusted_issuer("TRUSTED", self.trusted_issuer.public_key)
+        cls._verifier.add_trusted_issuer("TRUSTED", cls._trusted_issuer.public_key)
         
         # Credentials pour les tests
-        self.trusted_cred = self.trusted_issuer.issue_passport({
+        cls._trusted_cred = cls._trusted_issuer.issue_passport({
             "document_type": "passport",
             "document_number": "TRUSTED123",
             "nationality": "FR",
@@ -405,7 +627,7 @@ class TestVerifierRejectsInvalid(unittest.TestCase):
             "issuing_authority": "Trusted Authority"
         })
         
-        self.untrusted_cred = self.untrusted_issuer.issue_passport({
+        cls._untrusted_cred = cls._untrusted_issuer.issue_passport({
             "document_type": "passport",
             "document_number": "UNTRUSTED123",
             "nationality": "XX",
@@ -417,9 +639,23 @@ class TestVerifierRejectsInvalid(unittest.TestCase):
             "date_of_expiry": "2030-01-01",
             "issuing_authority": "Unknown Authority"
         })
-        
-        self.holder.store_credential(self.trusted_cred)
-        self.holder.store_credential(self.untrusted_cred)
+
+    def setUp(self):
+        """Configuration initiale"""
+        # Copie légère du vérificateur : certains tests modifient ses exigences,
+        # le contexte BBS et les clés fiables restent partagés
+        self.verifier = copy.copy(self._verifier)
+        self.verifier.trusted_issuers = dict(self._verifier.trusted_issuers)
+        self.trusted_issuer = self._trusted_issuer
+        self.untrusted_issuer = self._untrusted_issuer
+        self.trusted_cred = self._trusted_cred
+        self.untrusted_cred = self._untrusted_cred
+        
+        # Seul le portefeuille est réinitialisé à chaque test
+        self.holder = self._holder
+        self.holder.credentials = CredentialStore()
+        self.holder.store_credential(self.trusted_cred.credential_id, self.trusted_cred)
+        self.holder.store_credential(self.untrusted_cred.credential_id, self.untrusted_cred)
         
     def test_reject_untrusted_issuer(self):
         """Test rejet credential d'émetteur non fiable"""
@@ -433,17 +669,20 @@ class TestVerifierRejectsInvalid(unittest.TestCase):
         
     def test_reject_tampered_credential(self):
         """Test rejet credential altéré"""
-        # Altérer le credential
-        tampered_cred = self.trusted_cred.copy()
-        tampered_cred.attributes["nationality"].value = "HACKED"
+        # Présentation générée à partir du credential intact
+        proof, messages, indices = self.holder.create_presentation(
+            self.trusted_cred.credential_id, self.trusted_issuer.public_key, ["nationality"]
+        )
+        self.assertTrue(self.verifier.verify_presentation(proof, messages, indices)["valid"])
         
-        # Stocker le credential altéré
-        self.holder.credentials[tampered_cred.credential_id] = tampered_cred
+        # Altérer la valeur révélée après génération de la preuve :
+        # la preuve BBS ne correspond plus aux messages divulgués
+        tampered = list(messages)
+        tampered[-1] = b"HACKED"
         
-        presentation = self.holder.create_full_presentation(tampered_cred.credential_id)
-        result = self.verifier.verify_presentation(presentation)
+        result = self.verifier.verify_presentation(proof, tampered, indices)
         
-        self.assertFalse(result.is_valid)
+        self.assertFalse(result["valid"])
         
     def test_reject_expired_credential(self):
         """Test rejet credential expiré"""
@@ -508,4 +747,12 @@ class TestVerifierRejectsInvalid(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    unittest.main(verbosity=2, buffer=True)
\ No newline at end of file
+    # Les quatre classes sont indépendantes : exécution parallèle si
+    # pytest-xdist est disponible, sinon exécution unittest classique
+    try:
+        import pytest
+        import xdist  # noqa: F401
+    except ImportError:
+        unittest.main(verbosity=2)
+    else:
+        sys.exit(pytest.main([__file__, "-q", "--ff", "-n", "auto", "--dist", "loadgroup"]))
\ No newline at end of file
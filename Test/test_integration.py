@@ -9,25 +9,159 @@ Ces tests vérifient le fonctionnement end-to-end du système :
 """
 
 import unittest
-import json
+import importlib.util
 import os
-import tempfile
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional
 
 # Import des modules principaux
-from DTC import DTCIssuer, DTCHolder, DTCVerifier, create_demo_scenario
-from Demo.dtc_complete import main as demo_main
-from Demo.demo_travel import main as travel_main
+from BBSCore.bbsSign import BBSSignature
+from DTC import DTCIssuer, DTCHolder, DTCVerifier, CredentialStore, create_demo_scenario
 from benchmark.data.manager import DataManager
 
+from Test._fixtures.workers import pool_workers
+
+
+# Pool de processus partagé par le module : la signature BBS est du calcul
+# pur Python (entiers longs, GIL), indépendant d'un credential à l'autre.
+# Taille bornée par pool_workers (cœurs répartis entre workers xdist)
+_POOL = None
+
+
+def _pool() -> ProcessPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=pool_workers())
+    return _POOL
+
+
+def _call(job):
+    fn, arg = job
+    return fn(arg)
+
+
+def _run_jobs(jobs: List[tuple]) -> List[Any]:
+    """
+    Exécute des appels (fonction, argument) en parallèle, résultats dans l'ordre
+    
+    Séquentiel pour un seul appel ou quand un seul processus est disponible
+    (machine mono-cœur, cœurs déjà occupés par les workers xdist), où le
+    pool n'apporterait que le coût de sérialisation.
+    """
+    if len(jobs) < 2 or pool_workers() < 2:
+        return [_call(job) for job in jobs]
+    return list(_pool().map(_call, jobs))
+
+
+# Durée minimale cumulée d'une série de mesures (50 ms)
+MIN_SAMPLE_NS = 50_000_000
+
+
+def _sample_ns(fn, arg, min_total_ns: int = MIN_SAMPLE_NS):
+    """
+    Répète fn(arg) jusqu'à cumuler min_total_ns (au moins un appel)
+    
+    Retourne les durées individuelles en nanosecondes et le dernier résultat.
+    """
+    samples = []
+    result = None
+    while not samples or sum(samples) < min_total_ns:
+        start_ns = time.perf_counter_ns()
+        result = fn(arg)
+        samples.append(time.perf_counter_ns() - start_ns)
+    return samples, result
+
+
+def _percentile(samples: List[int], pct: int) -> int:
+    """Percentile par rang le plus proche"""
+    ordered = sorted(samples)
+    rank = max(0, -(-pct * len(ordered) // 100) - 1)
+    return ordered[rank]
+
+
+def _sample_metrics(prefix: str, samples: List[int]) -> Dict[str, Any]:
+    """
+    Métriques d'une série de mesures (nanosecondes), clés préfixées
+    
+    Les percentiles ne sont enregistrés qu'à partir de deux mesures : sur
+    une seule, ils ne feraient que répéter la moyenne.
+    """
+    metrics = {
+        f'{prefix}_samples': len(samples),
+        f'{prefix}_time_ns': statistics.mean(samples),
+        f'{prefix}_throughput': len(samples) / (sum(samples) / 1e9),
+    }
+    if len(samples) >= 2:
+        metrics[f'{prefix}_p50_ns'] = statistics.median(samples)
+        metrics[f'{prefix}_p95_ns'] = _percentile(samples, 95)
+    return metrics
+
+
+def _disclosed_values(presentations: List[tuple]) -> Dict[str, str]:
+    """
+    Valeurs révélées {nom: valeur} d'un ensemble de présentations
+    
+    Lues dans les messages divulgués ("nom:valeur" ou "nom:type:valeur"),
+    seule information transmise au vérificateur en clair.
+    """
+    values = {}
+    for _, disclosed_messages, _ in presentations:
+        for msg in disclosed_messages:
+            name, _, value = msg.decode("utf-8").partition(":")
+            values[name] = value.split(":", 1)[-1]
+    return values
+
+
+# Émetteurs de create_demo_scenario : tous les vérificateurs du module
+# partagent leurs tables de générateurs
+DEMO_ISSUER_IDS = ["FR_GOV_001", "US_EMBASSY_FR", "FR_HEALTH_MIN"]
+
+
+# Profils de benchmark lus une seule fois par setUpModule (nom -> profil)
+PROFILES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "benchmark", "data", "custom")
+BENCHMARK_PROFILES = ("ellen_kampire_dtc", "benoit_koleu_dtc", "berissa_kawaya_dtc")
+_PROFILES: Dict[str, Any] = {}
+_PROFILES_ERROR: Optional[Exception] = None
+
+
+def _preload_profiles():
+    """Charge les profils ; une erreur est conservée pour les seuls tests qui les lisent"""
+    global _PROFILES_ERROR
+    data_manager = DataManager(PROFILES_DIR)
+    try:
+        for name in BENCHMARK_PROFILES:
+            _PROFILES[name] = data_manager.load_profile(name)
+    except Exception as e:
+        _PROFILES_ERROR = e
+
+
+def setUpModule():
+    # Tables comb des générateurs construites une fois pour tout le module
+    DTCVerifier.precompute_generator_tables(DEMO_ISSUER_IDS, window_bits=4)
+    # Lectures disque hors des tests mesurés
+    _preload_profiles()
+
+
+def tearDownModule():
+    if _POOL is not None:
+        _POOL.shutdown()
+
 
 class TestFullFlowSuccess(unittest.TestCase):
     """Tests pour le flux complet avec succès"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Écosystème DTC créé une seule fois (clés des émetteurs immuables)"""
+        cls._scenario = create_demo_scenario()
+
     def setUp(self):
         """Configuration d'un écosystème DTC complet"""
-        self.scenario = create_demo_scenario()
+        self.scenario = self._scenario
         
         # Acteurs du système
         self.french_gov = self.scenario['issuers']['french_gov']
@@ -35,6 +169,8 @@ class TestFullFlowSuccess(unittest.TestCase):
         self.health_ministry = self.scenario['issuers']['health_ministry']
         
         self.alice = self.scenario['holders']['alice']
+        # Seul le portefeuille du détenteur est mutable : il est vidé à chaque test
+        self.alice.credentials = CredentialStore()
         
         self.border_control = self.scenario['verifiers']['border_control']
         self.airline = self.scenario['verifiers']['airline']
@@ -58,9 +194,6 @@ class TestFullFlowSuccess(unittest.TestCase):
             "issuing_authority": "République Française"
         }
         
-        passport = self.french_gov.issue_passport(passport_data)
-        self.assertIsNotNone(passport.signature)
-        
         # 2. Ambassade US émet un visa
         visa_data = {
             "document_type": "visa",
@@ -76,9 +209,6 @@ class TestFullFlowSuccess(unittest.TestCase):
             "destination_country": "USA"
         }
         
-        visa = self.us_embassy.issue_visa(visa_data)
-        self.assertIsNotNone(visa.signature)
-        
         # 3. Ministère santé émet certificat vaccination
         vaccination_data = {
             "document_type": "vaccination_certificate",
@@ -98,15 +228,22 @@ class TestFullFlowSuccess(unittest.TestCase):
             "issuing_authority": "French Health Ministry"
         }
         
-        vaccination = self.health_ministry.issue_vaccination(vaccination_data)
+        # Les trois émetteurs signent indépendamment : émissions en parallèle
+        passport, visa, vaccination = _run_jobs([
+            (self.french_gov.issue_passport, passport_data),
+            (self.us_embassy.issue_visa, visa_data),
+            (self.health_ministry.issue_vaccination, vaccination_data),
+        ])
+        self.assertIsNotNone(passport.signature)
+        self.assertIsNotNone(visa.signature)
         self.assertIsNotNone(vaccination.signature)
         
         # === PHASE 2: STOCKAGE PAR LE DETENTEUR ===
         
         # Alice stocke tous ses credentials
-        self.alice.store_credential(passport)
-        self.alice.store_credential(visa)
-        self.alice.store_credential(vaccination)
+        self.alice.store_credential(passport.credential_id, passport)
+        self.alice.store_credential(visa.credential_id, visa)
+        self.alice.store_credential(vaccination.credential_id, vaccination)
         
         # Vérifier stockage
         self.assertEqual(len(self.alice.credentials), 3)
@@ -115,31 +252,45 @@ class TestFullFlowSuccess(unittest.TestCase):
         
         # Alice présente passeport et visa à la compagnie aérienne
         # (divulgation sélective - pas besoin de révéler date de naissance)
-        airline_presentation = self.alice.create_combined_presentation([
-            (passport.credential_id, ["nationality", "surname", "given_names", "date_of_expiry"]),
-            (visa.credential_id, ["destination_country", "visa_type", "date_of_expiry"])
-        ])
-        
-        airline_result = self.airline.verify_presentation(airline_presentation)
-        self.assertTrue(airline_result.is_valid)
-        self.assertEqual(airline_result.disclosed_attributes["nationality"], "FR")
-        self.assertEqual(airline_result.disclosed_attributes["destination_country"], "USA")
+        airline_presentation = [
+            self.alice.create_presentation(passport.credential_id, self.french_gov.public_key,
+                                           ["nationality", "holder_name", "date_of_expiry"]),
+            self.alice.create_presentation(visa.credential_id, self.us_embassy.public_key,
+                                           ["visa_type", "valid_until"])
+        ]
+        
+        airline_result = self.airline.verify_combined_presentation(airline_presentation)
+        self.assertTrue(airline_result["valid"])
+        self.assertEqual(len(airline_result["results"]), 2)
+        self.assertTrue(all(result["valid"] for result in airline_result["results"]))
+        
+        airline_disclosed = _disclosed_values(airline_presentation)
+        self.assertEqual(airline_disclosed["nationality"], "FR")
+        self.assertEqual(airline_disclosed["visa_type"], "B1/B2")
+        self.assertEqual(airline_disclosed["valid_until"], "2033-06-01")
         
         # === PHASE 4: CONTRÔLE FRONTALIER ===
         
         # Alice présente tous ses credentials au contrôle frontalier
         # Mais utilise divulgation sélective pour la vaccination (pas de détails des doses)
-        border_presentation = self.alice.create_combined_presentation([
-            (passport.credential_id, ["nationality", "surname", "given_names", "date_of_birth"]),
-            (visa.credential_id, ["destination_country", "visa_type", "date_of_issue"]),
-            (vaccination.credential_id, ["certificate_id", "vaccine_name", "issuing_authority"])
-        ])
-        
-        border_result = self.border_control.verify_presentation(border_presentation)
-        self.assertTrue(border_result.is_valid)
+        border_presentation = [
+            self.alice.create_presentation(passport.credential_id, self.french_gov.public_key,
+                                           ["nationality", "holder_name", "date_of_birth"]),
+            self.alice.create_presentation(visa.credential_id, self.us_embassy.public_key,
+                                           ["visa_type", "valid_from"]),
+            self.alice.create_presentation(vaccination.credential_id, self.health_ministry.public_key,
+                                           ["certificate_id", "vaccine_name"])
+        ]
+        
+        border_result = self.border_control.verify_combined_presentation(border_presentation)
+        self.assertTrue(border_result["valid"])
+        self.assertEqual(len(border_result["results"]), 3)
+        self.assertTrue(all(result["valid"] for result in border_result["results"]))
         
         # Vérifier que les informations sensibles ne sont pas révélées
-        self.assertNotIn("vaccination_details", border_result.disclosed_attributes)
+        border_disclosed = _disclosed_values(border_presentation)
+        self.assertEqual(border_disclosed["certificate_id"], "VAX2023FR001")
+        self.assertNotIn("batch_number", border_disclosed)
         
         # === PHASE 5: VÉRIFICATION DES PROPRIÉTÉS BBS ===
         
@@ -147,15 +298,77 @@ class TestFullFlowSuccess(unittest.TestCase):
         # (En théorie - on ne peut pas le tester directement, mais c'est garanti par BBS)
         
         # 5b. Selective Disclosure: vérifier qu'informations cachées restent cachées
-        self.assertNotIn("date_of_birth", airline_result.disclosed_attributes)
-        self.assertNotIn("vaccination_details", border_result.disclosed_attributes)
-        
-        # 5c. Authenticité: toutes les signatures sont valides
-        self.assertTrue(airline_result.is_valid)
-        self.assertTrue(border_result.is_valid)
+        self.assertNotIn("date_of_birth", airline_disclosed)
+        self.assertNotIn("batch_number", border_disclosed)
+        self.assertNotIn("manufacturer", border_disclosed)
+        
+        # 5c. Authenticité: une présentation altérée invalide l'ensemble
+        proof, messages, indices = airline_presentation[0]
+        tampered = list(messages)
+        tampered[-1] = b"nationality:string:XX"
+        tampered_result = self.airline.verify_combined_presentation(
+            [(proof, tampered, indices), airline_presentation[1]]
+        )
+        self.assertFalse(tampered_result["valid"])
+        self.assertFalse(tampered_result["results"][0]["valid"])
+        self.assertTrue(tampered_result["results"][1]["valid"])
         
         print(" Workflow complet de voyage réussi avec divulgation sélective")
         
+    def test_batch_verification(self):
+        """Test vérification groupée de présentations de plusieurs émetteurs"""
+
+        passport_data = {
+            "document_type": "passport",
+            "nationality": "FR",
+            "given_names": "Alice Marie",
+            "surname": "Dubois",
+            "date_of_birth": "1992-05-10",
+            "place_of_birth": "Lyon, France",
+            "date_of_issue": "2022-01-15",
+            "date_of_expiry": "2032-01-15",
+            "issuing_authority": "République Française"
+        }
+        visa_data = {
+            "document_type": "visa",
+            "visa_number": "US2023BATCH",
+            "visa_type": "B1/B2",
+            "given_names": "Alice Marie",
+            "surname": "Dubois",
+            "date_of_issue": "2023-06-01",
+            "date_of_expiry": "2033-06-01",
+            "issuing_authority": "US Embassy Paris"
+        }
+
+        # Deux passeports du même émetteur (même groupe) et un visa d'un autre
+        credentials = [
+            (self.french_gov, self.french_gov.issue_passport(dict(passport_data, document_number="BATCH001"))),
+            (self.us_embassy, self.us_embassy.issue_visa(visa_data)),
+            (self.french_gov, self.french_gov.issue_passport(dict(passport_data, document_number="BATCH002"))),
+        ]
+
+        presentations = []
+        for issuer, credential in credentials:
+            self.alice.store_credential(credential.credential_id, credential)
+            presentations.append(self.alice.create_presentation(
+                credential.credential_id, issuer.public_key, ["nationality", "visa_type"]
+            ))
+
+        results = self.border_control.verify_batch(presentations)
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(result["valid"] for result in results))
+        # Résultats dans l'ordre d'entrée malgré le regroupement par émetteur
+        self.assertEqual([result["document_type"] for result in results], ["passport", "visa", "passport"])
+
+        # Une preuve altérée fait échouer son groupe : seule elle est rejetée
+        proof, messages, indices = presentations[2]
+        tampered = list(messages)
+        tampered[-1] = b"nationality:string:XX"
+        results = self.border_control.verify_batch(presentations[:2] + [(proof, tampered, indices)])
+        self.assertEqual([result["valid"] for result in results], [True, True, False])
+
+        print(" Vérification groupée réussie")
+
     def test_age_verification_without_birthdate(self):
         """Test vérification d'âge sans révéler date de naissance"""
         
@@ -246,15 +459,14 @@ class TestFullFlowSuccess(unittest.TestCase):
 class TestFullFlowTamperedCredential(unittest.TestCase):
     """Tests pour détection des credentials altérés"""
 
-    def setUp(self):
-        """Configuration pour tests d'altération"""
-        self.scenario = create_demo_scenario()
-        self.issuer = self.scenario['issuers']['french_gov']
-        self.holder = self.scenario['holders']['alice']
-        self.verifier = self.scenario['verifiers']['border_control']
-        
-        # Créer credential valide
-        self.valid_data = {
+    @classmethod
+    def setUpClass(cls):
+        """Écosystème DTC et credential valide créés une seule fois"""
+        cls._scenario = create_demo_scenario()
+        
+        # Credential valide signé une fois : les tests n'en dérivent que des
+        # vues altérées (with_override / with_signature), jamais de mutation
+        cls.valid_data = {
             "document_type": "passport",
             "document_number": "TAMPER123",
             "nationality": "FR",
@@ -266,16 +478,27 @@ class TestFullFlowTamperedCredential(unittest.TestCase):
             "date_of_expiry": "2030-01-01",
             "issuing_authority": "République Française"
         }
+        cls.credential = cls._scenario['issuers']['french_gov'].issue_passport(cls.valid_data)
         
-        self.credential = self.issuer.issue_passport(self.valid_data)
+        # Fausse signature : même A, scalaire e arbitraire
+        cls.fake_signature = BBSSignature(A=cls.credential.signature.A, e=12345)
+
+    def setUp(self):
+        """Configuration pour tests d'altération"""
+        self.scenario = self._scenario
+        self.issuer = self.scenario['issuers']['french_gov']
+        self.holder = self.scenario['holders']['alice']
+        self.holder.credentials = CredentialStore()
+        self.verifier = self.scenario['verifiers']['border_control']
+        
+        # Portefeuille vierge contenant le credential partagé
         self.holder.store_credential(self.credential)
         
     def test_detect_altered_attribute_value(self):
         """Test détection d'altération de valeur d'attribut"""
         
-        # Altérer la nationalité après émission
-        tampered_cred = self.credential.copy()
-        tampered_cred.attributes["nationality"].value = "HACKED"
+        # Altérer la nationalité après émission (vue superposée, l'original reste intact)
+        tampered_cred = self.credential.with_override("nationality", "HACKED")
         
         # Remplacer dans le stockage du détenteur
         self.holder.credentials[tampered_cred.credential_id] = tampered_cred
@@ -293,13 +516,8 @@ class TestFullFlowTamperedCredential(unittest.TestCase):
     def test_detect_signature_tampering(self):
         """Test détection d'altération de signature"""
         
-        # Créer une fausse signature
-        from BBSCore.bbsSign import BBSSignature
-        fake_signature = BBSSignature(A=self.credential.signature.A, e=12345)
-        
-        # Remplacer la signature
-        tampered_cred = self.credential.copy()
-        tampered_cred.signature = fake_signature
+        # Remplacer la signature par la fausse (attributs partagés avec l'original)
+        tampered_cred = self.credential.with_signature(self.fake_signature)
         
         self.holder.credentials[tampered_cred.credential_id] = tampered_cred
         
@@ -315,6 +533,12 @@ class TestFullFlowTamperedCredential(unittest.TestCase):
     def test_detect_replay_attack(self):
         """Test détection d'attaque par rejeu"""
         
+        # Résultats mémoïsés : la seconde vérification ne refait pas les pairings
+        # (vérificateur partagé par la classe : cache vidé et désactivé ensuite)
+        self.verifier.enable_cache = True
+        self.addCleanup(self.verifier.clear_cache)
+        self.addCleanup(setattr, self.verifier, "enable_cache", False)
+        
         # Créer une présentation valide
         original_presentation = self.holder.create_selective_presentation(
             self.credential.credential_id,
@@ -332,6 +556,7 @@ class TestFullFlowTamperedCredential(unittest.TestCase):
         # Pour ce test, on vérifie juste que la signature est toujours valide
         # En pratique, le système devrait rejeter les rejeux via des nonces
         self.assertTrue(result2.is_valid)
+        self.assertEqual(self.verifier.cache_hits, 1)
         
         print(" Mécanisme de détection de rejeu testé")
         
@@ -358,9 +583,10 @@ class TestFullFlowTamperedCredential(unittest.TestCase):
         # Essayer de mélanger les attributs (attaque sophistiquée)
         # Alice essaie de créer un "frankenstein credential"
         try:
-            mixed_cred = self.credential.copy()
-            mixed_cred.attributes["nationality"] = other_credential.attributes["nationality"]
-            # Mais garde la signature originale
+            # Attribut emprunté à l'autre credential, mais garde la signature originale
+            mixed_cred = self.credential.with_override(
+                "nationality", other_credential.attributes["nationality"]
+            )
             
             self.holder.credentials[mixed_cred.credential_id] = mixed_cred
             
@@ -380,14 +606,17 @@ class TestFullFlowTamperedCredential(unittest.TestCase):
 class TestDemoTravelWithBenchmarkData(unittest.TestCase):
     """Tests d'intégration avec les données de benchmark"""
     
-    def setUp(self):
-        """Configuration avec données réelles du benchmark"""
-        self.data_manager = DataManager()
-        
-        # Charger données de profils existants
-        self.ellen_profile = self.data_manager.load_person_data("ellen_kampire_dtc")
-        self.benoit_profile = self.data_manager.load_person_data("benoit_koleu_dtc") 
-        self.Berissa_profile = self.data_manager.load_person_data("Berissa_kawaya_dtc")
+    @staticmethod
+    def _profile(name: str) -> Dict[str, Any]:
+        """
+        Profil préchargé par setUpModule (les tests ne font que le lire)
+        
+        Une erreur de chargement est relevée par les seuls tests qui lisent
+        les profils : les autres tests de la classe s'exécutent quand même.
+        """
+        if _PROFILES_ERROR is not None:
+            raise _PROFILES_ERROR
+        return _PROFILES[name]
         
     def test_demo_with_ellen_data(self):
         """Test démo complète avec données d'Ellen Kampire"""
@@ -396,7 +625,7 @@ class TestDemoTravelWithBenchmarkData(unittest.TestCase):
         scenario = create_demo_scenario()
         
         # Extraire données d'Ellen depuis le profil
-        ellen_data = self.ellen_profile
+        ellen_data = self._profile("ellen_kampire_dtc")
         
         # Créer credentials basés sur ses données réelles
         passport_data = {
@@ -436,47 +665,49 @@ class TestDemoTravelWithBenchmarkData(unittest.TestCase):
     def test_batch_processing_benchmark_profiles(self):
         """Test traitement en lot des profils de benchmark"""
         
-        profiles = [self.ellen_profile, self.benoit_profile, self.Berissa_profile]
+        profiles = [self._profile(name) for name in BENCHMARK_PROFILES]
         scenario = create_demo_scenario()
         
         issuer = scenario['issuers']['french_gov']
         holder = scenario['holders']['alice']
         verifier = scenario['verifiers']['border_control']
         
-        processed_count = 0
-        
-        for profile in profiles:
-            if profile:
-                # Créer credential pour chaque profil
-                passport_data = {
-                    "document_type": "passport",
-                    "document_number": profile.get("passport_number", f"TEST{processed_count}"),
-                    "nationality": profile.get("nationality", "XX"),
-                    "given_names": profile.get("given_names", "Test"),
-                    "surname": profile.get("surname", "User"),
-                    "date_of_birth": profile.get("date_of_birth", "1990-01-01"),
-                    "place_of_birth": profile.get("place_of_birth", "Unknown"),
-                    "date_of_issue": "2020-01-01",
-                    "date_of_expiry": "2030-01-01",
-                    "issuing_authority": "Test Authority"
-                }
-                
-                try:
-                    credential = issuer.issue_passport(passport_data)
-                    holder.store_credential(credential)
-                    
-                    # Test de vérification
-                    presentation = holder.create_selective_presentation(
-                        credential.credential_id,
-                        ["nationality", "surname"]
-                    )
-                    
-                    result = verifier.verify_presentation(presentation)
-                    if result.is_valid:
-                        processed_count += 1
-                        
-                except Exception as e:
-                    print(f"Erreur avec profil: {e}")
+        # Créer credential pour chaque profil
+        payloads = [
+            {
+                "document_type": "passport",
+                "document_number": profile.get("passport_number", f"TEST{i}"),
+                "nationality": profile.get("nationality", "XX"),
+                "given_names": profile.get("given_names", "Test"),
+                "surname": profile.get("surname", "User"),
+                "date_of_birth": profile.get("date_of_birth", "1990-01-01"),
+                "place_of_birth": profile.get("place_of_birth", "Unknown"),
+                "date_of_issue": "2020-01-01",
+                "date_of_expiry": "2030-01-01",
+                "issuing_authority": "Test Authority"
+            }
+            for i, profile in enumerate(profiles) if profile
+        ]
+        
+        # Émissions indépendantes : réparties sur le pool de processus
+        credentials = _run_jobs([(issuer.issue_passport, data) for data in payloads])
+        
+        presentations = []
+        for credential in credentials:
+            try:
+                holder.store_credential(credential.credential_id, credential)
+                presentations.append(holder.create_presentation(
+                    credential.credential_id,
+                    issuer.public_key,
+                    ["nationality", "holder_name"]
+                ))
+            except Exception as e:
+                print(f"Erreur avec profil: {e}")
+        
+        # Vérification groupée : un seul produit de pairings pour tout le lot
+        results = verifier.verify_batch(presentations)
+        self.assertEqual(len(results), len(presentations))
+        processed_count = sum(1 for result in results if result["valid"])
                     
         # Au moins 2 profils doivent fonctionner
         self.assertGreaterEqual(processed_count, 2)
@@ -487,7 +718,6 @@ class TestDemoTravelWithBenchmarkData(unittest.TestCase):
         """Test intégration avec les métriques de performance"""
         
         from benchmark.collector import BenchmarkCollector
-        import time
         
         # Créer collector pour mesurer
         collector = BenchmarkCollector()
@@ -498,7 +728,8 @@ class TestDemoTravelWithBenchmarkData(unittest.TestCase):
         holder = scenario['holders']['alice']
         verifier = scenario['verifiers']['border_control']
         
-        # Test avec différentes tailles de données
+        # Données préconstruites : la construction des dicts reste hors mesure
+        payloads = {}
         for num_attributes in [5, 10, 15]:
             
             # Créer credential avec nombre variable d'attributs
@@ -519,29 +750,35 @@ class TestDemoTravelWithBenchmarkData(unittest.TestCase):
             for i in range(num_attributes - 10):
                 passport_data[f"extra_attr_{i}"] = f"value_{i}"
             
-            # Mesurer temps d'émission
-            start_time = time.time()
-            credential = issuer.issue_passport(passport_data)
-            emission_time = time.time() - start_time
+            payloads[num_attributes] = passport_data
+        
+        for num_attributes, passport_data in payloads.items():
+            # Mesurer temps d'émission : appels répétés jusqu'à MIN_SAMPLE_NS
+            emission_samples, credential = _sample_ns(issuer.issue_passport, passport_data)
             
-            # Mesurer temps de vérification
-            holder.store_credential(credential)
-            presentation = holder.create_full_presentation(credential.credential_id)
+            holder.store_credential(credential.credential_id, credential)
+            presentation = holder.create_presentation(
+                credential.credential_id,
+                issuer.public_key,
+                list(credential.attributes)
+            )
             
-            start_time = time.time()
-            result = verifier.verify_presentation(presentation)
-            verification_time = time.time() - start_time
+            # Mesurer temps de vérification pour cette taille (cache désactivé)
+            verification_samples, result = _sample_ns(
+                lambda p: verifier.verify_presentation(*p), presentation
+            )
             
-            # Enregistrer métriques
-            collector.record_metric({
+            # Enregistrer métriques (nanosecondes)
+            metric = {
                 'operation': 'integration_test',
                 'num_attributes': num_attributes,
-                'emission_time': emission_time,
-                'verification_time': verification_time,
-                'success': result.is_valid
-            })
+                'success': result["valid"]
+            }
+            metric.update(_sample_metrics('emission', emission_samples))
+            metric.update(_sample_metrics('verification', verification_samples))
+            collector.record_metric(metric)
             
-            self.assertTrue(result.is_valid)
+            self.assertTrue(result["valid"])
             
         print(" Métriques de performance intégrées avec succès")
         
@@ -551,6 +788,11 @@ class TestDemoTravelWithBenchmarkData(unittest.TestCase):
         # Test que les modules de démo peuvent s'exécuter sans erreur
         # (test d'intégration léger)
         
+        # Recherche des modules sans les importer : saut immédiat si absents
+        for module in ("Demo.dtc_complete", "Demo.demo_travel"):
+            if importlib.util.find_spec(module) is None:
+                self.skipTest(f"Module démo non disponible: {module}")
+        
         try:
             # Simuler paramètres pour dtc_complete
             import sys
@@ -579,5 +821,13 @@ class TestDemoTravelWithBenchmarkData(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    # Configuration pour tests d'intégration
-    unittest.main(verbosity=2, buffer=True, failfast=False)
\ No newline at end of file
+    # Classes indépendantes : exécution parallèle si pytest-xdist est
+    # disponible (test_demo_modules_integration reste dans le groupe
+    # "serial", voir conftest.py), sinon exécution unittest classique
+    try:
+        import pytest
+        import xdist  # noqa: F401
+    except ImportError:
+        unittest.main(verbosity=2, buffer=True, failfast=False)
+    else:
+        sys.exit(pytest.main([__file__, "-q", "-n", "auto", "--dist", "loadgroup"]))
\ No newline at end of file
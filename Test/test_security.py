@@ -9,19 +9,79 @@ Ces tests vérifient les propriétés de sécurité cryptographiques :
 """
 
 import unittest
-import secrets
+import logging
+import sys
+import random
+from functools import lru_cache
 import hashlib
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+import numpy as np
 
 # Import des modules BBS et DTC
-from BBSCore.KeyGen import BBSKeyGen
-from BBSCore.Setup import BBSPrivateKey, BBSPublicKey, CURVE_ORDER
+from BBSCore.KeyGen import BBSKeyGen, G2_fixed_mul
+from BBSCore.Setup import BBSPrivateKey, BBSPublicKey, BBSGenerators, CURVE_ORDER
 from BBSCore.bbsSign import BBSSignature, BBSSignatureScheme
 from BBSCore.ZKProof import BBSProof, BBSProofScheme
 from DTC.DTCIssuer import DTCIssuer
 from DTC.DTCHolder import DTCHolder
 from DTC.DTCVerifier import DTCVerifier
 
+# Traces des tests : silencieuses par défaut, visibles avec un niveau DEBUG
+logger = logging.getLogger(__name__)
+
+# Les caches et l'aléa de module ci-dessous sont propres à chaque processus :
+# sous pytest-xdist, chaque worker reconstruit les siens, aucun test ne
+# dépend de l'état laissé par un autre
+
+# Schémas partagés par max_messages : les générateurs (hash-to-curve) sont
+# calculés une fois et communs aux schémas de signature et de preuve. Les
+# tests ne modifient jamais un schéma (pas de tables précalculées)
+@lru_cache(maxsize=None)
+def _get_generators(max_messages: int) -> List[tuple]:
+    return BBSGenerators.create_generators(max_messages)
+
+
+@lru_cache(maxsize=None)
+def _get_sig_scheme(max_messages: int) -> BBSSignatureScheme:
+    return BBSSignatureScheme(max_messages=max_messages, generators=_get_generators(max_messages))
+
+
+@lru_cache(maxsize=None)
+def _get_proof_scheme(max_messages: int) -> BBSProofScheme:
+    return BBSProofScheme(max_messages=max_messages, generators=_get_generators(max_messages))
+
+
+# Aléa déterministe pour les clés factices : les tests négatifs n'ont pas
+# besoin d'entropie système, et des clés reproductibles rendent la
+# mémoïsation ci-dessous sûre
+_TEST_RNG = random.Random(0x5EC)
+
+# Clé "mauvaise" dérivée d'un ikm fixe (dérivation mise en cache par KeyGen)
+WRONG_KEY_IKM = b"security_tests_wrong_public_key!"
+
+
+def _rand_scalar(rng: random.Random) -> int:
+    """Scalaire dans [1, CURVE_ORDER) : 512 bits réduits, biais négligeable, sans boucle"""
+    return rng.getrandbits(512) % (CURVE_ORDER - 1) + 1
+
+
+# Preuves déjà générées, par (clé publique, signature, header, messages,
+# indices révélés) : les tests ne font que vérifier ces preuves, inutile de
+# refaire proof_gen pour une même combinaison
+_PROOF_CACHE: Dict[tuple, BBSProof] = {}
+
+
+def _gen_proof(scheme: BBSProofScheme, pk: BBSPublicKey, signature: BBSSignature,
+               header: bytes, messages: List[bytes], indices: List[int],
+               msg_scalars: Optional[List[int]] = None) -> BBSProof:
+    """proof_gen mémoïsé sur le contenu des entrées (msg_scalars : messages pré-hachés)"""
+    key = (pk.to_bytes(), signature.to_bytes(), header, tuple(messages), tuple(indices))
+    if key not in _PROOF_CACHE:
+        _PROOF_CACHE[key] = scheme.proof_gen(pk, signature, header, messages, indices,
+                                             msg_scalars=msg_scalars)
+    return _PROOF_CACHE[key]
+
 
 class SecurityTestHelper:
     """Utilitaires pour tests de sécurité"""
@@ -33,41 +93,48 @@ class SecurityTestHelper:
         return BBSSignature(A=signature.A, e=corrupted_e)
         
     @staticmethod
-    def create_fake_public_key() -> BBSPublicKey:
-        """Créer une clé publique factice"""
-        from py_ecc.optimized_bls12_381 import G2, multiply
-        fake_secret = secrets.randbelow(CURVE_ORDER)
-        fake_W = multiply(G2, fake_secret)
+    def create_fake_public_key(rng: random.Random = _TEST_RNG) -> BBSPublicKey:
+        """Créer une clé publique factice (aléa déterministe)"""
+        fake_secret = _rand_scalar(rng)
+        # G2 fixe : table comb partagée avec BBSKeyGen
+        fake_W = G2_fixed_mul(fake_secret)
         return BBSPublicKey(W=fake_W)
         
     @staticmethod
     def corrupt_proof_data(proof: BBSProof) -> BBSProof:
         """Corrompre les données d'une preuve"""
-        # Altérer un des points de la preuve
-        corrupted_proof = BBSProof(
+        # Altérer le premier engagement m^_j (copie, la preuve reste intacte)
+        commitments = list(proof.commitments)
+        commitments[0] = (commitments[0] + 1) % CURVE_ORDER
+        return BBSProof(
             Abar=proof.Abar,
             Bbar=proof.Bbar,
             D=proof.D,
-            s_e=proof.s_e,
-            s_r1=proof.s_r1,
-            s_r3=proof.s_r3,
-            s_m=[(s + 1) % CURVE_ORDER if i == 0 else s for i, s in enumerate(proof.s_m)]  # Altérer premier s_m
+            e_hat=proof.e_hat,
+            r1_hat=proof.r1_hat,
+            r3_hat=proof.r3_hat,
+            commitments=commitments,
+            cp=proof.cp
         )
-        return corrupted_proof
 
 
 class TestTamperedProofRejected(unittest.TestCase):
     """Tests rejet des preuves altérées"""
 
-    def setUp(self):
-        """Configuration initiale"""
-        self.keypair = BBSKeyGen.keygen()
-        self.bbs = BBSSignatureScheme(max_messages=10)
-        self.proof_scheme = BBSProofScheme(max_messages=10)
-        
-        self.messages = [b"msg1", b"msg2", b"msg3", b"msg4"]
-        self.header = b"security_test_header"
-        self.signature = self.bbs.sign(self.keypair.secret_key, self.messages, self.header)
+    @classmethod
+    def setUpClass(cls):
+        """Configuration partagée par tous les tests de la classe"""
+        cls.keypair = BBSKeyGen.keygen()
+        cls.bbs = _get_sig_scheme(10)
+        cls.proof_scheme = _get_proof_scheme(10)
+        
+        cls.messages = [b"msg1", b"msg2", b"msg3", b"msg4"]
+        cls.header = b"security_test_header"
+        # Messages constants : hachés en scalaires une seule fois
+        cls.scalars = cls.bbs.message_scalars(cls.messages)
+        # Les tests altèrent des copies, jamais la clé ni la signature
+        cls.signature = cls.bbs.sign(cls.keypair.secret_key, cls.messages, cls.header,
+                                     msg_scalars=cls.scalars)
         
     def test_corrupted_signature_rejected(self):
         """Test rejet signature corrompue"""
@@ -75,27 +142,22 @@ class TestTamperedProofRejected(unittest.TestCase):
         # Corrompre la signature
         corrupted_sig = SecurityTestHelper.corrupt_signature(self.signature)
         
-        # Vérifier que signature corrompue est rejetée
-        is_valid = self.bbs.verify(
+        # Vérifier la signature corrompue et l'originale en un appel : mêmes
+        # clé, messages et header, B et h(-B, P2) ne sont calculés qu'une fois
+        is_valid, is_original_valid = self.bbs.verify_many(
             self.keypair.public_key,
-            corrupted_sig,
+            [corrupted_sig, self.signature],
             self.messages,
-            self.header
+            self.header,
+            msg_scalars=self.scalars
         )
         
         self.assertFalse(is_valid, "Corrupted signature should be rejected")
         
         # Vérifier que signature originale est toujours valide
-        is_original_valid = self.bbs.verify(
-            self.keypair.public_key,
-            self.signature,
-            self.messages,
-            self.header
-        )
-        
         self.assertTrue(is_original_valid, "Original signature should remain valid")
         
-        print(" Signature corrompue rejetée correctement")
+        logger.debug(" Signature corrompue rejetée correctement")
         
     def test_tampered_proof_rejected(self):
         """Test rejet preuve altérée"""
@@ -104,12 +166,14 @@ class TestTamperedProofRejected(unittest.TestCase):
         disclosed_indices = [0, 2]
         disclosed_messages = [self.messages[i] for i in disclosed_indices]
         
-        valid_proof = self.proof_scheme.proof_gen(
+        valid_proof = _gen_proof(
+            self.proof_scheme,
             self.keypair.public_key,
             self.signature,
             self.header,
             self.messages,
-            disclosed_indices
+            disclosed_indices,
+            self.scalars
         )
         
         # Vérifier que preuve valide passe
@@ -118,7 +182,8 @@ class TestTamperedProofRejected(unittest.TestCase):
             valid_proof,
             self.header,
             disclosed_messages,
-            disclosed_indices
+            disclosed_indices,
+            disclosed_scalars=[self.scalars[i] for i in disclosed_indices]
         )
         self.assertTrue(is_valid, "Valid proof should pass")
         
@@ -136,7 +201,7 @@ class TestTamperedProofRejected(unittest.TestCase):
         
         self.assertFalse(is_corrupted_valid, "Corrupted proof should be rejected")
         
-        print(" Preuve altérée rejetée correctement")
+        logger.debug(" Preuve altérée rejetée correctement")
         
     def test_wrong_disclosed_messages_rejected(self):
         """Test rejet avec mauvais messages révélés"""
@@ -144,12 +209,14 @@ class TestTamperedProofRejected(unittest.TestCase):
         disclosed_indices = [0, 1]
         
         # Créer preuve avec messages corrects
-        proof = self.proof_scheme.proof_gen(
+        proof = _gen_proof(
+            self.proof_scheme,
             self.keypair.public_key,
             self.signature,
             self.header,
             self.messages,
-            disclosed_indices
+            disclosed_indices,
+            self.scalars
         )
         
         # Essayer vérification avec mauvais messages révélés
@@ -165,7 +232,7 @@ class TestTamperedProofRejected(unittest.TestCase):
         
         self.assertFalse(is_valid, "Proof with wrong disclosed messages should be rejected")
         
-        print(" Messages révélés incorrects rejetés")
+        logger.debug(" Messages révélés incorrects rejetés")
         
     def test_proof_replay_with_different_header(self):
         """Test rejet preuve rejouée avec header différent"""
@@ -173,39 +240,55 @@ class TestTamperedProofRejected(unittest.TestCase):
         disclosed_indices = [1, 3]
         disclosed_messages = [self.messages[i] for i in disclosed_indices]
         
-        # Créer preuve avec header spécifique
-        original_header = b"original_context"
+        # Créer preuve liée à un contexte de présentation (ph) ; le header
+        # reste celui de la signature
+        original_context = b"original_context"
         proof = self.proof_scheme.proof_gen(
             self.keypair.public_key,
             self.signature,
-            original_header,
+            self.header,
             self.messages,
-            disclosed_indices
+            disclosed_indices,
+            ph=original_context,
+            msg_scalars=self.scalars
         )
         
-        # Vérifier avec header original - doit passer
+        # Vérifier avec le contexte original - doit passer
         is_valid_original = self.proof_scheme.proof_verify(
             self.keypair.public_key,
             proof,
-            original_header,
+            self.header,
             disclosed_messages,
-            disclosed_indices
+            disclosed_indices,
+            ph=original_context
         )
         self.assertTrue(is_valid_original)
         
-        # Essayer avec header différent - doit échouer
-        different_header = b"different_context"
+        # Rejouer dans un autre contexte de présentation - doit échouer
         is_valid_different = self.proof_scheme.proof_verify(
             self.keypair.public_key,
             proof,
-            different_header,
+            self.header,
             disclosed_messages,
-            disclosed_indices
+            disclosed_indices,
+            ph=b"different_context"
         )
         
-        self.assertFalse(is_valid_different, "Proof should be rejected with different header")
+        self.assertFalse(is_valid_different, "Proof should be rejected with different presentation header")
         
-        print(" Rejeu preuve avec header différent rejeté")
+        # Header de signature différent - doit aussi échouer
+        is_valid_other_header = self.proof_scheme.proof_verify(
+            self.keypair.public_key,
+            proof,
+            b"different_header",
+            disclosed_messages,
+            disclosed_indices,
+            ph=original_context
+        )
+        
+        self.assertFalse(is_valid_other_header, "Proof should be rejected with different header")
+        
+        logger.debug(" Rejeu preuve avec header différent rejeté")
         
     def test_proof_with_wrong_disclosed_indices(self):
         """Test rejet preuve avec mauvais indices révélés"""
@@ -214,12 +297,14 @@ class TestTamperedProofRejected(unittest.TestCase):
         original_indices = [0, 2]
         disclosed_messages = [self.messages[i] for i in original_indices]
         
-        proof = self.proof_scheme.proof_gen(
+        proof = _gen_proof(
+            self.proof_scheme,
             self.keypair.public_key,
             self.signature,
             self.header,
             self.messages,
-            original_indices
+            original_indices,
+            self.scalars
         )
         
         # Essayer vérification avec indices différents
@@ -235,31 +320,58 @@ class TestTamperedProofRejected(unittest.TestCase):
         
         self.assertFalse(is_valid, "Proof with wrong disclosed indices should be rejected")
         
-        print(" Indices révélés incorrects rejetés")
+        logger.debug(" Indices révélés incorrects rejetés")
 
 
 class TestInvalidPublicKeyRejected(unittest.TestCase):
     """Tests rejet des clés publiques invalides"""
 
-    def setUp(self):
-        """Configuration"""
-        self.valid_keypair = BBSKeyGen.keygen()
-        self.bbs = BBSSignatureScheme(max_messages=5)
-        self.messages = [b"test_msg_1", b"test_msg_2"]
-        self.header = b"pubkey_test_header"
+    @classmethod
+    def setUpClass(cls):
+        """Configuration partagée par tous les tests de la classe"""
+        cls.valid_keypair = BBSKeyGen.keygen()
+        cls.bbs = _get_sig_scheme(5)
+        cls.messages = [b"test_msg_1", b"test_msg_2"]
+        cls.header = b"pubkey_test_header"
+        cls.signature = cls.bbs.sign(cls.valid_keypair.secret_key, cls.messages, cls.header)
+        
+        # Émetteurs fiable / non fiable et leurs passeports : l'émission (une
+        # signature BBS sur tous les attributs) est faite une fois par classe
+        cls.trusted_issuer = DTCIssuer("TRUSTED_ISSUER")
+        cls.untrusted_issuer = DTCIssuer("UNTRUSTED_ISSUER")
+        cls.trusted_cred = cls.trusted_issuer.issue_passport({
+            "document_type": "passport",
+            "document_number": "TRUSTED123",
+            "nationality": "FR",
+            "given_names": "Trusted",
+            "surname": "User",
+            "date_of_birth": "1990-01-01",
+            "place_of_birth": "Paris, France",
+            "date_of_issue": "2020-01-01",
+            "date_of_expiry": "2030-01-01",
+            "issuing_authority": "Trusted Authority"
+        })
+        cls.untrusted_cred = cls.untrusted_issuer.issue_passport({
+            "document_type": "passport",
+            "document_number": "UNTRUSTED123",
+            "nationality": "XX",
+            "given_names": "Untrusted",
+            "surname": "User",
+            "date_of_birth": "1990-01-01",
+            "place_of_birth": "Unknown",
+            "date_of_issue": "2020-01-01",
+            "date_of_expiry": "2030-01-01",
+            "issuing_authority": "Untrusted Authority"
+        })
         
     def test_signature_with_wrong_public_key(self):
         """Test vérification avec mauvaise clé publique"""
         
-        # Créer signature avec clé valide
-        signature = self.bbs.sign(
-            self.valid_keypair.secret_key,
-            self.messages,
-            self.header
-        )
+        # Signature créée avec la clé valide (setUpClass)
+        signature = self.signature
         
         # Créer autre clé publique
-        wrong_keypair = BBSKeyGen.keygen()
+        wrong_keypair = BBSKeyGen.keygen(ikm=WRONG_KEY_IKM)
         
         # Vérifier avec mauvaise clé publique
         is_valid = self.bbs.verify(
@@ -281,19 +393,15 @@ class TestInvalidPublicKeyRejected(unittest.TestCase):
         
         self.assertTrue(is_valid_correct, "Signature should pass with correct public key")
         
-        print(" Mauvaise clé publique rejetée pour signature")
+        logger.debug(" Mauvaise clé publique rejetée pour signature")
         
     def test_proof_with_wrong_public_key(self):
         """Test vérification preuve avec mauvaise clé publique"""
         
-        proof_scheme = BBSProofScheme(max_messages=5)
+        proof_scheme = _get_proof_scheme(5)
         
-        # Créer signature et preuve avec clé valide
-        signature = self.bbs.sign(
-            self.valid_keypair.secret_key,
-            self.messages,
-            self.header
-        )
+        # Créer preuve à partir de la signature de la clé valide
+        signature = self.signature
         
         disclosed_indices = [0]
         disclosed_messages = [self.messages[0]]
@@ -307,7 +415,7 @@ class TestInvalidPublicKeyRejected(unittest.TestCase):
         )
         
         # Créer autre clé publique
-        wrong_keypair = BBSKeyGen.keygen()
+        wrong_keypair = BBSKeyGen.keygen(ikm=WRONG_KEY_IKM)
         
         # Vérifier preuve avec mauvaise clé
         is_valid = proof_scheme.proof_verify(
@@ -320,7 +428,7 @@ class TestInvalidPublicKeyRejected(unittest.TestCase):
         
         self.assertFalse(is_valid, "Proof should be rejected with wrong public key")
         
-        print(" Mauvaise clé publique rejetée pour preuve")
+        logger.debug(" Mauvaise clé publique rejetée pour preuve")
         
     def test_malformed_public_key_handling(self):
         """Test gestion clé publique malformée"""
@@ -330,11 +438,7 @@ class TestInvalidPublicKeyRejected(unittest.TestCase):
             malformed_key = BBSPublicKey(W=None)
             
             # Essayer utiliser clé malformée
-            signature = self.bbs.sign(
-                self.valid_keypair.secret_key,
-                self.messages,
-                self.header
-            )
+            signature = self.signature
             
             # Vérification avec clé malformée doit échouer
             with self.assertRaises((ValueError, TypeError, AttributeError)):
@@ -344,76 +448,52 @@ class TestInvalidPublicKeyRejected(unittest.TestCase):
             # Si création de clé malformée elle-même échoue, c'est aussi une protection
             pass
             
-        print(" Clé publique malformée gérée correctement")
+        logger.debug(" Clé publique malformée gérée correctement")
         
     def test_dtc_verifier_untrusted_issuer(self):
         """Test rejet par vérificateur DTC d'émetteur non fiable"""
         
-        # Créer émetteurs et vérificateur
-        trusted_issuer = DTCIssuer("TRUSTED_ISSUER")
-        untrusted_issuer = DTCIssuer("UNTRUSTED_ISSUER")
-        
+        # Vérificateur et porteur propres au test (état mutable)
         verifier = DTCVerifier("SECURITY_VERIFIER")
         holder = DTCHolder("test_holder")
         
         # Ajouter seulement l'émetteur fiable
-        verifier.add_trusted_issuer("TRUSTED_ISSUER", trusted_issuer.public_key)
+        verifier.add_trusted_issuer("TRUSTED_ISSUER", self.trusted_issuer.public_key)
         
-        # Créer credentials des deux émetteurs
-        trusted_cred = trusted_issuer.issue_passport({
-            "document_type": "passport",
-            "document_number": "TRUSTED123",
-            "nationality": "FR",
-            "given_names": "Trusted",
-            "surname": "User",
-            "date_of_birth": "1990-01-01",
-            "place_of_birth": "Paris, France",
-            "date_of_issue": "2020-01-01",
-            "date_of_expiry": "2030-01-01",
-            "issuing_authority": "Trusted Authority"
-        })
-        
-        untrusted_cred = untrusted_issuer.issue_passport({
-            "document_type": "passport",
-            "document_number": "UNTRUSTED123",
-            "nationality": "XX",
-            "given_names": "Untrusted",
-            "surname": "User",
-            "date_of_birth": "1990-01-01",
-            "place_of_birth": "Unknown",
-            "date_of_issue": "2020-01-01",
-            "date_of_expiry": "2030-01-01",
-            "issuing_authority": "Untrusted Authority"
-        })
-        
-        holder.store_credential(trusted_cred)
-        holder.store_credential(untrusted_cred)
+        # Credentials des deux émetteurs, émis une seule fois (setUpClass)
+        holder.store_credential(self.trusted_cred.credential_id, self.trusted_cred)
+        holder.store_credential(self.untrusted_cred.credential_id, self.untrusted_cred)
         
         # Présenter credential fiable - doit passer
-        trusted_presentation = holder.create_full_presentation(trusted_cred.credential_id)
-        trusted_result = verifier.verify_presentation(trusted_presentation)
-        self.assertTrue(trusted_result.is_valid)
+        proof, messages, indices = holder.create_presentation(
+            self.trusted_cred.credential_id, self.trusted_issuer.public_key, ["nationality"]
+        )
+        trusted_result = verifier.verify_presentation(proof, messages, indices)
+        self.assertTrue(trusted_result["valid"])
         
         # Présenter credential non fiable - doit échouer
-        untrusted_presentation = holder.create_full_presentation(untrusted_cred.credential_id)
-        untrusted_result = verifier.verify_presentation(untrusted_presentation)
-        self.assertFalse(untrusted_result.is_valid)
-        self.assertIn("untrusted", untrusted_result.error_message.lower())
+        proof, messages, indices = holder.create_presentation(
+            self.untrusted_cred.credential_id, self.untrusted_issuer.public_key, ["nationality"]
+        )
+        untrusted_result = verifier.verify_presentation(proof, messages, indices)
+        self.assertFalse(untrusted_result["valid"])
+        self.assertIn("untrusted", untrusted_result["error"].lower())
         
-        print(" Émetteur non fiable rejeté correctement")
+        logger.debug(" Émetteur non fiable rejeté correctement")
 
 
 class TestHiddenAttributeMismatch(unittest.TestCase):
     """Tests détection incohérences attributs cachés"""
 
-    def setUp(self):
-        """Configuration"""
-        self.keypair = BBSKeyGen.keygen()
-        self.bbs = BBSSignatureScheme(max_messages=8)
-        self.proof_scheme = BBSProofScheme(max_messages=8)
+    @classmethod
+    def setUpClass(cls):
+        """Configuration partagée par tous les tests de la classe"""
+        cls.keypair = BBSKeyGen.keygen()
+        cls.bbs = _get_sig_scheme(8)
+        cls.proof_scheme = _get_proof_scheme(8)
         
         # Messages avec attributs sensibles
-        self.messages = [
+        cls.messages = [
             b"nationality:FR",
             b"name:Alice_Dubois", 
             b"date_of_birth:1992-05-10",
@@ -424,8 +504,24 @@ class TestHiddenAttributeMismatch(unittest.TestCase):
             b"secret_clearance:TOP_SECRET"  # Attribut très sensible
         ]
         
-        self.header = b"hidden_attr_test"
-        self.signature = self.bbs.sign(self.keypair.secret_key, self.messages, self.header)
+        cls.header = b"hidden_attr_test"
+        # Messages constants : hachés en scalaires une seule fois
+        cls.scalars = cls.bbs.message_scalars(cls.messages)
+        cls.signature = cls.bbs.sign(cls.keypair.secret_key, cls.messages, cls.header,
+                                     msg_scalars=cls.scalars)
+        
+        # Messages et scalaires indexables par tableau d'indices (dtype=object :
+        # entiers Python et bytes conservés tels quels)
+        cls.message_arr = np.array(cls.messages, dtype=object)
+        cls.scalar_arr = np.array(cls.scalars, dtype=object)
+        
+        # Niveaux de divulgation pour test_selective_disclosure_consistency
+        cls.disclosure_levels = [
+            (np.array([0, 1], dtype=np.intp), "basic_info"),       # Nationalité + nom
+            (np.array([0, 1, 2], dtype=np.intp), "with_dob"),      # + date naissance
+            (np.array([0, 1, 3, 4], dtype=np.intp), "official"),   # + numéros officiels
+            (np.arange(len(cls.messages)), "full")                 # Tout révéler
+        ]
         
     def test_inconsistent_hidden_attribute_claims(self):
         """Test détection d'affirmations incohérentes sur attributs cachés"""
@@ -435,12 +531,14 @@ class TestHiddenAttributeMismatch(unittest.TestCase):
         disclosed_messages = [self.messages[i] for i in disclosed_indices]
         
         # Créer preuve valide
-        valid_proof = self.proof_scheme.proof_gen(
+        valid_proof = _gen_proof(
+            self.proof_scheme,
             self.keypair.public_key,
             self.signature,
             self.header,
             self.messages,
-            disclosed_indices
+            disclosed_indices,
+            self.scalars
         )
         
         # Vérifier preuve valide passe
@@ -449,7 +547,8 @@ class TestHiddenAttributeMismatch(unittest.TestCase):
             valid_proof,
             self.header,
             disclosed_messages,
-            disclosed_indices
+            disclosed_indices,
+            disclosed_scalars=[self.scalars[i] for i in disclosed_indices]
         )
         self.assertTrue(is_valid)
         
@@ -463,12 +562,13 @@ class TestHiddenAttributeMismatch(unittest.TestCase):
             valid_proof,  # Même preuve
             self.header,
             wrong_disclosed_messages,
-            wrong_disclosed_indices
+            wrong_disclosed_indices,
+            disclosed_scalars=[self.scalars[i] for i in wrong_disclosed_indices]
         )
         
         self.assertFalse(is_wrong_valid, "Proof should be rejected with inconsistent disclosure")
         
-        print(" Incohérence attributs révélés détectée")
+        logger.debug(" Incohérence attributs révélés détectée")
         
     def test_hidden_attribute_constraint_violation(self):
         """Test violation contraintes attributs cachés"""
@@ -529,29 +629,27 @@ class TestHiddenAttributeMismatch(unittest.TestCase):
         
         self.assertFalse(is_incompatible_valid, "Incompatible constraint should be rejected")
         
-        print(" Violation contrainte attribut caché détectée")
+        logger.debug(" Violation contrainte attribut caché détectée")
         
     def test_selective_disclosure_consistency(self):
         """Test cohérence divulgation sélective"""
         
-        # Test avec multiples niveaux de divulgation
-        disclosure_levels = [
-            ([0, 1], "basic_info"),       # Nationalité + nom
-            ([0, 1, 2], "with_dob"),      # + date naissance  
-            ([0, 1, 3, 4], "official"),   # + numéros officiels
-            (list(range(8)), "full")      # Tout révéler
-        ]
+        # Niveaux de divulgation (tableaux d'indices, setUpClass)
+        disclosure_levels = self.disclosure_levels
         
         for indices, level_name in disclosure_levels:
-            disclosed_messages = [self.messages[i] for i in indices]
+            # Sélection des messages et scalaires révélés en une indexation
+            disclosed_messages = self.message_arr[indices].tolist()
             
             # Créer preuve pour ce niveau
-            proof = self.proof_scheme.proof_gen(
+            proof = _gen_proof(
+                self.proof_scheme,
                 self.keypair.public_key,
                 self.signature,
                 self.header,
                 self.messages,
-                indices
+                indices.tolist(),
+                self.scalars
             )
             
             # Vérifier cohérence
@@ -560,7 +658,8 @@ class TestHiddenAttributeMismatch(unittest.TestCase):
                 proof,
                 self.header,
                 disclosed_messages,
-                indices
+                indices,
+                disclosed_scalars=self.scalar_arr[indices].tolist()
             )
             
             self.assertTrue(is_valid, f"Disclosure level {level_name} should be valid")
@@ -568,21 +667,22 @@ class TestHiddenAttributeMismatch(unittest.TestCase):
             # Test cross-contamination: utiliser preuve d'un niveau pour un autre
             if len(disclosure_levels) > 1:
                 wrong_indices, _ = disclosure_levels[0] if level_name != "basic_info" else disclosure_levels[1]
-                wrong_disclosed = [self.messages[i] for i in wrong_indices]
+                wrong_disclosed = self.message_arr[wrong_indices].tolist()
                 
                 is_wrong_valid = self.proof_scheme.proof_verify(
                     self.keypair.public_key,
                     proof,
                     self.header,
                     wrong_disclosed,
-                    wrong_indices
+                    wrong_indices,
+                    disclosed_scalars=self.scalar_arr[wrong_indices].tolist()
                 )
                 
                 # Si les indices sont différents, ça doit échouer
-                if set(indices) != set(wrong_indices):
+                if set(indices.tolist()) != set(wrong_indices.tolist()):
                     self.assertFalse(is_wrong_valid, f"Cross-level proof reuse should fail")
                     
-        print(" Cohérence divulgation sélective vérifiée")
+        logger.debug(" Cohérence divulgation sélective vérifiée")
         
     def test_attribute_binding_integrity(self):
         """Test intégrité liaison attributs"""
@@ -638,25 +738,34 @@ class TestHiddenAttributeMismatch(unittest.TestCase):
         
         self.assertFalse(is_fake_valid, "Modified attribute should be rejected")
         
-        print(" Intégrité liaison attributs vérifiée")
+        logger.debug(" Intégrité liaison attributs vérifiée")
 
 
 class TestCryptographicAttacks(unittest.TestCase):
     """Tests résistance aux attaques cryptographiques"""
 
-    def setUp(self):
-        """Configuration"""
-        self.keypair = BBSKeyGen.keygen()
-        self.bbs = BBSSignatureScheme(max_messages=5)
+    @classmethod
+    def setUpClass(cls):
+        """Configuration partagée par tous les tests de la classe"""
+        # Les messages choisis par l'attaquant restent signés dans leur test
+        cls.keypair = BBSKeyGen.keygen()
+        cls.bbs = _get_sig_scheme(5)
+        
+        # Signature légitime visée par les falsifications, et l'inverse de e
+        # calculé une seule fois
+        cls.forge_messages = [b"forge_test_msg1", b"forge_test_msg2"]
+        cls.forge_header = b"forgery_test"
+        cls.legitimate_sig = cls.bbs.sign(cls.keypair.secret_key, cls.forge_messages, cls.forge_header)
+        cls._e_inv = pow(cls.legitimate_sig.e, -1, CURVE_ORDER)
         
     def test_signature_forgery_resistance(self):
         """Test résistance à la falsification de signature"""
         
-        messages = [b"forge_test_msg1", b"forge_test_msg2"]
-        header = b"forgery_test"
+        messages = self.forge_messages
+        header = self.forge_header
         
-        # Signature légitime
-        legitimate_sig = self.bbs.sign(self.keypair.secret_key, messages, header)
+        # Signature légitime (setUpClass)
+        legitimate_sig = self.legitimate_sig
         
         # Essayer diverses formes de falsification
         forgery_attempts = [
@@ -667,21 +776,22 @@ class TestCryptographicAttacks(unittest.TestCase):
             BBSSignature(A=legitimate_sig.A, e=(legitimate_sig.e * 2) % CURVE_ORDER),
             
             # 3. Inverser e
-            BBSSignature(A=legitimate_sig.A, e=pow(legitimate_sig.e, -1, CURVE_ORDER)),
+            BBSSignature(A=legitimate_sig.A, e=self._e_inv),
         ]
         
-        # Toutes les tentatives doivent échouer
-        for i, forged_sig in enumerate(forgery_attempts):
-            is_valid = self.bbs.verify(
-                self.keypair.public_key,
-                forged_sig,
-                messages,
-                header
-            )
-            
+        # Toutes les tentatives doivent échouer : même clé, messages et header,
+        # B et la boucle de Miller h(-B, P2) sont partagés entre les tentatives
+        results = self.bbs.verify_many(
+            self.keypair.public_key,
+            forgery_attempts,
+            messages,
+            header
+        )
+        
+        for i, is_valid in enumerate(results):
             self.assertFalse(is_valid, f"Forgery attempt {i+1} should be rejected")
             
-        print(" Résistance falsification signature vérifiée")
+        logger.debug(" Résistance falsification signature vérifiée")
         
     def test_chosen_message_attack_resistance(self):
         """Test résistance attaque à messages choisis"""
@@ -694,41 +804,43 @@ class TestCryptographicAttacks(unittest.TestCase):
             b"AAAA" * 8,   # Pattern répétitif
         ]
         
-        # Signer messages choisis
+        header = b"chosen_msg_test"
+        
+        # Signer messages choisis (chaque message haché une seule fois)
         signatures = []
         for msg in chosen_messages:
-            sig = self.bbs.sign(self.keypair.secret_key, [msg], b"chosen_msg_test")
-            signatures.append((msg, sig))
+            scalars = self.bbs.message_scalars([msg])
+            sig = self.bbs.sign(self.keypair.secret_key, [msg], header, msg_scalars=scalars)
+            signatures.append((msg, sig, scalars))
             
-        # Vérifier que toutes les signatures sont valides
-        for msg, sig in signatures:
-            is_valid = self.bbs.verify(
-                self.keypair.public_key,
-                sig,
-                [msg],
-                b"chosen_msg_test"
-            )
-            self.assertTrue(is_valid, f"Legitimate signature should be valid for message: {msg}")
+        # Vérifier que toutes les signatures sont valides : un seul contrôle
+        # par lot aléatoire (une exponentiation finale pour tout le lot)
+        batch_valid = self.bbs.batch_verify([
+            (self.keypair.public_key, sig, [msg], header) for msg, sig, _ in signatures
+        ])
+        self.assertTrue(batch_valid, "Legitimate signatures should all be valid")
             
         # Attaquant essaie d'utiliser info des messages choisis pour forger
         # Essayer de combiner composantes de différentes signatures
         if len(signatures) >= 2:
-            (_, sig1), (_, sig2) = signatures[:2]
+            (_, sig1, _), (_, sig2, _) = signatures[:2]
             
             # Tentative forgerie en combinant
             combined_forgery = BBSSignature(A=sig1.A, e=sig2.e)
             
-            # Doit échouer sur n'importe quel message
-            for msg, _ in signatures:
+            # Doit échouer sur n'importe quel message : vérifié message par
+            # message, un lot rejeté ne garantit pas que chacun échoue
+            for msg, _, scalars in signatures:
                 is_combined_valid = self.bbs.verify(
                     self.keypair.public_key,
                     combined_forgery,
                     [msg],
-                    b"chosen_msg_test"
+                    header,
+                    msg_scalars=scalars
                 )
                 self.assertFalse(is_combined_valid, "Combined forgery should fail")
                 
-        print(" Résistance attaque messages choisis vérifiée")
+        logger.debug(" Résistance attaque messages choisis vérifiée")
         
     def test_malleability_resistance(self):
         """Test résistance à la malléabilité"""
@@ -773,16 +885,24 @@ class TestCryptographicAttacks(unittest.TestCase):
             
             # Selon l'implémentation, ceci peut passer ou échouer
             # Les deux comportements sont acceptables
-            print(f"  Point neutre result: {is_valid}")
+            logger.debug(f"  Point neutre result: {is_valid}")
         except:
             # Si opération échoue, c'est une protection
             pass
             
-        print(" Résistance malléabilité testée")
+        logger.debug(" Résistance malléabilité testée")
 
 
 if __name__ == '__main__':
     print(" TESTING BBS-DTC SECURITY PROPERTIES")
     print("=" * 60)
     
-    unittest.main(verbosity=2, buffer=True)
\ No newline at end of file
+    # Les quatre classes sont indépendantes : exécution parallèle si
+    # pytest-xdist est disponible, sinon exécution unittest classique
+    try:
+        import pytest
+        import xdist  # noqa: F401
+    except ImportError:
+        unittest.main(verbosity=2)
+    else:
+        sys.exit(pytest.main([__file__, "-q", "-n", "auto", "--dist", "loadgroup"]))
\ No newline at end of file
@@ -3,7 +3,9 @@ import statistics
 import sys
 import os
 import csv
-from typing import List, Dict, Optional, Any
+from collections import deque
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Any, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 import json
@@ -42,6 +44,10 @@ class BenchmarkCollector:
         self.profile = self._load_profile(profile_path)
         self.scenario_runner = get_scenario_runner(original_profile_path=profile_path)
         
+        # Metriques individuelles enregistrees via record_metric
+        self._metrics: deque = deque()
+        self._csv_sink = None
+        
         print(f"Using profile: {self.profile['name']}")
         print(f"Base attributes: {len(self.profile['attributes'])}")
         print(f"Available scenarios: {len(self.scenario_runner.get_available_scenarios())}")
@@ -67,6 +73,41 @@ class BenchmarkCollector:
         print(f"[PROFILE] Using built-in default profile")
         return BENCHMARK_UTILS["default_profile"]
 
+    def record_metric(self, metric: Dict[str, Any]):
+        """Enregistre une metrique (et l'ecrit directement si un flux CSV est ouvert)"""
+        if self._csv_sink is not None:
+            writer, fieldnames = self._csv_sink
+            writer.writerow([metric.get(name, "") for name in fieldnames])
+        else:
+            self._metrics.append(metric)
+
+    def get_metrics(self) -> List[Dict[str, Any]]:
+        """Retourne une copie des metriques enregistrees"""
+        return list(self._metrics)
+
+    def iter_metrics(self) -> Iterator[Dict[str, Any]]:
+        """Parcourt les metriques enregistrees sans les copier"""
+        yield from self._metrics
+
+    @contextmanager
+    def stream_to_csv(self, path, fieldnames: List[str]):
+        """
+        Ecrit chaque metrique enregistree directement dans un CSV
+        
+        Pendant le bloc `with`, record_metric ecrit une ligne par appel au lieu
+        d'accumuler en memoire : pas de copie ni de seconde passe a l'export.
+        """
+        fieldnames = tuple(fieldnames)
+        with open(path, "w", newline="", encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            previous_sink = self._csv_sink
+            self._csv_sink = (writer, fieldnames)
+            try:
+                yield self
+            finally:
+                self._csv_sink = previous_sink
+
     def _write_csv(self, filename: str, headers: List[str], rows: List[List], scenario: str = None):
         """Sauvegarde les donnees en CSV avec nommage par scenario"""
         
@@ -342,8 +383,7 @@ class BenchmarkCollector:
         self._write_csv(scenario_csv, headers, [row])
         
         json_path = self.csv_dir / f"scenario_{scenario_name}_details.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        json_path.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding='utf-8')
         
         print(f"Scenario details saved: {json_path}")
 
@@ -420,8 +460,7 @@ class BenchmarkCollector:
         report_name = f"benchmark_summary_{scenario}.json" if scenario else "benchmark_summary.json"
         summary_path = self.csv_dir / report_name
         
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        summary_path.write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding='utf-8')
         
         print(f"Summary report saved: {summary_path}")
         return summary
@@ -132,8 +132,7 @@ def save_dtc_config(config_data, filename):
     manager = DataManager()
     output_path = manager.custom_data_dir / filename
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(config_data, f, indent=2, ensure_ascii=False)
+    output_path.write_text(json.dumps(config_data, indent=2, ensure_ascii=False), encoding='utf-8')
     
     return str(output_path)
 
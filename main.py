@@ -267,9 +267,8 @@ def run_all_commands(args, perf_manager):
     
     return all(results.values())
 
-def main():
-    print_banner()
-    
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser"""
     parser = argparse.ArgumentParser(description="BBS-DTC Demo & Benchmark Suite")
     parser.add_argument("command", 
                        choices=["demo", "travel", "credential", "privacy", 
@@ -287,8 +286,14 @@ def main():
     parser.add_argument("--custom-user", "-u", 
                        type=str, 
                        help=f"Use custom JSON file instead of {DEFAULT_USER}")
+    return parser
+
+
+def main(argv=None) -> int:
+    """CLI entry point; returns the process exit code"""
+    print_banner()
     
-    args = parser.parse_args()
+    args = build_parser().parse_args(argv)
 
     # Setup performance optimizations
     perf_manager = setup_optimizations(args)
@@ -315,19 +320,20 @@ def main():
         
         if success:
             print("\nExecution completed successfully")
+            return 0
         else:
             print("\nExecution completed with errors")
-            sys.exit(1)
+            return 1
             
     except KeyboardInterrupt:
         print("\nExecution interrupted by user")
-        sys.exit(1)
+        return 1
     except Exception as e:
         print(f"\nUnexpected error: {e}")
         if args.verbose:
             import traceback
             traceback.print_exc()
-        sys.exit(1)
+        return 1
     finally:
         # Cleanup optimizations
         if perf_manager:
@@ -337,4 +343,4 @@ def main():
                 print(final_report)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file